@@ -115,6 +115,7 @@ async def _run(args: argparse.Namespace) -> None:
         dispatch_timeout_seconds=max(300.0, effective_timeout / 2),
         verbose=args.verbose,
         qa_via_clink=settings.qa_via_clink,
+        max_concurrent_subprocesses=settings.max_concurrent_agents,
     )
     veo3_adapter = _build_veo3_adapter(settings)
 
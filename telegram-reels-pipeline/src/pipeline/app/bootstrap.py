@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-from pipeline.app.settings import PipelineSettings
+from pipeline.app.settings import PipelineSettings, get_settings
 from pipeline.application.crash_recovery import CrashRecoveryHandler
 from pipeline.application.delivery_handler import DeliveryHandler
 from pipeline.application.event_bus import EventBus
@@ -24,21 +26,23 @@ from pipeline.application.workspace_manager import WorkspaceManager
 from pipeline.domain.errors import ConfigurationError
 from pipeline.infrastructure.adapters.claude_cli_backend import CliBackend
 from pipeline.infrastructure.adapters.file_state_store import FileStateStore
-from pipeline.infrastructure.adapters.knowledge_base_adapter import YamlKnowledgeBase
-from pipeline.infrastructure.adapters.proc_resource_monitor import ProcResourceMonitor
-from pipeline.infrastructure.adapters.systemd_watchdog import WatchdogHeartbeat
-from pipeline.infrastructure.listeners.event_journal_writer import EventJournalWriter
-from pipeline.infrastructure.telegram_bot.bot import TelegramBotAdapter
-from pipeline.infrastructure.telegram_bot.polling import TelegramPoller
+
+if TYPE_CHECKING:
+    # Optional or heavy adapters are imported inside create_orchestrator so that
+    # importing this module (e.g. to validate settings) does not load them.
+    from pipeline.infrastructure.adapters.systemd_watchdog import WatchdogHeartbeat
+    from pipeline.infrastructure.telegram_bot.bot import TelegramBotAdapter
+    from pipeline.infrastructure.telegram_bot.polling import TelegramPoller
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Orchestrator:
     """Container for all wired pipeline components.
 
-    Not a frozen dataclass — components are mutable singletons.
+    Not a frozen dataclass — components are mutable singletons. Slotted, so
+    the main loop's component lookups skip the instance ``__dict__``.
     """
 
     settings: PipelineSettings
@@ -49,31 +53,36 @@ class Orchestrator:
     cli_backend: CliBackend
     recovery_chain: RecoveryChain
     reflection_loop: ReflectionLoop
-    stage_runner: StageRunner | None = field(default=None)
-    pipeline_runner: PipelineRunner | None = field(default=None)
-    delivery_handler: DeliveryHandler | None = field(default=None)
-    revision_router: RevisionRouter | None = field(default=None)
-    revision_handler: RevisionHandler | None = field(default=None)
-    layout_escalation: LayoutEscalationHandler | None = field(default=None)
-    state_machine: PipelineStateMachine | None = field(default=None)
-    crash_recovery: CrashRecoveryHandler | None = field(default=None)
-    resource_throttler: ResourceThrottler | None = field(default=None)
-    run_cleaner: RunCleaner | None = field(default=None)
-    watchdog: WatchdogHeartbeat | None = field(default=None)
-    telegram_bot: TelegramBotAdapter | None = field(default=None)
-    telegram_poller: TelegramPoller | None = field(default=None)
+    stage_runner: StageRunner | None = None
+    pipeline_runner: PipelineRunner | None = None
+    delivery_handler: DeliveryHandler | None = None
+    revision_router: RevisionRouter | None = None
+    revision_handler: RevisionHandler | None = None
+    layout_escalation: LayoutEscalationHandler | None = None
+    state_machine: PipelineStateMachine | None = None
+    crash_recovery: CrashRecoveryHandler | None = None
+    resource_throttler: ResourceThrottler | None = None
+    run_cleaner: RunCleaner | None = None
+    watchdog: WatchdogHeartbeat | None = None
+    telegram_bot: TelegramBotAdapter | None = None
+    telegram_poller: TelegramPoller | None = None
+    new_item_event: asyncio.Event = field(default_factory=asyncio.Event)
 
 
 def create_orchestrator(settings: PipelineSettings | None = None) -> Orchestrator:
     """Wire all adapters and return an Orchestrator ready to run.
 
-    If no settings are provided, loads from environment/.env.
+    If no settings are provided, uses the cached ones loaded from environment/.env.
     """
     if settings is None:
-        settings = PipelineSettings()
+        settings = get_settings()
 
     _validate_settings(settings)
 
+    from pipeline.infrastructure.adapters.proc_resource_monitor import ProcResourceMonitor
+    from pipeline.infrastructure.adapters.systemd_watchdog import WatchdogHeartbeat
+    from pipeline.infrastructure.listeners.event_journal_writer import EventJournalWriter
+
     # Infrastructure adapters
     state_store = FileStateStore(base_dir=settings.workspace_dir / "runs")
     cli_backend = CliBackend(
@@ -81,6 +90,7 @@ def create_orchestrator(settings: PipelineSettings | None = None) -> Orchestrato
         timeout_seconds=settings.agent_timeout_seconds,
         dispatch_timeout_seconds=max(300.0, settings.agent_timeout_seconds / 2),
         qa_via_clink=settings.qa_via_clink,
+        max_concurrent_subprocesses=settings.max_concurrent_agents,
     )
 
     # Application components
@@ -98,11 +108,16 @@ def create_orchestrator(settings: PipelineSettings | None = None) -> Orchestrato
     journal_writer = EventJournalWriter(log_path=settings.workspace_dir / "events.log")
     event_bus.subscribe(journal_writer)
 
+    # Set whenever a new item is enqueued so the idle main loop wakes up
+    new_item_event = asyncio.Event()
+
     # Telegram adapter (optional — requires token and chat_id)
     telegram_bot: TelegramBotAdapter | None = None
     telegram_poller: TelegramPoller | None = None
     if settings.telegram_token and settings.telegram_chat_id:
         from pipeline.infrastructure.listeners.telegram_notifier import TelegramNotifier
+        from pipeline.infrastructure.telegram_bot.bot import TelegramBotAdapter
+        from pipeline.infrastructure.telegram_bot.polling import TelegramPoller
 
         telegram_bot = TelegramBotAdapter(
             token=settings.telegram_token,
@@ -112,6 +127,7 @@ def create_orchestrator(settings: PipelineSettings | None = None) -> Orchestrato
             bot=telegram_bot,
             queue=queue_consumer,
             authorized_chat_id=settings.telegram_chat_id,
+            new_item_event=new_item_event,
         )
         # Register Telegram notifier as event listener
         notifier = TelegramNotifier(messaging=telegram_bot)
@@ -127,7 +143,6 @@ def create_orchestrator(settings: PipelineSettings | None = None) -> Orchestrato
         event_bus=event_bus,
     )
     delivery_handler = DeliveryHandler(messaging=telegram_bot) if telegram_bot else None
-    knowledge_base = YamlKnowledgeBase(path=settings.workspace_dir / "crop-strategies.yaml")
     pipeline_runner = PipelineRunner(
         stage_runner=stage_runner,
         state_store=state_store,
@@ -143,6 +158,9 @@ def create_orchestrator(settings: PipelineSettings | None = None) -> Orchestrato
     revision_handler = RevisionHandler()
     layout_escalation: LayoutEscalationHandler | None = None
     if telegram_bot:
+        from pipeline.infrastructure.adapters.knowledge_base_adapter import YamlKnowledgeBase
+
+        knowledge_base = YamlKnowledgeBase(path=settings.workspace_dir / "crop-strategies.yaml")
         layout_escalation = LayoutEscalationHandler(messaging=telegram_bot, knowledge_base=knowledge_base)
     state_machine = PipelineStateMachine()
 
@@ -182,6 +200,7 @@ def create_orchestrator(settings: PipelineSettings | None = None) -> Orchestrato
         watchdog=watchdog,
         telegram_bot=telegram_bot,
         telegram_poller=telegram_poller,
+        new_item_event=new_item_event,
     )
 
 
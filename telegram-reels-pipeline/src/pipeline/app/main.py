@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import sys
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 
 from pipeline.app.bootstrap import Orchestrator, create_orchestrator
@@ -20,6 +22,68 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Idle wait backs off from the base to the cap while the queue stays empty.
+# New-item events still wake the loop immediately; the timeout only bounds how
+# long items enqueued behind the poller's back (e.g. by the CLI) can sit.
+_IDLE_WAIT_BASE_SECONDS: float = 2.0
+_IDLE_WAIT_MAX_SECONDS: float = 60.0
+_IDLE_BACKOFF_FACTOR: float = 1.5
+# Pause between Telegram polls in the background poll loop
+_TELEGRAM_POLL_INTERVAL_SECONDS: float = 1.0
+
+
+def _idle_wait_seconds(idle_ticks: int) -> float:
+    """Return the idle wait after ``idle_ticks`` consecutive empty polls."""
+    # Clamp the exponent so long idle stretches cannot overflow the float
+    return min(_IDLE_WAIT_MAX_SECONDS, _IDLE_WAIT_BASE_SECONDS * _IDLE_BACKOFF_FACTOR ** min(idle_ticks, 32))
+
+
+async def _wait_for_new_item(orchestrator: Orchestrator, timeout: float) -> bool:
+    """Block until a new queue item is signalled or ``timeout`` seconds elapse.
+
+    Returns True if the wait ended because a new item was signalled.
+    """
+    signalled = False
+    with contextlib.suppress(TimeoutError):
+        signalled = await asyncio.wait_for(orchestrator.new_item_event.wait(), timeout=timeout)
+    orchestrator.new_item_event.clear()
+    return signalled
+
+
+async def _telegram_poll_loop(orchestrator: Orchestrator) -> None:
+    """Poll Telegram forever so queue claiming never waits on network I/O."""
+    if orchestrator.telegram_poller is None:
+        return
+
+    while True:
+        try:
+            await orchestrator.telegram_poller.poll_once()
+        except Exception:
+            logger.exception("Telegram poll failed")
+        await asyncio.sleep(_TELEGRAM_POLL_INTERVAL_SECONDS)
+
+
+def _select_process_step(orchestrator: Orchestrator) -> Callable[[QueueItem, Path], Awaitable[None]]:
+    """Return the per-item step for this orchestrator's fixed configuration.
+
+    Whether a resource throttler is wired never changes after bootstrap, so
+    the choice is made once here instead of on every loop iteration.
+    """
+    throttler = orchestrator.resource_throttler
+    if throttler is None:
+
+        async def _process(item: QueueItem, processing_path: Path) -> None:
+            await _process_item(orchestrator, item, processing_path)
+
+        return _process
+
+    async def _process_throttled(item: QueueItem, processing_path: Path) -> None:
+        # Check resources before heavy processing
+        await throttler.wait_for_resources()
+        await _process_item(orchestrator, item, processing_path)
+
+    return _process_throttled
+
 
 async def _resume_interrupted_runs(orchestrator: Orchestrator) -> None:
     """Resume any interrupted runs discovered by crash recovery."""
@@ -27,14 +91,19 @@ async def _resume_interrupted_runs(orchestrator: Orchestrator) -> None:
         return
 
     plans = await orchestrator.crash_recovery.scan_and_recover()
+    resumable = []
     for plan in plans:
-        workspace_path = plan.run_state.workspace_path
-        if not workspace_path:
+        if not plan.run_state.workspace_path:
             logger.warning("Run %s has no workspace_path — skipping resume", plan.run_state.run_id)
             continue
+        resumable.append(plan)
 
-        workspace = Path(workspace_path)
-        if not workspace.is_dir():
+    # Stat every workspace off the event loop in one batch
+    workspaces = [Path(plan.run_state.workspace_path) for plan in resumable]
+    exists = await asyncio.gather(*(asyncio.to_thread(workspace.is_dir) for workspace in workspaces))
+
+    for plan, workspace, is_dir in zip(resumable, workspaces, exists, strict=True):
+        if not is_dir:
             logger.warning("Workspace %s no longer exists — skipping resume of %s", workspace, plan.run_state.run_id)
             continue
 
@@ -64,25 +133,32 @@ async def run() -> None:
 
     logger.info("Pipeline service started — polling queue for work")
 
+    # Poll Telegram for new messages in the background (if configured)
+    telegram_task: asyncio.Task[None] | None = None
+    if orchestrator.telegram_poller is not None:
+        telegram_task = asyncio.create_task(_telegram_poll_loop(orchestrator))
+
+    claim_next = orchestrator.queue_consumer.claim_next
+    process = _select_process_step(orchestrator)
+    idle_ticks = 0
     try:
         while True:
-            # Poll Telegram for new messages (if configured)
-            if orchestrator.telegram_poller is not None:
-                await orchestrator.telegram_poller.poll_once()
-
-            claimed = orchestrator.queue_consumer.claim_next()
+            claimed = claim_next()
             if claimed is not None:
+                idle_ticks = 0
                 item, processing_path = claimed
                 logger.info("Processing queue item: %s", item.url)
-
-                # Check resources before heavy processing
-                if orchestrator.resource_throttler is not None:
-                    await orchestrator.resource_throttler.wait_for_resources()
-
-                await _process_item(orchestrator, item, processing_path)
+                await process(item, processing_path)
+            elif await _wait_for_new_item(orchestrator, _idle_wait_seconds(idle_ticks)):
+                idle_ticks = 0
             else:
-                await asyncio.sleep(5.0)
+                idle_ticks += 1
     finally:
+        if telegram_task is not None:
+            telegram_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await telegram_task
+
         # Stop watchdog heartbeat
         if orchestrator.watchdog is not None:
             await orchestrator.watchdog.stop()
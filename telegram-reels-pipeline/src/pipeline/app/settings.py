@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from typing import Literal
 
@@ -28,6 +29,9 @@ class PipelineSettings(BaseSettings):
 
     # Agent execution
     agent_timeout_seconds: float = Field(default=300.0, description="Timeout for agent subprocess execution")
+    max_concurrent_agents: int = Field(
+        default=4, ge=1, description="Maximum Claude CLI subprocesses (agents + QA dispatch) running at once"
+    )
 
     # QA
     min_qa_score: int = Field(default=40, description="Minimum QA score before escalation")
@@ -59,3 +63,14 @@ class PipelineSettings(BaseSettings):
     veo3_crop_bottom_px: int = Field(default=16, ge=0, description="Pixels to crop from bottom for watermark removal")
 
     model_config = {"env_prefix": "", "env_file": ".env", "env_file_encoding": "utf-8", "extra": "ignore"}
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> PipelineSettings:
+    """Return the process-wide settings, reading environment and .env only once."""
+    return PipelineSettings()
+
+
+def reset_settings() -> None:
+    """Drop the cached settings so the next get_settings() reloads them (for tests)."""
+    get_settings.cache_clear()
@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import bisect
+import functools
 import json
 import logging
+import os
+import sys
+from collections.abc import Iterable, Sequence
 from pathlib import Path
+from types import MappingProxyType
 
 from pipeline.domain.models import BrollPlacement
 
@@ -13,6 +19,71 @@ logger = logging.getLogger(__name__)
 # Minimum Jaccard similarity for a broll anchor match to be accepted.
 _MIN_MATCH_CONFIDENCE: float = 0.3
 
+# Assumed Veo3 clip length when the job metadata has no usable ``duration_s``.
+_DEFAULT_CLIP_DURATION_S: float = 6.0
+
+# Segment count at which broll matching switches to an inverted token index.
+_TOKEN_INDEX_MIN_SEGMENTS: int = 16
+
+
+@functools.lru_cache(maxsize=32)
+def _artifact_paths(workspace: Path) -> tuple[Path, Path, Path]:
+    """Return the ``(jobs, assets, plan)`` artifact paths BrollPlacer reads from *workspace*.
+
+    A change to any of them invalidates the cached placement inputs.
+    """
+    return (
+        workspace / "veo3" / "jobs.json",
+        workspace / "publishing-assets.json",
+        workspace / "encoding-plan.json",
+    )
+
+
+def _stamp(path: Path) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` for *path*, or ``None`` if it cannot be stat-ed."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+# A completed clip as ``(variant, video_path, prompt, duration_s)``.
+_ClipFields = tuple[str, str, str, float]
+# Placement inputs as ``(clips, anchors_by_variant, sorted_boundaries)``.
+_BrollInputs = tuple[tuple[_ClipFields, ...], MappingProxyType[str, str], tuple[float, ...]]
+
+
+@functools.lru_cache(maxsize=16)
+def _read_broll_inputs_cached(workspace_str: str, stamps: tuple[tuple[int, int] | None, ...]) -> _BrollInputs:
+    """Derive the placement inputs for a workspace; ``stamps`` only key the cache.
+
+    The artifacts are parsed and clip fields coerced here, once per artifact
+    change, so the placement loop works on plain tuples.  Only the derived
+    inputs are cached, never the parsed documents.
+    """
+    workspace = Path(workspace_str)
+    clips = tuple(
+        (
+            str(clip.get("variant", "")),
+            str(clip.get("video_path", "")),
+            str(clip.get("prompt", "")),
+            BrollPlacer._estimate_clip_duration(clip),
+        )
+        for clip in BrollPlacer._get_completed_clips(workspace)
+    )
+    return (
+        clips,
+        MappingProxyType(BrollPlacer._load_narrative_anchors(workspace)),
+        tuple(BrollPlacer._load_segment_boundaries(workspace)),
+    )
+
+
+def _load_broll_inputs(workspace: Path) -> _BrollInputs:
+    """Return the placement inputs of *workspace*, rebuilt only when one of its artifacts changes."""
+    stamps = tuple(_stamp(path) for path in _artifact_paths(workspace))
+    return _read_broll_inputs_cached(str(workspace), stamps)
+
 
 class BrollPlacer:
     """Resolve B-roll clip placements on the final reel timeline.
@@ -43,21 +114,19 @@ class BrollPlacer:
         Returns:
             Tuple of :class:`BrollPlacement` sorted by ``insertion_point_s``.
         """
-        completed = self._get_completed_clips(workspace)
-        if not completed:
+        # No veo3/ directory means the Veo3 stage never ran — skip the artifact stats
+        if not _artifact_paths(workspace)[0].parent.is_dir():
             return ()
 
-        anchors = self._load_narrative_anchors(workspace)
-        boundaries = self._load_segment_boundaries(workspace)
+        clips, anchors, boundaries = _load_broll_inputs(workspace)
+        if not clips:
+            return ()
 
+        get_anchor = anchors.get
+        matcher = _SegmentMatcher(segments)
         placements: list[BrollPlacement] = []
-        for clip in completed:
-            variant = str(clip.get("variant", ""))
-            video_path = str(clip.get("video_path", ""))
-            prompt_text = str(clip.get("prompt", ""))
-
-            anchor_text = anchors.get(variant, "")
-            duration = self._estimate_clip_duration(clip)
+        for variant, video_path, prompt_text, duration in clips:
+            anchor_text = get_anchor(variant, "")
 
             if variant == "intro":
                 placements.append(
@@ -101,7 +170,7 @@ class BrollPlacer:
                 if not segments:
                     logger.warning("No segments available for broll anchor matching — skipping clip %s", video_path)
                     continue
-                seg_idx, confidence = self._match_anchor(anchor_text or prompt_text, segments)
+                seg_idx, confidence = matcher.match(anchor_text or prompt_text)
                 if confidence < _MIN_MATCH_CONFIDENCE:
                     logger.warning(
                         "Broll anchor match too weak (%.2f < %.2f) for clip %s — skipping",
@@ -139,28 +208,23 @@ class BrollPlacer:
     @staticmethod
     def _get_completed_clips(workspace: Path) -> list[dict[str, object]]:
         """Read veo3/jobs.json and return completed clips with a video_path."""
-        jobs_path = workspace / "veo3" / "jobs.json"
+        jobs_path, _, _ = _artifact_paths(workspace)
         try:
-            raw = jobs_path.read_text()
-            data = json.loads(raw)
-        except (FileNotFoundError, json.JSONDecodeError, OSError) as exc:
+            data = json.loads(jobs_path.read_bytes())
+        except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
             logger.debug("Cannot read veo3/jobs.json: %s", exc)
             return []
-
-        result: list[dict[str, object]] = []
-        for entry in data.get("jobs", []):
-            if entry.get("status") == "completed" and entry.get("video_path"):
-                result.append(entry)
-        return result
+        return [
+            entry for entry in data.get("jobs", []) if entry.get("status") == "completed" and entry.get("video_path")
+        ]
 
     @staticmethod
     def _load_narrative_anchors(workspace: Path) -> dict[str, str]:
         """Load narrative_anchor per variant from publishing-assets.json."""
-        assets_path = workspace / "publishing-assets.json"
+        _, assets_path, _ = _artifact_paths(workspace)
         try:
-            raw = assets_path.read_text()
-            data = json.loads(raw)
-        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            data = json.loads(assets_path.read_bytes())
+        except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError, OSError):
             return {}
 
         anchors: dict[str, str] = {}
@@ -178,11 +242,10 @@ class BrollPlacer:
         Returns a list of boundary timestamps (end times of segments),
         useful for placing transition-variant B-roll at moment junctions.
         """
-        plan_path = workspace / "encoding-plan.json"
+        _, _, plan_path = _artifact_paths(workspace)
         try:
-            raw = plan_path.read_text()
-            data = json.loads(raw)
-        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            data = json.loads(plan_path.read_bytes())
+        except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError, OSError):
             return []
 
         boundaries: list[float] = []
@@ -195,22 +258,36 @@ class BrollPlacer:
 
     @staticmethod
     def _resolve_transition_point(
-        boundaries: list[float],
+        boundaries: Sequence[float],
         total_duration_s: float,
         clip_duration: float,
     ) -> float:
         """Pick the best segment boundary for a transition-variant clip.
 
         Picks the boundary closest to the middle of the reel to maximize
-        visual impact. Falls back to the reel midpoint if no boundaries exist.
+        visual impact (the earlier one on a tie). *boundaries* must be sorted
+        ascending. Falls back to the reel midpoint if no boundaries exist.
         """
         if not boundaries:
             return max(0.0, total_duration_s / 2.0 - clip_duration / 2.0)
 
         mid = total_duration_s / 2.0
-        best = min(boundaries, key=lambda b: abs(b - mid))
+        i = bisect.bisect_left(boundaries, mid)
+        if i == len(boundaries):
+            best = boundaries[-1]
+        elif i == 0 or boundaries[i] - mid < mid - boundaries[i - 1]:
+            best = boundaries[i]
+        else:
+            best = boundaries[i - 1]
         return max(0.0, best - clip_duration / 2.0)
 
+    @staticmethod
+    def _tokenize_segments(segments: list[dict[str, object]]) -> tuple[frozenset[str], ...]:
+        """Lower-case and split each segment's ``transcript_text`` into a set of interned words."""
+        return tuple(
+            frozenset(map(sys.intern, str(seg.get("transcript_text", "")).lower().split())) for seg in segments
+        )
+
     @staticmethod
     def _match_anchor(anchor: str, segments: list[dict[str, object]]) -> tuple[int, float]:
         """Match a narrative anchor to the best segment via Jaccard keyword similarity.
@@ -222,21 +299,56 @@ class BrollPlacer:
         Returns:
             ``(segment_index, confidence_score)`` — the best-matching segment.
         """
-        anchor_words = set(anchor.lower().split())
+        return BrollPlacer._match_anchor_tokens(anchor, BrollPlacer._tokenize_segments(segments))
+
+    @staticmethod
+    def _build_token_index(seg_tokens: tuple[frozenset[str], ...]) -> dict[str, tuple[int, ...]]:
+        """Map each word to the (ascending) indices of the segments containing it."""
+        index: dict[str, list[int]] = {}
+        for i, words in enumerate(seg_tokens):
+            for word in words:
+                index.setdefault(word, []).append(i)
+        return {word: tuple(indices) for word, indices in index.items()}
+
+    @staticmethod
+    def _match_anchor_tokens(
+        anchor: str,
+        seg_tokens: tuple[frozenset[str], ...],
+        token_index: dict[str, tuple[int, ...]] | None = None,
+    ) -> tuple[int, float]:
+        """Match a narrative anchor against pre-tokenized segments.
+
+        Same scoring as :meth:`_match_anchor`, but the segment word sets are
+        built once per placement run instead of once per clip.  The union size
+        is derived from the set sizes rather than materialized.  When a
+        *token_index* is given, only segments sharing a word with the anchor
+        are scored — every other segment has a Jaccard score of zero.  Segments
+        whose size ratio (an upper bound on Jaccard) cannot beat the current
+        best are skipped before intersecting.
+        """
+        anchor_words = frozenset(map(sys.intern, anchor.lower().split()))
         if not anchor_words:
             return (0, 0.0)
 
+        counts: dict[int, int] | None = None
+        candidates: Iterable[int] = range(len(seg_tokens))
+        if token_index is not None:
+            counts = {}
+            for word in anchor_words:
+                for i in token_index.get(word, ()):
+                    counts[i] = counts.get(i, 0) + 1
+            candidates = sorted(counts)
+
+        anchor_size = len(anchor_words)
         best_idx = 0
         best_score = 0.0
 
-        for i, seg in enumerate(segments):
-            text = str(seg.get("transcript_text", ""))
-            seg_words = set(text.lower().split())
-            if not seg_words:
+        for i in candidates:
+            seg_size = len(seg_tokens[i])
+            if not seg_size or min(anchor_size, seg_size) / max(anchor_size, seg_size) <= best_score:
                 continue
-            intersection = anchor_words & seg_words
-            union = anchor_words | seg_words
-            jaccard = len(intersection) / len(union) if union else 0.0
+            inter = counts[i] if counts is not None else len(anchor_words & seg_tokens[i])
+            jaccard = inter / (anchor_size + seg_size - inter)
             if jaccard > best_score:
                 best_score = jaccard
                 best_idx = i
@@ -247,11 +359,34 @@ class BrollPlacer:
     def _estimate_clip_duration(clip: dict[str, object]) -> float:
         """Estimate clip duration from job metadata, defaulting to 6s."""
         raw = clip.get("duration_s")
-        if raw is not None:
+        if isinstance(raw, int | float) and not isinstance(raw, bool):
+            return float(raw) if raw > 0 else _DEFAULT_CLIP_DURATION_S
+        if isinstance(raw, str):
             try:
-                val = float(str(raw))
-                if val > 0:
-                    return val
-            except (ValueError, TypeError):
-                pass
-        return 6.0
+                val = float(raw)
+            except ValueError:
+                return _DEFAULT_CLIP_DURATION_S
+            return val if val > 0 else _DEFAULT_CLIP_DURATION_S
+        return _DEFAULT_CLIP_DURATION_S
+
+
+class _SegmentMatcher:
+    """Score anchors against one segment list, tokenizing it at most once.
+
+    Tokenization is deferred to the first :meth:`match` call so runs without
+    broll clips never pay for it.  Large segment lists also get an inverted
+    token index (see :meth:`BrollPlacer._match_anchor_tokens`).
+    """
+
+    def __init__(self, segments: list[dict[str, object]]) -> None:
+        self._segments = segments
+        self._tokens: tuple[frozenset[str], ...] | None = None
+        self._index: dict[str, tuple[int, ...]] | None = None
+
+    def match(self, anchor: str) -> tuple[int, float]:
+        """Return ``(segment_index, confidence_score)`` for *anchor*."""
+        if self._tokens is None:
+            self._tokens = BrollPlacer._tokenize_segments(self._segments)
+            if len(self._tokens) >= _TOKEN_INDEX_MIN_SEGMENTS:
+                self._index = BrollPlacer._build_token_index(self._tokens)
+        return BrollPlacer._match_anchor_tokens(anchor, self._tokens, self._index)
@@ -0,0 +1,86 @@
+"""Atomic JSON artifact writes shared by CLI commands."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import tempfile
+from collections.abc import Sequence
+from pathlib import Path
+
+
+def atomic_write_json(path: Path, obj: object, *, durable: bool = True) -> None:
+    """Write *obj* to *path* as indented JSON without exposing partial writes.
+
+    The document is serialized in memory and written to a temp file in the
+    same directory with as few ``os.write`` calls as the kernel allows, then
+    fsynced and renamed over *path*.  The directory is fsynced after the
+    rename so the new entry itself survives a crash.  The temp file is removed
+    on failure.
+
+    Pass ``durable=False`` for best-effort artifacts: both fsyncs are skipped,
+    so a power loss may lose the update, but readers still never observe a
+    partially written file.
+
+    Raises:
+        OSError: If the temp file cannot be created, written, or renamed.
+    """
+    data = memoryview(json.dumps(obj, indent=2).encode("utf-8"))
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+    try:
+        try:
+            while data:
+                data = data[os.write(fd, data) :]
+            if durable:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, str(path))
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+    if durable:
+        _fsync_directory(path.parent)
+
+
+def append_json_lines(path: Path, objs: Sequence[object], *, durable: bool = True) -> None:
+    """Append each of *objs* to *path* as one JSON line, creating the file if needed.
+
+    All lines go out in a single ``O_APPEND`` write, so concurrent appenders
+    never interleave within it and earlier lines are never rewritten.  When
+    *durable*, the file is fsynced, and so is its directory if this call
+    created the file.
+
+    Raises:
+        OSError: If the file cannot be opened or written.
+    """
+    data = memoryview("".join(json.dumps(obj) + "\n" for obj in objs).encode("utf-8"))
+    flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+    try:
+        fd = os.open(path, flags | os.O_EXCL, 0o644)
+        created = True
+    except FileExistsError:
+        fd = os.open(path, flags, 0o644)
+        created = False
+    try:
+        while data:
+            data = data[os.write(fd, data) :]
+        if durable:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+    if durable and created:
+        _fsync_directory(path.parent)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush *directory*'s entries to disk; a no-op where directories cannot be opened."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
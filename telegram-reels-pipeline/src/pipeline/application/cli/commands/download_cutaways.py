@@ -2,21 +2,28 @@
 
 from __future__ import annotations
 
-import contextlib
-import json
+import asyncio
 import logging
-import os
-import tempfile
+import shutil
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from pipeline.application.cli.atomic_io import atomic_write_json
+from pipeline.application.cli.protocols import CommandResult
+
 if TYPE_CHECKING:
     from pipeline.application.cli.context import PipelineContext
-    from pipeline.application.cli.protocols import ClipDurationProber, Command, CommandResult, OutputPort
+    from pipeline.application.cli.protocols import ClipDurationProber, Command, OutputPort
     from pipeline.domain.ports import ExternalClipDownloaderPort
 
 logger = logging.getLogger(__name__)
 
+# Cutaway downloads allowed in flight at once
+DEFAULT_MAX_CONCURRENT_DOWNLOADS: int = 8
+# Tries per cutaway URL; waits between tries double from the base backoff
+DEFAULT_DOWNLOAD_ATTEMPTS: int = 3
+DEFAULT_RETRY_BACKOFF_S: float = 1.0
+
 
 def parse_cutaway_spec(spec: str) -> tuple[str, float]:
     """Parse a ``URL@TIMESTAMP`` cutaway spec by splitting on the **last** ``@``.
@@ -31,12 +38,11 @@ def parse_cutaway_spec(spec: str) -> tuple[str, float]:
         ValueError: If no ``@`` found, ``@`` is first character, or timestamp is
             not a valid float.
     """
-    idx = spec.rfind("@")
-    if idx <= 0:
+    url, sep, timestamp_str = spec.rpartition("@")
+    if not sep or not url:
         raise ValueError(f"Invalid cutaway spec '{spec}': expected URL@TIMESTAMP")
-    url = spec[:idx]
     try:
-        timestamp = float(spec[idx + 1 :])
+        timestamp = float(timestamp_str)
     except ValueError as exc:
         raise ValueError(f"Invalid cutaway timestamp in '{spec}': expected a number after '@'") from exc
     if timestamp < 0:
@@ -44,20 +50,79 @@ def parse_cutaway_spec(spec: str) -> tuple[str, float]:
     return url, timestamp
 
 
+async def _download_with_retry(
+    clip_downloader: ExternalClipDownloaderPort,
+    url: str,
+    workspace: Path,
+    slots: asyncio.Semaphore,
+    attempts: int,
+    backoff_s: float,
+) -> Path | None:
+    """Download *url*, retrying failed attempts with exponential backoff.
+
+    The downloader reports failure by returning None or raising; both are
+    retried.  A download slot is held only while an attempt is running, not
+    during the backoff sleep.  Returns None once all attempts have failed.
+    """
+    for attempt in range(attempts):
+        if attempt:
+            await asyncio.sleep(backoff_s * 2 ** (attempt - 1))
+        try:
+            async with slots:
+                downloaded = await clip_downloader.download(url, workspace)
+        except Exception as exc:
+            logger.warning("Cutaway download attempt %d/%d raised for %s: %s", attempt + 1, attempts, url, exc)
+            continue
+        if downloaded is not None:
+            return downloaded
+        logger.warning("Cutaway download attempt %d/%d failed for %s", attempt + 1, attempts, url)
+    return None
+
+
+def _move_clip(downloaded: Path, dest: Path) -> None:
+    """Move a downloaded clip to *dest*.
+
+    ``shutil.move`` renames when possible and otherwise copies in-kernel
+    (``sendfile``/``copy_file_range``) before removing the source.
+    """
+    shutil.move(downloaded, dest)
+
+
+def _place_clip(url: str, downloaded: Path, dest: Path, placed: dict[str, Path]) -> None:
+    """Move *url*'s download to *dest*, or copy it from where it was already placed.
+
+    *placed* maps each URL to the first cutaway path its clip was moved to.
+    """
+    if url in placed:
+        shutil.copy2(placed[url], dest)
+        return
+    _move_clip(downloaded, dest)
+    placed[url] = dest
+
+
 async def _download_cutaway_clips(
     cutaway_specs: list[str],
     workspace: Path,
     clip_downloader: ExternalClipDownloaderPort,
     duration_prober: ClipDurationProber,
     output: OutputPort = print,
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+    attempts: int = DEFAULT_DOWNLOAD_ATTEMPTS,
+    backoff_s: float = DEFAULT_RETRY_BACKOFF_S,
 ) -> list[dict[str, object]]:
-    """Download cutaway clips and write ``external-clips.json`` manifest."""
-    import shutil
+    """Download cutaway clips and write ``external-clips.json`` manifest.
 
+    Downloads run concurrently, at most *max_concurrent* at a time, each tried
+    up to *attempts* times (see :func:`_download_with_retry`), then all
+    downloaded clips are probed concurrently.  A URL repeated across specs is
+    downloaded once and copied for the later specs.  Renaming and the manifest
+    follow the original spec order.
+    """
     manifest: list[dict[str, object]] = []
     clips_dir = workspace / "external_clips"
     clips_dir.mkdir(parents=True, exist_ok=True)
 
+    parsed: list[tuple[int, str, float]] = []
     for idx, spec in enumerate(cutaway_specs):
         try:
             url, insertion_point = parse_cutaway_spec(spec)
@@ -65,24 +130,44 @@ async def _download_cutaway_clips(
             logger.warning("Skipping invalid cutaway spec: %s", exc)
             output(f"    [CUTAWAY] Skipping invalid spec: {exc}")
             continue
+        parsed.append((idx, url, insertion_point))
+
+    slots = asyncio.Semaphore(max_concurrent)
 
+    async def _fetch(idx: int, url: str) -> Path | None:
         output(f"    [CUTAWAY] Downloading clip {idx + 1}/{len(cutaway_specs)}: {url}")
-        downloaded = await clip_downloader.download(url, workspace)
+        return await _download_with_retry(clip_downloader, url, workspace, slots, attempts, backoff_s)
+
+    # The downloader names files after the URL hash, so each URL is fetched
+    # once and specs repeating it get a copy of the first placed clip.
+    first_idx: dict[str, int] = {}
+    for idx, url, _ in parsed:
+        first_idx.setdefault(url, idx)
+    results = await asyncio.gather(*(_fetch(idx, url) for url, idx in first_idx.items()), return_exceptions=True)
+    downloads = dict(zip(first_idx, results, strict=True))
+
+    ready: list[tuple[int, str, float, Path]] = []
+    placed: dict[str, Path] = {}
+    for idx, url, insertion_point in parsed:
+        downloaded = downloads[url]
+        if isinstance(downloaded, BaseException):
+            logger.warning("Cutaway download raised for %s: %s -- skipping", url, downloaded)
+            output(f"    [CUTAWAY] Download failed for {url} -- skipping")
+            continue
         if downloaded is None:
             logger.warning("Cutaway download failed for %s -- skipping", url)
             output(f"    [CUTAWAY] Download failed for {url} -- skipping")
             continue
 
         dest = clips_dir / f"cutaway-{idx}.mp4"
-        try:
-            downloaded.rename(dest)
-        except OSError:
-            shutil.copy2(str(downloaded), str(dest))
-            with contextlib.suppress(OSError):
-                downloaded.unlink()
-
-        duration = await duration_prober.probe(dest)
-        if duration is None:
+        _place_clip(url, downloaded, dest, placed)
+        ready.append((idx, url, insertion_point, dest))
+
+    # Probe all clips together — ffprobe cost is dominated by process startup
+    durations = await asyncio.gather(*(duration_prober.probe(dest) for *_, dest in ready), return_exceptions=True)
+
+    for (idx, url, insertion_point, dest), duration in zip(ready, durations, strict=True):
+        if duration is None or isinstance(duration, BaseException):
             logger.warning("Could not probe duration for %s -- skipping", dest.name)
             output(f"    [CUTAWAY] Could not probe duration for {dest.name} -- skipping")
             continue
@@ -96,17 +181,7 @@ async def _download_cutaway_clips(
         manifest.append(entry)
         output(f"    [CUTAWAY] Ready: cutaway-{idx}.mp4 ({duration:.1f}s, insert at {insertion_point:.1f}s)")
 
-    # Write manifest (atomic write)
-    manifest_path = workspace / "external-clips.json"
-    fd, tmp_path_str = tempfile.mkstemp(dir=str(workspace), suffix=".tmp")
-    try:
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(manifest, f, indent=2)
-        os.replace(tmp_path_str, str(manifest_path))
-    except BaseException:
-        with contextlib.suppress(OSError):
-            os.unlink(tmp_path_str)
-        raise
+    atomic_write_json(workspace / "external-clips.json", manifest)
 
     logger.info("Wrote external-clips.json with %d entries", len(manifest))
     return manifest
@@ -123,10 +198,20 @@ class DownloadCutawaysCommand:
         clip_downloader: ExternalClipDownloaderPort,
         duration_prober: ClipDurationProber,
         output: OutputPort = print,
+        max_concurrent_downloads: int = DEFAULT_MAX_CONCURRENT_DOWNLOADS,
+        download_attempts: int = DEFAULT_DOWNLOAD_ATTEMPTS,
+        retry_backoff_s: float = DEFAULT_RETRY_BACKOFF_S,
     ) -> None:
+        if max_concurrent_downloads < 1:
+            raise ValueError("max_concurrent_downloads must be at least 1")
+        if download_attempts < 1:
+            raise ValueError("download_attempts must be at least 1")
         self._clip_downloader = clip_downloader
         self._duration_prober = duration_prober
         self._output = output
+        self._max_concurrent_downloads = max_concurrent_downloads
+        self._download_attempts = download_attempts
+        self._retry_backoff_s = retry_backoff_s
 
     @property
     def name(self) -> str:
@@ -134,7 +219,6 @@ class DownloadCutawaysCommand:
 
     async def execute(self, context: PipelineContext) -> CommandResult:
         """Download cutaway clips if any are specified in context state."""
-        from pipeline.application.cli.protocols import CommandResult
 
         cutaway_specs: list[str] | None = context.state.cutaway_specs
         if not cutaway_specs:
@@ -149,6 +233,9 @@ class DownloadCutawaysCommand:
             self._clip_downloader,
             self._duration_prober,
             output=self._output,
+            max_concurrent=self._max_concurrent_downloads,
+            attempts=self._download_attempts,
+            backoff_s=self._retry_backoff_s,
         )
         self._output(f"  Cutaway clips ready: {len(manifest)}/{len(cutaway_specs)} succeeded\n")
 
@@ -2,24 +2,27 @@
 
 from __future__ import annotations
 
-import contextlib
+import functools
 import json
 import logging
 import os
 import sys
-import tempfile
 import time
+from itertools import islice
 from pathlib import Path
 from types import MappingProxyType
 from typing import TYPE_CHECKING
 
+from pipeline.application.cli.atomic_io import atomic_write_json
+from pipeline.application.cli.protocols import BatchInputReader, CommandResult
+from pipeline.application.cli.stage_registry import stage_paths
 from pipeline.domain.enums import PipelineStage
 from pipeline.domain.models import AgentRequest, ReflectionResult
 from pipeline.domain.types import GateName
 
 if TYPE_CHECKING:
     from pipeline.application.cli.context import PipelineContext
-    from pipeline.application.cli.protocols import Command, CommandResult, InputReader
+    from pipeline.application.cli.protocols import Command, InputReader
     from pipeline.application.stage_runner import StageRunner
 
 logger = logging.getLogger(__name__)
@@ -29,8 +32,12 @@ MAX_QUESTIONS_PER_ROUND: int = 5
 MTIME_TOLERANCE_SECONDS: float = 2.0
 
 
+@functools.lru_cache(maxsize=1)
 def is_interactive() -> bool:
-    """Check if stdin is an interactive terminal (TTY)."""
+    """Check if stdin is an interactive terminal (TTY).
+
+    Cached: stdin's TTY status does not change over the process lifetime.
+    """
     return hasattr(sys.stdin, "isatty") and sys.stdin.isatty()
 
 
@@ -48,18 +55,23 @@ def find_router_output(
                    to avoid reading stale output from previous runs.
     """
     adjusted_mtime = min_mtime - MTIME_TOLERANCE_SECONDS if min_mtime else 0.0
-    for artifact in artifacts:
-        if artifact.name == "router-output.json":
-            try:
-                mtime = artifact.stat().st_mtime
-            except FileNotFoundError:
-                continue
-            if adjusted_mtime and mtime < adjusted_mtime:
-                continue
-            return artifact
     fallback = workspace / "router-output.json"
+    fallback_checked = False
+    for artifact in (a for a in artifacts if a.name == "router-output.json"):
+        # The agent usually writes straight into the workspace, so the fallback is
+        # often among the artifacts — remember that instead of stat-ing it twice.
+        fallback_checked = fallback_checked or artifact == fallback
+        try:
+            mtime = os.stat(artifact).st_mtime
+        except FileNotFoundError:
+            continue
+        if adjusted_mtime and mtime < adjusted_mtime:
+            continue
+        return artifact
+    if fallback_checked:
+        return None
     try:
-        mtime = fallback.stat().st_mtime
+        mtime = os.stat(fallback).st_mtime
     except FileNotFoundError:
         return None
     if adjusted_mtime and mtime < adjusted_mtime:
@@ -78,7 +90,9 @@ def parse_router_output(
     if output_path is None:
         return None
     try:
-        data = json.loads(output_path.read_text(encoding="utf-8"))
+        # Parse the raw bytes — json detects the encoding, so no intermediate str
+        # is decoded first.  Invalid UTF-8 still surfaces as UnicodeDecodeError.
+        data = json.loads(output_path.read_bytes())
         if isinstance(data, dict):
             return data
     except (json.JSONDecodeError, UnicodeDecodeError, OSError):
@@ -88,13 +102,8 @@ def parse_router_output(
 
 def validate_questions(raw: list[object]) -> list[str]:
     """Filter and cap elicitation questions. Only keeps non-empty strings."""
-    validated: list[str] = []
-    for item in raw:
-        if isinstance(item, str) and item.strip():
-            validated.append(item.strip())
-        if len(validated) >= MAX_QUESTIONS_PER_ROUND:
-            break
-    return validated
+    stripped = (text for item in raw if isinstance(item, str) and (text := item.strip()))
+    return list(islice(stripped, MAX_QUESTIONS_PER_ROUND))
 
 
 async def collect_elicitation_answers(
@@ -105,16 +114,19 @@ async def collect_elicitation_answers(
     """Prompt the user for answers to elicitation questions.
 
     Each question has a per-input timeout. Uses the injected ``InputReader``
-    protocol for testability.
+    protocol for testability; readers that also implement ``BatchInputReader``
+    receive all questions in a single ``read_many`` call with the combined timeout.
 
     Returns a dict mapping question text to user answer.
     """
     answers: dict[str, str] = {}
     print("\n    The router has questions before proceeding:")
     print(f"    (each question times out after {timeout}s)\n")
-    for i, question in enumerate(questions, 1):
-        print(f"    Q{i}: {question}")
-        answer = await input_reader.read("    > ", timeout)
+    if isinstance(input_reader, BatchInputReader):
+        replies = await input_reader.read_many(questions, timeout * len(questions))
+    else:
+        replies = await _read_answers_serially(questions, input_reader, timeout)
+    for question, answer in zip(questions, replies, strict=False):
         if answer is None:
             print("\n    (input cancelled or timed out — using defaults for remaining)")
             break
@@ -124,24 +136,32 @@ async def collect_elicitation_answers(
     return answers
 
 
+async def _read_answers_serially(
+    questions: list[str],
+    input_reader: InputReader,
+    timeout: int,
+) -> list[str | None]:
+    """Prompt for each question in turn, stopping after the first cancelled read."""
+    replies: list[str | None] = []
+    for i, question in enumerate(questions, 1):
+        print(f"    Q{i}: {question}")
+        answer = await input_reader.read("    > ", timeout)
+        replies.append(answer)
+        if answer is None:
+            break
+    return replies
+
+
 def save_elicitation_context(workspace: Path, context: dict[str, str]) -> None:
     """Save elicitation answers to workspace as JSON artifact.
 
     Uses atomic write (write-to-tmp + rename) to prevent corrupt partial writes.
-    Logs a warning on write failure instead of raising -- elicitation persistence
-    is best-effort and must not crash the pipeline.
+    Elicitation persistence is best-effort, so the write skips fsync and logs a
+    warning on failure instead of raising -- it must not crash the pipeline.
     """
     artifact_path = workspace / "elicitation-context.json"
     try:
-        fd, tmp_path = tempfile.mkstemp(dir=workspace, suffix=".tmp")
-        try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                json.dump(context, f, indent=2)
-            os.replace(tmp_path, artifact_path)
-        except BaseException:
-            with contextlib.suppress(OSError):
-                os.unlink(tmp_path)
-            raise
+        atomic_write_json(artifact_path, context, durable=False)
         logger.info("Saved elicitation context to %s", artifact_path.name)
     except OSError as exc:
         logger.warning("Failed to save elicitation context: %s", exc)
@@ -191,21 +211,20 @@ async def _run_router_with_elicitation(
     Always persists accumulated answers on exit (success, escalation, or max rounds).
     """
     accumulated_answers: dict[str, str] = {}
+    # Frozen router context, rebuilt only when new answers arrive — a retry with
+    # unchanged answers reuses the same proxy (and its serialized answers)
+    request_context = MappingProxyType(dict(elicitation))
     result: ReflectionResult | None = None
     new_artifacts = artifacts
 
     try:
         for round_num in range(1, MAX_ELICITATION_ROUNDS + 2):  # +2: initial + max rounds
-            context = dict(elicitation)
-            if accumulated_answers:
-                context["elicitation_answers"] = json.dumps(accumulated_answers)
-
             request = AgentRequest(
                 stage=PipelineStage.ROUTER,
                 step_file=step_file,
                 agent_definition=agent_def,
                 prior_artifacts=new_artifacts,
-                elicitation_context=MappingProxyType(context),
+                elicitation_context=request_context,
             )
 
             round_epoch = time.time()
@@ -236,6 +255,7 @@ async def _run_router_with_elicitation(
                 return result, new_artifacts
 
             accumulated_answers.update(answers)
+            request_context = MappingProxyType({**elicitation, "elicitation_answers": json.dumps(accumulated_answers)})
             print("    Re-running router with user answers...")
 
     finally:
@@ -278,15 +298,13 @@ class RunElicitationCommand:
         Returns:
             CommandResult with success/failure and result data.
         """
-        from pipeline.application.cli.protocols import CommandResult
 
         workspace = context.require_workspace()
         stage_spec = context.state.stage_spec
         if stage_spec is None:
             return CommandResult(success=False, message="No stage_spec in context state")
         _stage, step_file_name, agent_def_name, gate_name = stage_spec
-        step_file = context.project_root / "workflows" / "stages" / step_file_name
-        agent_def = context.project_root / "agents" / agent_def_name / "agent.md"
+        step_file, agent_def = stage_paths(context.project_root, step_file_name, agent_def_name)
         gate = GateName(gate_name)
         gate_criteria: str = context.state.gate_criteria
         elicitation: dict[str, str] = dict(context.state.elicitation)
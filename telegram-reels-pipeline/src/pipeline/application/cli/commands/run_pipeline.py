@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import heapq
 import logging
+import os
 import time
-from typing import TYPE_CHECKING
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 from pipeline.application.cli.protocols import CommandResult
 from pipeline.application.cli.stage_registry import ALL_STAGES, stage_name
+from pipeline.domain.enums import PipelineStage
 
 if TYPE_CHECKING:
     from pipeline.application.cli.context import PipelineContext
@@ -16,12 +23,29 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_BANNER: str = "=" * 60
+
+# First stage that reads external-clips.json (via the pre-Assembly manifest hook).
+# The cutaway download overlaps every stage before it.
+CUTAWAY_CONSUMER_STAGE: PipelineStage = PipelineStage.ASSEMBLY
+
+# Cap on files listed in the completion footer (first N by path).
+MAX_FOOTER_ENTRIES: int = 200
+
+# How long unfinished background hooks may keep running once the stages are done
+DEFAULT_HOOK_GRACE_SECONDS: float = 30.0
+
 
 class RunPipelineCommand:
     """Compose sub-commands into the full pipeline execution sequence.
 
     Orchestrates: ValidateArgs → SetupWorkspace → DownloadCutaways →
-    (RunElicitation | RunStage) × N via the PipelineInvoker.
+    (RunElicitation | RunStage) × N via the PipelineInvoker.  The cutaway
+    download runs in the background and is joined before
+    ``CUTAWAY_CONSUMER_STAGE`` (or before the footer if that stage is not run);
+    a failed download still fails the pipeline.  Background stage hooks get
+    up to ``hook_grace_seconds`` to finish after the last stage before they are
+    cancelled.
     """
 
     if TYPE_CHECKING:
@@ -38,7 +62,10 @@ class RunPipelineCommand:
         elicitation_cmd: Command,
         stage_cmd: Command,
         output: OutputPort = print,
+        hook_grace_seconds: float = DEFAULT_HOOK_GRACE_SECONDS,
     ) -> None:
+        if hook_grace_seconds < 0:
+            raise ValueError("hook_grace_seconds must be non-negative")
         self._invoker = invoker
         self._validate_cmd = validate_cmd
         self._setup_cmd = setup_cmd
@@ -46,6 +73,7 @@ class RunPipelineCommand:
         self._elicitation_cmd = elicitation_cmd
         self._stage_cmd = stage_cmd
         self._output = output
+        self._hook_grace_seconds = hook_grace_seconds
 
     @property
     def name(self) -> str:
@@ -68,32 +96,40 @@ class RunPipelineCommand:
         if not result.success:
             return result
 
-        # --- Phase 4: Download cutaway clips ---
-        result = await self._invoker.execute(self._download_cmd, context)
-        if not result.success:
-            return result
+        # --- Phase 4: Download cutaway clips in the background ---
+        download_task = asyncio.create_task(self._invoker.execute(self._download_cmd, context))
+        try:
+            return await self._run_stages(context, download_task)
+        finally:
+            await _cancel_pending((download_task, *context.state.background_hook_tasks))
 
-        # --- Phase 5: Execute stages ---
-        overall_start = time.monotonic()
+    async def _run_stages(
+        self,
+        context: PipelineContext,
+        download_task: asyncio.Task[CommandResult],
+    ) -> CommandResult:
+        """Execute the stage loop, joining the cutaway download before its consumer stage."""
+        overall_start_ns = time.perf_counter_ns()
         stages = ALL_STAGES[: context.state.stages]
         start_stage = context.state.start_stage
 
         for stage_idx, stage_spec in enumerate(stages, 1):
+            stage = stage_spec[0]
             if stage_idx < start_stage:
-                self._output(f"  [{stage_spec[0].value.upper()}] Skipped (resuming)")
+                self._output(f"  [{stage.value.upper()}] Skipped (resuming)")
                 continue
 
-            stage = stage_spec[0]
+            if stage is CUTAWAY_CONSUMER_STAGE:
+                result = await download_task
+                if not result.success:
+                    return result
+
             context.state.current_stage_num = stage_idx
             context.state.stage_spec = stage_spec
 
             # Router stage uses elicitation command
-            from pipeline.domain.enums import PipelineStage
-
-            if stage == PipelineStage.ROUTER:
-                result = await self._invoker.execute(self._elicitation_cmd, context)
-            else:
-                result = await self._invoker.execute(self._stage_cmd, context)
+            cmd = self._elicitation_cmd if stage is PipelineStage.ROUTER else self._stage_cmd
+            result = await self._invoker.execute(cmd, context)
 
             if not result.success:
                 break
@@ -102,12 +138,37 @@ class RunPipelineCommand:
                 self._output("    ESCALATION needed — stopping.")
                 break
 
-        total = time.monotonic() - overall_start
+        result = await download_task
+        if not result.success:
+            return result
+
+        await _drain_background_hooks(context.state.background_hook_tasks, self._hook_grace_seconds)
+
+        total = (time.perf_counter_ns() - overall_start_ns) / 1e9
         _print_footer(context, total, output=self._output)
 
         return CommandResult(success=True, message=f"Pipeline completed in {total:.1f}s")
 
 
+async def _drain_background_hooks(tasks: set[asyncio.Task[None]], grace_seconds: float) -> None:
+    """Give background hook tasks *grace_seconds* to finish, then cancel the rest."""
+    if not tasks:
+        return
+    _done, pending = await asyncio.wait(set(tasks), timeout=grace_seconds)
+    if pending:
+        logger.warning("Cancelling %d background hook(s) still running after %.1fs", len(pending), grace_seconds)
+        await _cancel_pending(pending)
+
+
+async def _cancel_pending(tasks: Iterable[asyncio.Task[Any]]) -> None:
+    """Cancel every unfinished task in *tasks* and wait for it to unwind."""
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+
 def _print_header(context: PipelineContext, output: OutputPort = print) -> None:
     """Print the pipeline run header."""
     stages_count = context.state.stages
@@ -116,7 +177,7 @@ def _print_header(context: PipelineContext, output: OutputPort = print) -> None:
     target_duration = context.state.target_duration
     moments = context.state.moments_requested
 
-    output(f"\n{'=' * 60}")
+    output(f"\n{_BANNER}")
     output(f"  PIPELINE RUN — {stages_count} stages (starting at stage {start_stage}: {start_label})")
     output(f"  URL: {context.youtube_url}")
     if context.user_message != context.youtube_url:
@@ -128,22 +189,52 @@ def _print_header(context: PipelineContext, output: OutputPort = print) -> None:
         output(f"  Narrative moments: {moments}")
     cutaway_specs = context.state.cutaway_specs
     output(f"  Cutaway clips: {len(cutaway_specs) if cutaway_specs else 0}")
-    output(f"{'=' * 60}\n")
+    output(f"{_BANNER}\n")
 
 
-def _print_footer(context: PipelineContext, total_seconds: float, output: OutputPort = print) -> None:
-    """Print the pipeline completion footer with workspace contents."""
+def _print_footer(
+    context: PipelineContext,
+    total_seconds: float,
+    output: OutputPort = print,
+    max_entries: int = MAX_FOOTER_ENTRIES,
+) -> None:
+    """Print the pipeline completion footer with up to *max_entries* workspace files."""
     workspace = context.workspace
 
-    output(f"\n{'=' * 60}")
+    output(f"\n{_BANNER}")
     output(f"  Total time: {total_seconds:.1f}s")
     output(f"  Workspace: {workspace}")
-    output(f"{'=' * 60}\n")
+    output(f"{_BANNER}\n")
 
     if workspace is not None and workspace.is_dir():
-        output("  Workspace contents:")
-        for p in sorted(workspace.rglob("*")):
-            if p.is_file():
-                rel = p.relative_to(workspace)
-                size = p.stat().st_size
-                output(f"    {rel} ({size} bytes)")
+        # Emit the listing as one block — one write instead of one per file.
+        # nsmallest keeps only the first max_entries paths in a heap rather than
+        # sorting every file of a large workspace.
+        files = list(_walk_files(workspace))
+        shown = heapq.nsmallest(max_entries, files, key=_entry_path)
+        lines = ["  Workspace contents:"]
+        lines.extend(
+            f"    {_entry_path(entry).relative_to(workspace)} ({entry.stat().st_size} bytes)" for entry in shown
+        )
+        if len(files) > len(shown):
+            lines.append(f"    ... and {len(files) - len(shown)} more file(s)")
+        output("\n".join(lines))
+
+
+def _entry_path(entry: os.DirEntry[str]) -> Path:
+    """Return *entry* as a ``Path`` (ordered component-wise, so ``a/x`` sorts before ``a-b/y``)."""
+    return Path(entry.path)
+
+
+def _walk_files(root: str | os.PathLike[str]) -> Iterator[os.DirEntry[str]]:
+    """Yield every file entry under *root*, recursing without following directory symlinks.
+
+    ``DirEntry`` answers ``is_dir``/``is_file`` from the directory listing, so
+    each file costs a single ``stat`` (for its size) instead of two.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file():
+                yield entry
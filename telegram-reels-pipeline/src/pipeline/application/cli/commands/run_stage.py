@@ -2,18 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from collections.abc import Mapping
 from pathlib import Path
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Literal
 
-from pipeline.application.cli.stage_registry import ALL_STAGES, TOTAL_CLI_STAGES, stage_name
+from pipeline.application.cli.context import PipelineState
+from pipeline.application.cli.protocols import CommandResult
+from pipeline.application.cli.stage_registry import ALL_STAGES, TOTAL_CLI_STAGES, stage_name, stage_paths
 from pipeline.domain.enums import PipelineStage
 from pipeline.domain.models import AgentRequest, ReflectionResult
+from pipeline.domain.types import GateName
 
 if TYPE_CHECKING:
     from pipeline.application.cli.context import PipelineContext
-    from pipeline.application.cli.protocols import Command, CommandResult, OutputPort, StageHook
+    from pipeline.application.cli.protocols import Command, OutputPort, StageHook
     from pipeline.application.stage_runner import StageRunner
 
 logger = logging.getLogger(__name__)
@@ -21,6 +27,9 @@ logger = logging.getLogger(__name__)
 # Re-export for backward compatibility
 __all__ = ["ALL_STAGES", "TOTAL_CLI_STAGES", "stage_name", "RunStageCommand"]
 
+# Shared read-only view for stages that carry no elicitation context
+_EMPTY_ELICITATION: MappingProxyType[str, str] = MappingProxyType({})
+
 
 def print_stage_result(
     stage: PipelineStage,
@@ -30,49 +39,86 @@ def print_stage_result(
     output: OutputPort = print,
 ) -> None:
     """Print stage completion summary."""
-    output(f"  [{stage.value.upper()}] Done in {elapsed:.1f}s")
-    output(f"    Decision: {result.best_critique.decision.value}")
-    output(f"    Score: {result.best_critique.score}")
-    output(f"    Attempts: {result.attempts}")
-    output(f"    Artifacts: {len(artifacts)}")
-    for a in artifacts:
-        output(f"      - {a.name}")
-
-
-def _build_elicitation_context(state: object, context: PipelineContext | None = None) -> dict[str, str]:
-    """Build elicitation context dict, merging in creative instructions and settings."""
-    from pipeline.application.cli.context import PipelineState
-
+    # Render the whole summary, then emit it with one output call
+    lines = [
+        f"  [{stage.value.upper()}] Done in {elapsed:.1f}s",
+        f"    Decision: {result.best_critique.decision.value}",
+        f"    Score: {result.best_critique.score}",
+        f"    Attempts: {result.attempts}",
+        f"    Artifacts: {len(artifacts)}",
+    ]
+    lines.extend(f"      - {a.name}" for a in artifacts)
+    output("\n".join(lines))
+
+
+def _build_elicitation_context(state: object, context: PipelineContext | None = None) -> Mapping[str, str]:
+    """Return the read-only elicitation context, merging in creative instructions and settings.
+
+    Reuses the view ``ValidateArgsCommand`` froze for the run, so stages other
+    than Content pass the same mapping without copying it.
+    """
     if not isinstance(state, PipelineState):
-        return {}
-    result = dict(state.elicitation)
-    if state.instructions:
-        result["instructions"] = state.instructions
+        return _EMPTY_ELICITATION
+    view = state.elicitation_view
+    if view is None:
+        view = state.build_elicitation_view()
 
     # Inject publishing settings for Content stage (mirrors pipeline_runner logic)
     if context is None or state.stage_spec is None:
-        return result
+        return view
     stage = state.stage_spec[0]
     if stage != PipelineStage.CONTENT:
-        return result
+        return view
     settings = context.settings
     if not settings.publishing_language:
-        return result
-    result["publishing_language"] = settings.publishing_language
-    result["publishing_description_variants"] = str(settings.publishing_description_variants)
-    return result
+        return view
+    return MappingProxyType(
+        {
+            **view,
+            "publishing_language": settings.publishing_language,
+            "publishing_description_variants": str(settings.publishing_description_variants),
+        }
+    )
+
+
+async def _run_hooks(hooks: tuple[StageHook, ...], context: PipelineContext) -> None:
+    """Run already-matched hooks one at a time in tuple order.
+
+    Hooks sharing a stage/phase are not independent and must not be gathered:
+    before Assembly, ``Veo3AwaitHook`` finalizes the B-roll jobs that
+    ``ManifestBuildHook`` then places, so tuple order is dependency order.
+    """
+    for hook in hooks:
+        await hook.execute(context)
 
 
-async def _run_hooks(
+def _spawn_background_hooks(
     hooks: tuple[StageHook, ...],
     stage: PipelineStage,
-    phase: str,
+    phase: Literal["pre", "post"],
     context: PipelineContext,
 ) -> None:
-    """Fire all hooks matching the given stage and phase."""
+    """Start already-matched hooks as tasks owned by ``context.state``.
+
+    The stage does not wait for them; ``RunPipelineCommand`` drains the tasks
+    before the pipeline finishes.
+    """
+    tasks = context.state.background_hook_tasks
     for hook in hooks:
-        if hook.should_run(stage, phase):
-            await hook.execute(context)
+        task = asyncio.create_task(
+            _run_background_hook(hook, context),
+            name=f"hook-{type(hook).__name__}-{stage.value}-{phase}",
+        )
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+
+async def _run_background_hook(hook: StageHook, context: PipelineContext) -> None:
+    """Execute a background hook, logging failures since nothing awaits its result."""
+    try:
+        await hook.execute(context)
+    except Exception:
+        logger.warning("Background hook %s failed", type(hook).__name__, exc_info=True)
 
 
 def _build_result_data(
@@ -80,20 +126,27 @@ def _build_result_data(
     stage: PipelineStage,
     result: ReflectionResult,
     elapsed: float,
-) -> dict[str, object]:
-    """Build the CommandResult data dict for a completed stage."""
-    return {
-        "stage_num": stage_num,
-        "stage": stage.value,
-        "escalation_needed": result.escalation_needed,
-        "attempts": result.attempts,
-        "score": result.best_critique.score,
-        "elapsed": elapsed,
-    }
+) -> Mapping[str, object]:
+    """Build the CommandResult data for a completed stage, already frozen so it is not copied again."""
+    return MappingProxyType(
+        {
+            "stage_num": stage_num,
+            "stage": stage.value,
+            "escalation_needed": result.escalation_needed,
+            "attempts": result.attempts,
+            "score": result.best_critique.score,
+            "elapsed": elapsed,
+        }
+    )
 
 
 class RunStageCommand:
-    """Run a single pipeline stage with pre/post hooks."""
+    """Run a single pipeline stage with pre/post hooks.
+
+    ``hooks`` are awaited in order around the stage.  ``background_hooks`` are
+    fire-and-forget (audit, notifications): they start at the same points but
+    never delay the stage, and their failures are only logged.
+    """
 
     if TYPE_CHECKING:
         _protocol_check: Command
@@ -103,10 +156,16 @@ class RunStageCommand:
         stage_runner: StageRunner,
         hooks: tuple[StageHook, ...] = (),
         output: OutputPort = print,
+        background_hooks: tuple[StageHook, ...] = (),
     ) -> None:
         self._stage_runner = stage_runner
         self._hooks = hooks
+        self._background_hooks = background_hooks
         self._output = output
+        # (stage, phase) -> (background, blocking) hooks whose should_run matched
+        self._matched_hooks: dict[
+            tuple[PipelineStage, Literal["pre", "post"]], tuple[tuple[StageHook, ...], tuple[StageHook, ...]]
+        ] = {}
 
     @property
     def name(self) -> str:
@@ -114,25 +173,19 @@ class RunStageCommand:
 
     async def execute(self, context: PipelineContext) -> CommandResult:
         """Execute a single pipeline stage with hook support."""
-        from types import MappingProxyType
-
-        from pipeline.application.cli.protocols import CommandResult
-        from pipeline.domain.types import GateName
-
         stage_num: int = context.state.current_stage_num
         stage_spec = context.state.stage_spec
         if stage_spec is None:
             return CommandResult(success=False, message="No stage_spec in context state")
         stage, step_file_name, agent_def_name, gate_name = stage_spec
-        step_file = context.project_root / "workflows" / "stages" / step_file_name
-        agent_def = context.project_root / "agents" / agent_def_name / "agent.md"
+        step_file, agent_def = stage_paths(context.project_root, step_file_name, agent_def_name)
         gate_criteria: str = context.state.gate_criteria
         elicitation = _build_elicitation_context(context.state, context)
 
         self._output(f"  [{stage.value.upper()}] Starting...")
-        stage_start = time.monotonic()
+        stage_start_ns = time.perf_counter_ns()
 
-        await _run_hooks(self._hooks, stage, "pre", context)
+        await self._fire_hooks(stage, "pre", context)
 
         try:
             request = AgentRequest(
@@ -140,7 +193,7 @@ class RunStageCommand:
                 step_file=step_file,
                 agent_definition=agent_def,
                 prior_artifacts=context.artifacts,
-                elicitation_context=MappingProxyType(elicitation),
+                elicitation_context=elicitation or _EMPTY_ELICITATION,
             )
             result = await self._stage_runner.run_stage(
                 request,
@@ -148,10 +201,10 @@ class RunStageCommand:
                 gate_criteria=gate_criteria,
             )
             context.artifacts = result.artifacts
-            elapsed = time.monotonic() - stage_start
+            elapsed = (time.perf_counter_ns() - stage_start_ns) / 1e9
 
             print_stage_result(stage, result, context.artifacts, elapsed, output=self._output)
-            await _run_hooks(self._hooks, stage, "post", context)
+            await self._fire_hooks(stage, "post", context)
 
             success = not result.escalation_needed
             msg = f"Stage {stage_num} ({stage.value}) {'completed' if success else 'escalated'}"
@@ -162,7 +215,27 @@ class RunStageCommand:
             )
 
         except Exception:
-            elapsed = time.monotonic() - stage_start
+            elapsed = (time.perf_counter_ns() - stage_start_ns) / 1e9
             self._output(f"  [{stage.value.upper()}] FAILED after {elapsed:.1f}s")
-            await _run_hooks(self._hooks, stage, "post", context)
+            await self._fire_hooks(stage, "post", context)
             raise
+
+    async def _fire_hooks(self, stage: PipelineStage, phase: Literal["pre", "post"], context: PipelineContext) -> None:
+        """Start matching background hooks, then run matching blocking hooks in order."""
+        background, blocking = self._hooks_for(stage, phase)
+        _spawn_background_hooks(background, stage, phase, context)
+        await _run_hooks(blocking, context)
+
+    def _hooks_for(
+        self, stage: PipelineStage, phase: Literal["pre", "post"]
+    ) -> tuple[tuple[StageHook, ...], tuple[StageHook, ...]]:
+        """Return the ``(background, blocking)`` hooks for *stage*/*phase*, asking ``should_run`` once per key."""
+        key = (stage, phase)
+        matched = self._matched_hooks.get(key)
+        if matched is None:
+            matched = (
+                tuple(hook for hook in self._background_hooks if hook.should_run(stage, phase)),
+                tuple(hook for hook in self._hooks if hook.should_run(stage, phase)),
+            )
+            self._matched_hooks[key] = matched
+        return matched
@@ -2,19 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from pipeline.application.cli.protocols import CommandResult
 from pipeline.application.cli.stage_registry import (
-    STAGE_SIGNATURES,
-    TOTAL_CLI_STAGES,
+    ORDERED_STAGE_SIGNATURES,
     stage_name,
 )
+from pipeline.application.cli.workspace_files import probe_workspace, workspace_file_names
+from pipeline.application.workspace_manager import WorkspaceManager
 
 if TYPE_CHECKING:
     from pipeline.application.cli.context import PipelineContext
-    from pipeline.application.cli.protocols import Command, CommandResult, OutputPort
+    from pipeline.application.cli.protocols import Command, OutputPort
 
 logger = logging.getLogger(__name__)
 
@@ -23,20 +26,24 @@ def print_resume_preflight(
     workspace: Path,
     start_stage: int,
     output: OutputPort = print,
+    file_names: frozenset[str] | None = None,
 ) -> None:
-    """Print a preflight summary of workspace state when resuming."""
-    output("  Workspace artifact check:")
-    for stage_num in range(1, TOTAL_CLI_STAGES + 1):
-        signatures = STAGE_SIGNATURES.get(stage_num, ())
-        found = [name for name in signatures if (workspace / name).exists()]
-        status = "ok" if found else "missing"
+    """Print a preflight summary of workspace state when resuming.
+
+    *file_names* is a prior ``workspace_file_names`` snapshot; the workspace
+    is scanned when it is omitted.
+    """
+    if file_names is None:
+        file_names = workspace_file_names(workspace)
+    # Render the whole report, then emit it with one output call
+    lines = ["  Workspace artifact check:"]
+    for stage_num, signatures in enumerate(ORDERED_STAGE_SIGNATURES, 1):
+        found = [name for name in signatures if name in file_names]
         marker = "  " if stage_num < start_stage else ">>"
-        name = stage_name(stage_num)
-        if found:
-            output(f"    {marker} Stage {stage_num} ({name}): {status} [{', '.join(found)}]")
-        else:
-            output(f"    {marker} Stage {stage_num} ({name}): {status}")
-    output()
+        label = f"    {marker} Stage {stage_num} ({stage_name(stage_num)})"
+        lines.append(f"{label}: ok [{', '.join(found)}]" if found else f"{label}: missing")
+    lines.append("")
+    output("\n".join(lines))
 
 
 class SetupWorkspaceCommand:
@@ -55,9 +62,6 @@ class SetupWorkspaceCommand:
 
     async def execute(self, context: PipelineContext) -> CommandResult:
         """Create or resume a workspace and set ``context.workspace``."""
-        from pipeline.application.cli.protocols import CommandResult
-        from pipeline.application.workspace_manager import WorkspaceManager
-
         resume_path = context.resume_workspace
         start_stage = context.state.start_stage or context.start_stage or 1
 
@@ -83,11 +87,18 @@ class SetupWorkspaceCommand:
         resume_path: str,
         start_stage: int,
     ) -> CommandResult:
-        """Resume an existing workspace."""
-        from pipeline.application.cli.protocols import CommandResult
+        """Resume an existing workspace.
+
+        Reuses the snapshot ``ValidateArgsCommand`` took of the workspace; without
+        one, the directory is scanned in a worker thread so a slow filesystem
+        does not stall the event loop.
+        """
 
         workspace = Path(resume_path) if not isinstance(resume_path, Path) else resume_path
-        if not workspace.is_dir():
+        file_names = context.state.resume_file_names
+        if file_names is None:
+            file_names = await asyncio.to_thread(probe_workspace, workspace)
+        if file_names is None:
             return CommandResult(
                 success=False,
                 message=f"Resume workspace is not a valid directory: {workspace}",
@@ -95,12 +106,11 @@ class SetupWorkspaceCommand:
         context.set_workspace(workspace)
         logger.info("Resuming workspace: %s", workspace)
         self._output(f"  Resuming workspace: {workspace}")
-        print_resume_preflight(workspace, start_stage, output=self._output)
+        print_resume_preflight(workspace, start_stage, output=self._output, file_names=file_names)
 
-        # Load existing artifacts when resuming
+        # Load existing artifacts when resuming (same-directory paths sort by name)
         if start_stage > 1:
-            existing = sorted(p for p in workspace.iterdir() if p.is_file())
-            context.artifacts = tuple(existing)
+            context.artifacts = tuple(workspace / name for name in sorted(file_names))
             self._output(f"  Loaded {len(context.artifacts)} existing artifacts from workspace")
             for a in context.artifacts:
                 self._output(f"    - {a.name}")
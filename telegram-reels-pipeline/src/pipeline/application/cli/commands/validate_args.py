@@ -4,28 +4,52 @@ from __future__ import annotations
 
 import logging
 import sys
+from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
+from pipeline.application.cli.protocols import CommandResult
 from pipeline.application.cli.stage_registry import (
-    STAGE_SIGNATURES,
+    ORDERED_STAGE_SIGNATURES,
     TOTAL_CLI_STAGES,
 )
+from pipeline.application.cli.workspace_files import probe_workspace, workspace_file_names
 
 if TYPE_CHECKING:
     from pipeline.application.cli.context import PipelineContext
-    from pipeline.application.cli.protocols import Command, CommandResult
+    from pipeline.application.cli.protocols import Command
 
 logger = logging.getLogger(__name__)
 
 _AUTO_TRIGGER_THRESHOLD: int = 120
+_MIN_TARGET_DURATION: int = 30
+_MAX_TARGET_DURATION: int = 300
+_MAX_MOMENTS: int = 5
 
 # Style CLI shorthand to domain enum values
-STYLE_MAP: dict[str, str] = {
-    "split": "split_horizontal",
-    "pip": "pip",
-    "auto": "auto",
-    "default": "default",
-}
+STYLE_MAP: MappingProxyType[str, str] = MappingProxyType(
+    {
+        "split": "split_horizontal",
+        "pip": "pip",
+        "auto": "auto",
+        "default": "default",
+    }
+)
+
+
+def _auto_moments(target_duration: int) -> int:
+    """Moments for *target_duration* when the user did not pass ``--moments``.
+
+    Uses ``int(x + 0.5)`` instead of ``round()`` to avoid Python's banker's
+    rounding (round-half-to-even), which would map 150s -> 2 instead of 3.
+    """
+    if target_duration <= _AUTO_TRIGGER_THRESHOLD:
+        return 1
+    return min(_MAX_MOMENTS, max(2, int(target_duration / 60 + 0.5)))
+
+
+# Every duration --target-duration accepts, precomputed at import time.
+_MOMENTS_LUT: tuple[int, ...] = tuple(_auto_moments(d) for d in range(_MAX_TARGET_DURATION + 1))
 
 
 def compute_moments_requested(target_duration: int, explicit_moments: int | None) -> int:
@@ -36,17 +60,17 @@ def compute_moments_requested(target_duration: int, explicit_moments: int | None
     - ``<= 120s``: 1 moment (single, current behavior)
     - ``> 120s``: ``min(5, max(2, int(target_duration / 60 + 0.5)))``
 
-    Uses ``int(x + 0.5)`` instead of ``round()`` to avoid Python's banker's
-    rounding (round-half-to-even), which would map 150s -> 2 instead of 3.
+    Durations in the accepted range are served from ``_MOMENTS_LUT``; anything
+    outside it falls back to the formula.
     """
     if explicit_moments is not None:
         return explicit_moments
-    if target_duration <= _AUTO_TRIGGER_THRESHOLD:
-        return 1
-    return min(5, max(2, int(target_duration / 60 + 0.5)))
+    if 0 <= target_duration <= _MAX_TARGET_DURATION:
+        return _MOMENTS_LUT[target_duration]
+    return _auto_moments(target_duration)
 
 
-def detect_resume_stage(workspace_path: Any) -> int | None:
+def detect_resume_stage(workspace_path: Any, file_names: frozenset[str] | None = None) -> int | None:
     """Detect the next stage to run by inspecting workspace artifacts.
 
     Walks stages 1-N checking for signature artifacts. A stage is complete
@@ -54,14 +78,16 @@ def detect_resume_stage(workspace_path: Any) -> int | None:
     encoding-plan.json and segment-001.mp4). Returns the first stage number
     whose signatures are incomplete.
     Returns None if no completed stages found (empty workspace).
-    """
-    from pathlib import Path
 
-    workspace = Path(workspace_path) if not isinstance(workspace_path, Path) else workspace_path
+    *file_names* is a prior ``workspace_file_names`` snapshot; the workspace
+    is scanned when it is omitted.
+    """
+    if file_names is None:
+        workspace = Path(workspace_path) if not isinstance(workspace_path, Path) else workspace_path
+        file_names = workspace_file_names(workspace)
     last_completed = 0
-    for stage_num in range(1, TOTAL_CLI_STAGES + 1):
-        signatures = STAGE_SIGNATURES.get(stage_num, ())
-        if all((workspace / name).exists() for name in signatures):
+    for stage_num, signatures in enumerate(ORDERED_STAGE_SIGNATURES, 1):
+        if file_names.issuperset(signatures):
             last_completed = stage_num
         else:
             break
@@ -71,6 +97,7 @@ def detect_resume_stage(workspace_path: Any) -> int | None:
 def _resolve_start_stage(
     start_stage: int | None,
     resume_path: Any,
+    file_names: frozenset[str] | None = None,
 ) -> tuple[int, bool]:
     """Resolve start stage when not explicitly provided.
 
@@ -78,14 +105,12 @@ def _resolve_start_stage(
         ``(start_stage, all_complete)`` tuple. If ``all_complete`` is True
         the caller should exit early.
     """
-    from pathlib import Path
-
     if start_stage is not None:
         return start_stage, False
 
     if resume_path is not None:
         workspace = Path(resume_path) if not isinstance(resume_path, Path) else resume_path
-        detected = detect_resume_stage(workspace)
+        detected = detect_resume_stage(workspace, file_names)
         if detected is not None:
             if detected > TOTAL_CLI_STAGES:
                 return detected, True  # all stages complete
@@ -105,21 +130,22 @@ def _validate_ranges(
     stages: int,
     target_duration: int,
     moments: int | None,
+    resume_file_names: frozenset[str] | None = None,
 ) -> str | None:
-    """Check individual argument ranges. Returns error message or None."""
-    from pathlib import Path
+    """Check individual argument ranges. Returns error message or None.
 
+    *resume_file_names* is the ``probe_workspace`` result for *resume*; None
+    means the path is not a directory.
+    """
     if start_stage_raw is not None and (start_stage_raw < 1 or start_stage_raw > TOTAL_CLI_STAGES):
         return f"--start-stage must be between 1 and {TOTAL_CLI_STAGES}, got {start_stage_raw}"
 
-    if resume is not None:
-        resume_path = Path(resume) if not isinstance(resume, Path) else resume
-        if not resume_path.is_dir():
-            return (
-                f"--resume path is not a valid directory: {resume}\n"
-                f"  Hint: use an existing workspace path, e.g.:\n"
-                f"    --resume workspace/runs/20260211-191521-a97fec"
-            )
+    if resume is not None and resume_file_names is None:
+        return (
+            f"--resume path is not a valid directory: {resume}\n"
+            f"  Hint: use an existing workspace path, e.g.:\n"
+            f"    --resume workspace/runs/20260211-191521-a97fec"
+        )
 
     if start_stage_raw is not None and start_stage_raw > 1 and resume is None:
         return (
@@ -131,11 +157,14 @@ def _validate_ranges(
     if stages < 1 or stages > TOTAL_CLI_STAGES:
         return f"--stages must be between 1 and {TOTAL_CLI_STAGES}, got {stages}"
 
-    if target_duration < 30 or target_duration > 300:
-        return f"--target-duration must be between 30 and 300, got {target_duration}"
+    if target_duration < _MIN_TARGET_DURATION or target_duration > _MAX_TARGET_DURATION:
+        return (
+            f"--target-duration must be between {_MIN_TARGET_DURATION} and {_MAX_TARGET_DURATION}, "
+            f"got {target_duration}"
+        )
 
-    if moments is not None and (moments < 1 or moments > 5):
-        return f"--moments must be between 1 and 5, got {moments}"
+    if moments is not None and (moments < 1 or moments > _MAX_MOMENTS):
+        return f"--moments must be between 1 and {_MAX_MOMENTS}, got {moments}"
 
     return None
 
@@ -164,22 +193,27 @@ class ValidateArgsCommand:
         Returns ``CommandResult(success=False)`` for validation failures instead of
         calling ``arg_parser.error()`` / ``sys.exit()``.
         """
-        from pipeline.application.cli.protocols import CommandResult
 
         args = context.state.args
         if args is None:
             return CommandResult(success=False, message="No args in context state")
 
-        stages = getattr(args, "stages", 7)
-        resume = getattr(args, "resume", None)
-        start_stage_raw = getattr(args, "start_stage", None)
-        target_duration = getattr(args, "target_duration", 90)
-        moments = getattr(args, "moments", None)
-        style = getattr(args, "style", None)
-        instructions = getattr(args, "instructions", None)
+        # Read the Namespace's attribute dict once rather than getattr() per option
+        options = vars(args)
+        stages = options.get("stages", 7)
+        resume = options.get("resume")
+        start_stage_raw = options.get("start_stage")
+        target_duration = options.get("target_duration", 90)
+        moments = options.get("moments")
+        style = options.get("style")
+        instructions = options.get("instructions")
+
+        # Probe the resume workspace once: directory check, resume detection and
+        # the setup preflight all read this snapshot
+        file_names = probe_workspace(Path(resume)) if resume is not None else None
 
         # Validate individual argument ranges
-        error = _validate_ranges(start_stage_raw, resume, stages, target_duration, moments)
+        error = _validate_ranges(start_stage_raw, resume, stages, target_duration, moments, file_names)
         if error is not None:
             return CommandResult(success=False, message=error)
 
@@ -187,7 +221,7 @@ class ValidateArgsCommand:
             return CommandResult(success=False, message="--instructions must not be empty when provided")
 
         # Resolve start stage (auto-detect or default)
-        resolved_start, all_complete = _resolve_start_stage(start_stage_raw, resume)
+        resolved_start, all_complete = _resolve_start_stage(start_stage_raw, resume, file_names)
         if all_complete:
             return CommandResult(
                 success=True,
@@ -213,6 +247,8 @@ class ValidateArgsCommand:
         context.state.stages = stages
         context.state.target_duration = target_duration
         context.state.instructions = instructions.strip() if instructions else ""
+        context.state.elicitation_view = context.state.build_elicitation_view()
+        context.state.resume_file_names = file_names
 
         return CommandResult(
             success=True,
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from pipeline.domain.enums import PipelineStage
@@ -17,7 +18,7 @@ if TYPE_CHECKING:
     from pipeline.application.stage_runner import StageRunner
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineState:
     """Typed state accumulated during pipeline CLI execution.
 
@@ -36,6 +37,8 @@ class PipelineState:
     framing_style: str | None = None
     stages: int = 7
     target_duration: int = 90
+    # File names in the --resume workspace, scanned once and reused by SetupWorkspace
+    resume_file_names: frozenset[str] | None = None
 
     # --- Set per-stage by RunPipelineCommand ---
     current_stage_num: int = 0
@@ -45,11 +48,23 @@ class PipelineState:
     gate_criteria: str = ""
     elicitation: dict[str, str] = field(default_factory=dict)
 
+    # --- Set by ValidateArgsCommand: build_elicitation_view(), shared by every stage ---
+    elicitation_view: Mapping[str, str] | None = None
+
     # --- Set by Veo3FireHook ---
     veo3_task: asyncio.Task[None] | None = None
 
+    # --- Set by RunStageCommand (background hooks), drained by RunPipelineCommand ---
+    background_hook_tasks: set[asyncio.Task[None]] = field(default_factory=set)
+
+    def build_elicitation_view(self) -> Mapping[str, str]:
+        """Return a read-only merge of ``elicitation`` and the creative ``instructions``."""
+        if not self.instructions:
+            return MappingProxyType(dict(self.elicitation))
+        return MappingProxyType({**self.elicitation, "instructions": self.instructions})
+
 
-@dataclass
+@dataclass(slots=True)
 class PipelineContext:
     """Shared execution context for all CLI commands.
 
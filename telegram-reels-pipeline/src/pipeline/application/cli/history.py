@@ -1,37 +1,58 @@
-"""CommandHistory — debug stack of executed commands, persisted via atomic write."""
+"""CommandHistory — debug stack of executed commands, persisted as an append-only JSON lines log."""
 
 from __future__ import annotations
 
-import contextlib
-import json
 import logging
-import os
-import tempfile
 from pathlib import Path
 
+from pipeline.application.cli.atomic_io import append_json_lines
 from pipeline.domain.models import CommandRecord
 
 logger = logging.getLogger(__name__)
 
-_HISTORY_FILENAME = "command-history.json"
+_HISTORY_FILENAME = "command-history.jsonl"
 
 
 class CommandHistory:
-    """Append-only stack of CommandRecord entries with atomic JSON persistence.
+    """Append-only stack of CommandRecord entries with JSON lines persistence.
 
-    Records are kept in memory and flushed to ``command-history.json``
-    inside the workspace directory on each ``persist()`` call.
+    Records are kept in memory; each ``persist()`` call appends the ones not
+    yet written to ``command-history.jsonl`` inside the workspace directory.
     """
 
     def __init__(self) -> None:
         self._records: list[CommandRecord] = []
+        self._by_status: dict[str, list[CommandRecord]] = {}
+        # Tuple handed out by all(), rebuilt only after an append
+        self._all: tuple[CommandRecord, ...] | None = ()
+        # JSON form of each record, built once on append and kept in lockstep with _records
+        self._entries: list[dict[str, str | None]] = []
+        # (target, entries written to it); records are append-only, so the count marks the unwritten tail
+        self._persisted: tuple[Path, int] | None = None
 
     def append(self, record: CommandRecord) -> None:
         """Add a command record to the history stack."""
         self._records.append(record)
+        self._all = None
+        self._by_status.setdefault(record.status, []).append(record)
+        self._entries.append(
+            {
+                "name": record.name,
+                "started_at": record.started_at,
+                "finished_at": record.finished_at,
+                "status": record.status,
+                "error": record.error,
+            }
+        )
 
     def persist(self, workspace: Path | None) -> None:
-        """Atomically write the full history to ``command-history.json``.
+        """Append records not yet written to ``command-history.jsonl``, one JSON object per line.
+
+        Each call writes only the new tail, so persisting after every command
+        costs O(1) per record rather than rewriting the whole history.  The
+        first persist into a workspace writes every record held so far,
+        including those recorded before the workspace existed; a resumed
+        workspace keeps the lines of earlier runs.
 
         If *workspace* is None or does not exist, a warning is logged and
         persistence is skipped (non-fatal).
@@ -39,46 +60,37 @@ class CommandHistory:
         if workspace is None:
             logger.warning("No workspace set — skipping history persist")
             return
-        if not workspace.is_dir():
-            logger.warning("Workspace %s does not exist — skipping history persist", workspace)
-            return
 
         target = workspace / _HISTORY_FILENAME
-        data = [
-            {
-                "name": r.name,
-                "started_at": r.started_at,
-                "finished_at": r.finished_at,
-                "status": r.status,
-                "error": r.error,
-            }
-            for r in self._records
-        ]
+        written = self._persisted[1] if self._persisted is not None and self._persisted[0] == target else 0
+        if self._persisted is not None and written == len(self._entries):
+            return
 
-        fd, tmp_path_str = tempfile.mkstemp(dir=str(workspace), suffix=".tmp")
         try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-            os.replace(tmp_path_str, str(target))
-        except BaseException:
-            with contextlib.suppress(OSError):
-                os.unlink(tmp_path_str)
-            raise
+            append_json_lines(target, self._entries[written:])
+        except (FileNotFoundError, NotADirectoryError):
+            logger.warning("Workspace %s does not exist — skipping history persist", workspace)
+            return
+        self._persisted = (target, len(self._entries))
 
     # --- Query methods ---
 
     def all(self) -> tuple[CommandRecord, ...]:
         """Return all records in insertion order."""
-        return tuple(self._records)
+        if self._all is None:
+            self._all = tuple(self._records)
+        return self._all
 
     def by_status(self, status: str) -> tuple[CommandRecord, ...]:
         """Return records matching the given status."""
-        return tuple(r for r in self._records if r.status == status)
+        return tuple(self._by_status.get(status, ()))
 
     def last(self, n: int) -> tuple[CommandRecord, ...]:
         """Return the last *n* records (or fewer if history is shorter)."""
         if n <= 0:
             return ()
+        if n >= len(self._records):
+            return self.all()
         return tuple(self._records[-n:])
 
     def __len__(self) -> int:
@@ -52,9 +52,10 @@ class EncodingPlanHook:
 
         print("  [FFMPEG_ADAPTER] Executing encoding plan...")
         segments = await self._ffmpeg_adapter.execute_encoding_plan(plan_path, workspace=workspace)
-        print(f"  [FFMPEG_ADAPTER] Produced {len(segments)} segments")
-        for seg in segments:
-            print(f"      - {seg.name}")
+        # Summary and segment list in one write rather than a print per segment
+        lines = [f"  [FFMPEG_ADAPTER] Produced {len(segments)} segments"]
+        lines.extend(f"      - {seg.name}" for seg in segments)
+        print("\n".join(lines))
 
         # Re-collect artifacts so downstream stages see the segment files
         context.artifacts = self._artifact_collector(workspace)
@@ -5,9 +5,13 @@ from __future__ import annotations
 import json
 import logging
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Literal
 
+from pipeline.application.broll_placer import BrollPlacer
+from pipeline.application.manifest_builder import ManifestBuilder
 from pipeline.domain.enums import PipelineStage
+from pipeline.domain.models import ClipSource, CutawayClip, CutawayManifest, resolve_overlaps
 
 if TYPE_CHECKING:
     from pipeline.application.cli.context import PipelineContext
@@ -16,17 +20,19 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 # Heuristic placement hints → relative position in timeline (0.0-1.0)
-_PLACEMENT_HINTS: dict[str, float] = {
-    "intro": 0.05,
-    "beginning": 0.05,
-    "start": 0.05,
-    "middle": 0.50,
-    "mid": 0.50,
-    "center": 0.50,
-    "outro": 0.90,
-    "end": 0.90,
-    "conclusion": 0.90,
-}
+_PLACEMENT_HINTS: MappingProxyType[str, float] = MappingProxyType(
+    {
+        "intro": 0.05,
+        "beginning": 0.05,
+        "start": 0.05,
+        "middle": 0.50,
+        "mid": 0.50,
+        "center": 0.50,
+        "outro": 0.90,
+        "end": 0.90,
+        "conclusion": 0.90,
+    }
+)
 _DEFAULT_CLIP_DURATION: float = 5.0
 
 
@@ -52,12 +58,11 @@ class ManifestBuildHook:
         """Read encoding plan, build cutaway manifest, and write atomically."""
         workspace = context.require_workspace()
         plan_path = workspace / "encoding-plan.json"
-        if not plan_path.exists():
-            return
-
         try:
-            plan = json.loads(plan_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError) as exc:
+            plan = json.loads(plan_path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
             logger.debug("Cannot read encoding-plan.json for cutaway manifest: %s", exc)
             return
 
@@ -72,10 +77,6 @@ class ManifestBuildHook:
     ) -> None:
         """Build and write the manifest, merging user-instructed clips."""
         try:
-            from pipeline.application.broll_placer import BrollPlacer
-            from pipeline.application.manifest_builder import ManifestBuilder
-            from pipeline.domain.models import CutawayManifest, resolve_overlaps
-
             builder = ManifestBuilder(BrollPlacer())
             manifest, dropped = await builder.build(workspace, segments, total_duration)
 
@@ -120,18 +121,16 @@ def _extract_segments(plan: dict[str, Any]) -> tuple[list[dict[str, object]], fl
     return segments, total_duration
 
 
-def _read_user_instructed_clips(workspace: Path, total_duration_s: float) -> tuple[Any, ...]:
+def _read_user_instructed_clips(workspace: Path, total_duration_s: float) -> tuple[CutawayClip, ...]:
     """Read documentary_clips from router-output.json and convert to CutawayClip objects.
 
     Returns a tuple of ``CutawayClip`` instances for clips with valid local
     file paths.  Clips referencing non-existent files are logged and skipped.
     """
-    from pipeline.domain.models import ClipSource, CutawayClip
-
     router_path = workspace / "router-output.json"
     try:
-        data = json.loads(router_path.read_text(encoding="utf-8"))
-    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        data = json.loads(router_path.read_bytes())
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError):
         return ()
 
     raw_clips = data.get("documentary_clips", [])
@@ -155,7 +154,8 @@ def _read_user_instructed_clips(workspace: Path, total_duration_s: float) -> tup
             logger.warning("documentary_clips[%d]: file not found — %s", i, clip_path)
             continue
 
-        placement_hint = str(entry.get("placement_hint", "")).strip().lower()
+        raw_hint = entry.get("placement_hint")
+        placement_hint = raw_hint.strip().casefold() if isinstance(raw_hint, str) else ""
         relative_pos = _PLACEMENT_HINTS.get(placement_hint, 0.5)
         insertion_s = max(0.0, total_duration_s * relative_pos)
 
@@ -6,6 +6,8 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING, Literal
 
+from pipeline.application.veo3_await_gate import run_veo3_await_gate
+from pipeline.application.veo3_orchestrator import Veo3Orchestrator
 from pipeline.domain.enums import PipelineStage
 
 if TYPE_CHECKING:
@@ -45,13 +47,10 @@ class Veo3AwaitHook:
     async def execute(self, context: PipelineContext) -> None:
         """Await background Veo3 task and run the polling gate.
 
-        Reads ``context.state["veo3_task"]`` if present, awaits it, then
+        Reads ``context.state.veo3_task`` if present, awaits it, then
         creates a fresh orchestrator to run the await gate.  Prints a
         summary of completed / failed / skipped clips.
         """
-        from pipeline.application.veo3_await_gate import run_veo3_await_gate
-        from pipeline.application.veo3_orchestrator import Veo3Orchestrator
-
         workspace = context.require_workspace()
 
         print("  [VEO3] Awaiting generation completion...")
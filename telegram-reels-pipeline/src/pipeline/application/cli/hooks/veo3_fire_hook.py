@@ -6,6 +6,7 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING, Literal
 
+from pipeline.application.veo3_orchestrator import Veo3Orchestrator
 from pipeline.domain.enums import PipelineStage
 
 if TYPE_CHECKING:
@@ -23,7 +24,7 @@ class Veo3FireHook:
     configured).  When the adapter is present and the Content stage has just
     completed, creates a ``Veo3Orchestrator``, fires ``start_generation`` as
     a background ``asyncio.Task``, and stores the task handle in
-    ``context.state["veo3_task"]``.
+    ``context.state.veo3_task``.
 
     Failures are logged but never crash the pipeline (graceful degradation).
     """
@@ -41,7 +42,7 @@ class Veo3FireHook:
     async def execute(self, context: PipelineContext) -> None:
         """Create a Veo3Orchestrator and fire background generation.
 
-        Stores the ``asyncio.Task`` in ``context.state["veo3_task"]``.
+        Stores the ``asyncio.Task`` in ``context.state.veo3_task``.
         On any failure, logs the error and returns without crashing.
         """
         if self._veo3_adapter is None:
@@ -50,8 +51,6 @@ class Veo3FireHook:
         workspace = context.require_workspace()
 
         try:
-            from pipeline.application.veo3_orchestrator import Veo3Orchestrator
-
             orchestrator = Veo3Orchestrator(
                 video_gen=self._veo3_adapter,
                 clip_count=context.settings.veo3_clip_count,
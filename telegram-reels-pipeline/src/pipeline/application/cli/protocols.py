@@ -14,9 +14,13 @@ if TYPE_CHECKING:
     from pipeline.application.cli.context import PipelineContext
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommandResult:
-    """Immutable result returned by a Command execution."""
+    """Immutable result returned by a Command execution.
+
+    ``data`` is stored as a ``MappingProxyType``; pass one directly to skip the
+    defensive copy.
+    """
 
     success: bool
     message: str
@@ -39,7 +43,11 @@ class Command(Protocol):
 
 @runtime_checkable
 class StageHook(Protocol):
-    """Hook that runs before or after a pipeline stage."""
+    """Hook that runs before or after a pipeline stage.
+
+    ``should_run`` must depend only on its arguments and on state fixed at
+    construction: ``RunStageCommand`` caches its answer per stage and phase.
+    """
 
     def should_run(self, stage: PipelineStage, phase: Literal["pre", "post"]) -> bool: ...
 
@@ -53,6 +61,19 @@ class InputReader(Protocol):
     async def read(self, prompt: str, timeout: int) -> str | None: ...
 
 
+@runtime_checkable
+class BatchInputReader(Protocol):
+    """Optional InputReader extension that answers several prompts in one exchange.
+
+    For remote frontends (e.g. a chat bot) this replaces one round-trip per
+    prompt with a single one.  Returns one entry per prompt; ``None`` marks a
+    prompt (and all after it) as cancelled or timed out.  *timeout* covers the
+    whole batch.
+    """
+
+    async def read_many(self, prompts: list[str], timeout: int) -> list[str | None]: ...
+
+
 @runtime_checkable
 class ClipDurationProber(Protocol):
     """Abstraction over ffprobe for clip duration queries."""
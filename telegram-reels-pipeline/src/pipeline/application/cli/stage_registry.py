@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import functools
+from pathlib import Path
+
 from pipeline.domain.enums import PipelineStage
 
 # All pipeline stages in order (delivery skipped — no Telegram).
@@ -30,9 +33,30 @@ STAGE_SIGNATURES: dict[int, tuple[str, ...]] = {
     7: ("final-reel.mp4",),
 }
 
+# STAGE_SIGNATURES as a tuple indexed by stage_num - 1, for in-order walks.
+ORDERED_STAGE_SIGNATURES: tuple[tuple[str, ...], ...] = tuple(
+    STAGE_SIGNATURES.get(stage_num, ()) for stage_num in range(1, TOTAL_CLI_STAGES + 1)
+)
+
+
+# Display names indexed by stage_num - 1, built once instead of per stage_name call.
+_STAGE_NAMES: tuple[str, ...] = tuple(spec[0].value.replace("_", "-") for spec in ALL_STAGES)
+
 
 def stage_name(stage_num: int) -> str:
     """Return the human-readable display name for a 1-indexed stage number."""
     if 1 <= stage_num <= TOTAL_CLI_STAGES:
-        return ALL_STAGES[stage_num - 1][0].value.replace("_", "-")
+        return _STAGE_NAMES[stage_num - 1]
     return f"stage-{stage_num}"
+
+
+@functools.lru_cache(maxsize=32)
+def stage_paths(project_root: Path, step_file_name: str, agent_def_name: str) -> tuple[Path, Path]:
+    """Return ``(step_file, agent_definition)`` paths for a stage spec under *project_root*.
+
+    Cached so each stage's paths are joined once per project root rather than
+    on every stage (and elicitation round) invocation.
+    """
+    step_file = project_root / "workflows" / "stages" / step_file_name
+    agent_def = project_root / "agents" / agent_def_name / "agent.md"
+    return step_file, agent_def
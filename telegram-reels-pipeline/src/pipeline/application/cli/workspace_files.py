@@ -0,0 +1,33 @@
+"""Workspace directory snapshots shared by the resume-detection commands."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+
+def workspace_file_names(workspace: Path) -> frozenset[str]:
+    """Return the names of the regular files directly inside *workspace*.
+
+    One ``scandir`` pass replaces a ``stat`` per signature artifact, so
+    resume detection and the preflight report become set lookups.  Returns an
+    empty set when *workspace* is missing or unreadable.
+    """
+    file_names = probe_workspace(workspace)
+    return file_names if file_names is not None else frozenset()
+
+
+def probe_workspace(workspace: Path) -> frozenset[str] | None:
+    """Return *workspace*'s file names, or None if it is not a directory.
+
+    Folds the ``is_dir`` check into the listing: ``scandir`` itself reports a
+    missing path or a non-directory.  An existing but unreadable directory
+    yields an empty set.
+    """
+    try:
+        with os.scandir(workspace) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    except OSError:
+        return frozenset()
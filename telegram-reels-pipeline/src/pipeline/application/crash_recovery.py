@@ -18,6 +18,9 @@ logger = logging.getLogger(__name__)
 # Map stage value strings to PipelineStage for lookup
 _STAGE_BY_VALUE: dict[str, PipelineStage] = {s.value: s for s in PipelineStage}
 
+# Stage values a run can have completed, built once for every recovery plan
+_KNOWN_STAGE_VALUES: frozenset[str] = frozenset(s.value for s in STAGE_ORDER)
+
 
 @dataclass(frozen=True)
 class RecoveryPlan:
@@ -87,8 +90,7 @@ def _build_recovery_plan(run_state: RunState) -> RecoveryPlan | None:
     Returns None if the run state is inconsistent (no valid resume point).
     """
     # Only count recognized stage values
-    known_values = {s.value for s in STAGE_ORDER}
-    completed_set = set(run_state.stages_completed) & known_values
+    completed_set = _KNOWN_STAGE_VALUES.intersection(run_state.stages_completed)
 
     # Find the first stage in STAGE_ORDER not yet completed
     resume_from: PipelineStage | None = None
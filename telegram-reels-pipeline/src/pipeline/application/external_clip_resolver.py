@@ -40,8 +40,12 @@ class ExternalClipResolver:
     ) -> list[dict[str, object]]:
         """Search and download clips for each suggestion, returning resolved metadata.
 
-        Rate-limited: processes at most ``_MAX_SEARCHES`` suggestions with
-        ``_INTER_SEARCH_DELAY`` seconds between each search.
+        Rate-limited: processes at most ``_MAX_SEARCHES`` suggestions,
+        starting each search ``_INTER_SEARCH_DELAY`` seconds after the
+        previous one.  Searches run as concurrent tasks, so a slow search or
+        download overlaps the next search instead of delaying it.  Searches
+        that land on the same URL share one download.  Results keep suggestion
+        order.
 
         Args:
             suggestions: List of dicts with at least ``search_query`` key.
@@ -52,26 +56,43 @@ class ExternalClipResolver:
             ``duration`` for each successfully resolved clip.
         """
         capped = suggestions[:_MAX_SEARCHES]
-        resolved: list[dict[str, object]] = []
+        tasks: list[asyncio.Task[dict[str, object] | None]] = []
+        downloads: dict[str, asyncio.Task[Path | None]] = {}
 
-        for idx, suggestion in enumerate(capped):
-            query = str(suggestion.get("search_query", ""))
-            if not query:
-                logger.debug("Skipping suggestion with empty search_query")
-                continue
+        try:
+            for idx, suggestion in enumerate(capped):
+                query = str(suggestion.get("search_query", ""))
+                if not query:
+                    logger.debug("Skipping suggestion with empty search_query")
+                    continue
+
+                # Rate-limit delay between search launches (not before first)
+                if idx > 0:
+                    await asyncio.sleep(_INTER_SEARCH_DELAY)
+
+                tasks.append(asyncio.create_task(self._resolve_or_skip(query, suggestion, dest_dir, downloads)))
 
-            # Rate-limit delay between searches (not before first)
-            if idx > 0:
-                await asyncio.sleep(_INTER_SEARCH_DELAY)
+            results = await asyncio.gather(*tasks)
+        finally:
+            # Only still-pending tasks are affected, i.e. when resolve_all itself is cancelled
+            for task in (*tasks, *downloads.values()):
+                task.cancel()
 
-            try:
-                result = await self._resolve_one(query, suggestion, dest_dir)
-                if result is not None:
-                    resolved.append(result)
-            except Exception:
-                logger.warning("Failed to resolve suggestion %r — skipping", query, exc_info=True)
+        return [result for result in results if result is not None]
 
-        return resolved
+    async def _resolve_or_skip(
+        self,
+        query: str,
+        suggestion: dict[str, object],
+        dest_dir: Path,
+        downloads: dict[str, asyncio.Task[Path | None]],
+    ) -> dict[str, object] | None:
+        """Resolve one suggestion, logging and skipping it on any failure."""
+        try:
+            return await self._resolve_one(query, suggestion, dest_dir, downloads)
+        except Exception:
+            logger.warning("Failed to resolve suggestion %r — skipping", query, exc_info=True)
+            return None
 
     async def write_manifest(self, resolved: list[dict[str, object]], workspace: Path) -> Path:
         """Write resolved clips to ``external-clips.json`` atomically.
@@ -92,8 +113,13 @@ class ExternalClipResolver:
         query: str,
         suggestion: dict[str, object],
         dest_dir: Path,
+        downloads: dict[str, asyncio.Task[Path | None]],
     ) -> dict[str, object] | None:
-        """Search YouTube for a single query, download if found."""
+        """Search YouTube for a single query, download if found.
+
+        *downloads* holds the in-flight download per URL; the downloader names
+        files after the URL, so a second download of it would clobber the first.
+        """
         search_result = await self._search_youtube(query)
         if search_result is None:
             logger.debug("No YouTube result for %r", query)
@@ -102,7 +128,12 @@ class ExternalClipResolver:
         url = str(search_result["url"])
         duration = search_result.get("duration", 0)
 
-        local_path = await self._downloader.download(url, dest_dir)
+        download = downloads.get(url)
+        if download is None:
+            download = asyncio.create_task(self._downloader.download(url, dest_dir))
+            downloads[url] = download
+        # Shielded so one waiter being cancelled doesn't cancel the shared download
+        local_path = await asyncio.shield(download)
         if local_path is None:
             logger.debug("Download failed for %s", url)
             return None
@@ -182,10 +213,11 @@ class ExternalClipResolver:
         """Atomic write: write to tempfile then os.rename()."""
         parent = path.parent
         parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(data, indent=2).encode("utf-8")
         fd, tmp_path = tempfile.mkstemp(dir=str(parent), suffix=".tmp")
         try:
-            with os.fdopen(fd, "w") as f:
-                json.dump(data, f, indent=2)
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
             os.rename(tmp_path, str(path))
         except BaseException:
             with contextlib.suppress(OSError):
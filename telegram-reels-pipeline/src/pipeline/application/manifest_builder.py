@@ -53,20 +53,21 @@ class ManifestBuilder:
             ``(manifest, dropped)`` — the unified manifest and any clips
             dropped due to overlap resolution.
         """
-        # Resolve Veo3 placements via BrollPlacer
-        broll = await asyncio.to_thread(
-            self._broll_placer.resolve_placements,
-            workspace,
-            segments,
-            total_duration_s,
-        )
-
-        # Read external clips
-        external = await asyncio.to_thread(
-            self._read_external_clips,
-            workspace,
-            segments,
-            total_duration_s,
+        # Resolve Veo3 placements via BrollPlacer and read external clips
+        # concurrently — the two sources share no state
+        broll, external = await asyncio.gather(
+            asyncio.to_thread(
+                self._broll_placer.resolve_placements,
+                workspace,
+                segments,
+                total_duration_s,
+            ),
+            asyncio.to_thread(
+                self._read_external_clips,
+                workspace,
+                segments,
+                total_duration_s,
+            ),
         )
 
         # Merge via domain factory (handles overlap resolution + sorting)
@@ -129,10 +130,12 @@ class ManifestBuilder:
             "total_dropped": len(dropped),
         }
 
+        # Serialize up front so the temp file gets one buffered write, not one per JSON token
+        payload = json.dumps(data, indent=2).encode("utf-8")
         fd, tmp_path = tempfile.mkstemp(dir=str(workspace), suffix=".tmp")
         try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
             os.replace(tmp_path, str(manifest_path))
         except BaseException:
             with contextlib.suppress(OSError):
@@ -49,6 +49,9 @@ _STAGE_DISPATCH: dict[PipelineStage, tuple[str, str, str]] = {
     PipelineStage.DELIVERY: ("stage-08-delivery.md", "delivery", ""),
 }
 
+# Shared read-only view for stages that carry no elicitation context
+_EMPTY_ELICITATION: MappingProxyType[str, str] = MappingProxyType({})
+
 
 def _generate_run_id() -> RunId:
     """Generate a collision-resistant run ID with microseconds and random suffix."""
@@ -655,7 +658,7 @@ class PipelineRunner:
             step_file=step_file,
             agent_definition=agent_def,
             prior_artifacts=prior_artifacts,
-            elicitation_context=MappingProxyType(elicitation),
+            elicitation_context=MappingProxyType(elicitation) if elicitation else _EMPTY_ELICITATION,
         )
 
     async def _load_gate_criteria(self, gate_name: str) -> str:
@@ -2,8 +2,26 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 from pipeline.domain.models import AgentRequest
 
+# Step files and agent definitions are fixed for the life of the process but are
+# requested on every attempt of every stage. Cache their text per path, keyed on
+# mtime so edits made while the process is running are still picked up.
+_TEXT_CACHE: dict[Path, tuple[int, str]] = {}
+
+
+def _read_cached(path: Path) -> str:
+    """Return the text of *path*, reusing the cached copy while its mtime is unchanged."""
+    mtime_ns = path.stat().st_mtime_ns
+    cached = _TEXT_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    text = path.read_text()
+    _TEXT_CACHE[path] = (mtime_ns, text)
+    return text
+
 
 def build_agent_prompt(request: AgentRequest) -> str:
     """Construct a full prompt string from an AgentRequest.
@@ -14,11 +32,11 @@ def build_agent_prompt(request: AgentRequest) -> str:
     sections: list[str] = []
 
     # Stage requirements from the step file
-    step_content = request.step_file.read_text()
+    step_content = _read_cached(request.step_file)
     sections.append(f"## Stage Requirements\n\n{step_content}")
 
     # Agent definition (persona + knowledge)
-    agent_content = request.agent_definition.read_text()
+    agent_content = _read_cached(request.agent_definition)
     sections.append(f"## Agent Definition\n\n{agent_content}")
 
     # Prior artifacts (file paths, not inline content)
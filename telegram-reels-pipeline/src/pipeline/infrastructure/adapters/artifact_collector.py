@@ -8,7 +8,7 @@ from pathlib import Path
 _ARTIFACT_EXTENSIONS: frozenset[str] = frozenset({".md", ".json", ".txt", ".yaml", ".yml", ".mp4"})
 
 # Files written by the pipeline itself (not by agents) — excluded from collection
-_INTERNAL_FILES: frozenset[str] = frozenset({"command-history.json"})
+_INTERNAL_FILES: frozenset[str] = frozenset({"command-history.json", "command-history.jsonl"})
 
 
 def collect_artifacts(work_dir: Path) -> tuple[Path, ...]:
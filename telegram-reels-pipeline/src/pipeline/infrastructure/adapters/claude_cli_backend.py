@@ -21,6 +21,7 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT_SECONDS: float = 300.0
 DEFAULT_DISPATCH_TIMEOUT_SECONDS: float = 300.0
+DEFAULT_MAX_CONCURRENT_SUBPROCESSES: int = 4
 
 # Tools allowed for agent execution (stages that need bash, file I/O)
 AGENT_ALLOWED_TOOLS: tuple[str, ...] = ("Bash", "Read", "Write", "Edit", "Glob", "Grep")
@@ -30,6 +31,10 @@ class CliBackend:
     """Execute BMAD agents via ``claude -p`` subprocess.
 
     Satisfies both AgentExecutionPort and ModelDispatchPort protocols.
+
+    Agent and dispatch subprocesses share a semaphore so that concurrent
+    callers cannot spawn more than ``max_concurrent_subprocesses`` Claude
+    CLI processes at once.
     """
 
     if TYPE_CHECKING:
@@ -43,13 +48,17 @@ class CliBackend:
         dispatch_timeout_seconds: float = DEFAULT_DISPATCH_TIMEOUT_SECONDS,
         verbose: bool = False,
         qa_via_clink: bool = False,
+        max_concurrent_subprocesses: int = DEFAULT_MAX_CONCURRENT_SUBPROCESSES,
     ) -> None:
+        if max_concurrent_subprocesses < 1:
+            raise ValueError("max_concurrent_subprocesses must be at least 1")
         self._work_dir = work_dir
         self._timeout_seconds = timeout_seconds
         self._dispatch_timeout_seconds = dispatch_timeout_seconds
         self._workspace_override: Path | None = None
         self._verbose = verbose
         self._qa_via_clink = qa_via_clink
+        self._subprocess_slots = asyncio.Semaphore(max_concurrent_subprocesses)
 
     def set_workspace(self, workspace: Path | None) -> None:
         """Set per-run workspace override. Pass None to clear."""
@@ -65,31 +74,34 @@ class CliBackend:
 
         Raises AgentExecutionError on non-zero exit, timeout, or OS errors.
         """
-        start = time.monotonic()
         cwd = self.effective_work_dir
 
-        try:
-            prompt = build_agent_prompt(request)
-            proc = await asyncio.create_subprocess_exec(
-                "claude",
-                "-p",
-                "--allowedTools",
-                *AGENT_ALLOWED_TOOLS,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=str(cwd),
-            )
-            async with asyncio.timeout(self._timeout_seconds):
-                stdout_bytes, stderr_bytes = await proc.communicate(input=prompt.encode())
-        except TimeoutError as exc:
-            proc.kill()
-            await proc.wait()
-            raise AgentExecutionError(f"Agent {request.stage.value} timed out after {self._timeout_seconds}s") from exc
-        except FileNotFoundError as exc:
-            raise AgentExecutionError(f"Agent {request.stage.value} failed to prepare prompt: {exc}") from exc
-        except OSError as exc:
-            raise AgentExecutionError(f"Agent {request.stage.value} failed to start: {exc}") from exc
+        async with self._subprocess_slots:
+            start = time.monotonic()
+            try:
+                prompt = build_agent_prompt(request)
+                proc = await asyncio.create_subprocess_exec(
+                    "claude",
+                    "-p",
+                    "--allowedTools",
+                    *AGENT_ALLOWED_TOOLS,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=str(cwd),
+                )
+                async with asyncio.timeout(self._timeout_seconds):
+                    stdout_bytes, stderr_bytes = await proc.communicate(input=prompt.encode())
+            except TimeoutError as exc:
+                proc.kill()
+                await proc.wait()
+                raise AgentExecutionError(
+                    f"Agent {request.stage.value} timed out after {self._timeout_seconds}s"
+                ) from exc
+            except FileNotFoundError as exc:
+                raise AgentExecutionError(f"Agent {request.stage.value} failed to prepare prompt: {exc}") from exc
+            except OSError as exc:
+                raise AgentExecutionError(f"Agent {request.stage.value} failed to start: {exc}") from exc
 
         duration = time.monotonic() - start
         stdout = stdout_bytes.decode(errors="replace") if stdout_bytes else ""
@@ -177,24 +189,25 @@ class CliBackend:
         self, role: str, cli_args: list[str], prompt: str, cwd: Path
     ) -> str:
         """Run a dispatch subprocess and return stdout."""
-        try:
-            proc = await asyncio.create_subprocess_exec(
-                *cli_args,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=str(cwd),
-            )
-            async with asyncio.timeout(self._dispatch_timeout_seconds):
-                stdout_bytes, stderr_bytes = await proc.communicate(input=prompt.encode())
-        except TimeoutError as exc:
-            proc.kill()
-            await proc.wait()
-            raise AgentExecutionError(
-                f"Model dispatch ({role}) timed out after {self._dispatch_timeout_seconds}s"
-            ) from exc
-        except OSError as exc:
-            raise AgentExecutionError(f"Model dispatch ({role}) failed to start: {exc}") from exc
+        async with self._subprocess_slots:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cli_args,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=str(cwd),
+                )
+                async with asyncio.timeout(self._dispatch_timeout_seconds):
+                    stdout_bytes, stderr_bytes = await proc.communicate(input=prompt.encode())
+            except TimeoutError as exc:
+                proc.kill()
+                await proc.wait()
+                raise AgentExecutionError(
+                    f"Model dispatch ({role}) timed out after {self._dispatch_timeout_seconds}s"
+                ) from exc
+            except OSError as exc:
+                raise AgentExecutionError(f"Model dispatch ({role}) failed to start: {exc}") from exc
 
         returncode = proc.returncode if proc.returncode is not None else 0
         stdout = stdout_bytes.decode(errors="replace") if stdout_bytes else ""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from collections import OrderedDict
 from datetime import UTC, datetime
@@ -29,6 +30,7 @@ class TelegramPoller:
     - Validate YouTube URLs
     - Deduplicate by update_id (bounded LRU)
     - Enqueue valid requests via QueuePort
+    - Signal ``new_item_event`` (if given) so an idle consumer wakes immediately
     """
 
     def __init__(
@@ -36,12 +38,14 @@ class TelegramPoller:
         bot: TelegramBotAdapter,
         queue: QueuePort,
         authorized_chat_id: str,
+        new_item_event: asyncio.Event | None = None,
     ) -> None:
         self._bot = bot
         self._queue = queue
         self._authorized_chat_id = int(authorized_chat_id)
         self._last_update_id: int | None = None
         self._seen_update_ids: OrderedDict[int, None] = OrderedDict()
+        self._new_item_event = new_item_event
 
     async def poll_once(self) -> int:
         """Fetch new Telegram updates and process them.
@@ -111,6 +115,8 @@ class TelegramPoller:
             queued_at=datetime.now(UTC),
         )
         self._queue.enqueue(item)
+        if self._new_item_event is not None:
+            self._new_item_event.set()
         logger.info("Enqueued YouTube URL: %s (update_id=%d)", text, update_id)
 
         try:
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
@@ -79,6 +82,17 @@ class TestCreateOrchestrator:
         )
         assert isinstance(orch.delivery_handler, DeliveryHandler)
 
+    def test_orchestrator_is_slotted(self, tmp_path: Path) -> None:
+        orch = create_orchestrator(_settings(tmp_path))
+        assert not hasattr(orch, "__dict__")
+        with pytest.raises(AttributeError):
+            orch.not_a_component = None  # type: ignore[attr-defined]
+
+    def test_poller_shares_new_item_event(self, tmp_path: Path) -> None:
+        orch = create_orchestrator(_settings(tmp_path, telegram_token="tok", telegram_chat_id="123"))
+        assert orch.telegram_poller is not None
+        assert orch.telegram_poller._new_item_event is orch.new_item_event
+
     def test_event_bus_has_journal_listener(self, tmp_path: Path) -> None:
         orch = create_orchestrator(_settings(tmp_path))
         assert orch.event_bus.listener_count >= 1
@@ -96,3 +110,17 @@ class TestBootValidation:
     def test_raises_chat_id_without_token(self, tmp_path: Path) -> None:
         with pytest.raises(ConfigurationError, match="TELEGRAM_TOKEN"):
             create_orchestrator(_settings(tmp_path, telegram_token="", telegram_chat_id="123"))
+
+
+class TestLazyImports:
+    def test_import_does_not_load_telegram_library(self) -> None:
+        src_dir = Path(__file__).resolve().parents[3] / "src"
+        code = "import sys, pipeline.app.bootstrap; print('telegram' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": str(src_dir)},
+        )
+        assert result.stdout.strip() == "False"
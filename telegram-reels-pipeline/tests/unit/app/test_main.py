@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
-from pipeline.app.main import _process_item, _resume_interrupted_runs
+import pytest
+
+from pipeline.app.main import (
+    _idle_wait_seconds,
+    _process_item,
+    _resume_interrupted_runs,
+    _select_process_step,
+    _telegram_poll_loop,
+    _wait_for_new_item,
+)
 from pipeline.application.crash_recovery import RecoveryPlan
 from pipeline.domain.enums import EscalationState, PipelineStage, QAStatus
 from pipeline.domain.errors import PipelineError
@@ -130,6 +140,30 @@ class TestProcessItem:
         orch.queue_consumer.fail.assert_called_once()
 
 
+class TestSelectProcessStep:
+    async def test_unthrottled_step_processes_item(self) -> None:
+        orch = _make_orchestrator()
+        orch.resource_throttler = None
+        proc_path = Path("/tmp/queue/processing/item.json")
+
+        await _select_process_step(orch)(_make_item(), proc_path)
+
+        orch.queue_consumer.complete.assert_called_once_with(proc_path)
+
+    async def test_throttled_step_waits_for_resources_first(self) -> None:
+        orch = _make_orchestrator()
+        calls: list[str] = []
+        orch.resource_throttler = AsyncMock()
+        orch.resource_throttler.wait_for_resources.side_effect = lambda: calls.append("throttle")
+        orch.pipeline_runner.run.side_effect = lambda *_args: calls.append("run") or _make_completed_state()
+        proc_path = Path("/tmp/queue/processing/item.json")
+
+        await _select_process_step(orch)(_make_item(), proc_path)
+
+        assert calls == ["throttle", "run"]
+        orch.queue_consumer.complete.assert_called_once_with(proc_path)
+
+
 class TestResumeInterruptedRuns:
     async def test_skips_when_no_crash_recovery(self) -> None:
         orch = SimpleNamespace(crash_recovery=None, pipeline_runner=AsyncMock())
@@ -274,3 +308,99 @@ class TestResumeInterruptedRuns:
         await _resume_interrupted_runs(orch)
 
         assert pipeline_runner.resume.call_count == 2
+
+    async def test_resumes_only_plans_with_existing_workspace(self, tmp_path: Path) -> None:
+        present = tmp_path / "present"
+        present.mkdir()
+
+        def _plan(run_id: str, workspace_path: str) -> RecoveryPlan:
+            return RecoveryPlan(
+                run_state=RunState(
+                    run_id=RunId(run_id),
+                    youtube_url="https://youtube.com/watch?v=m",
+                    current_stage=PipelineStage.CONTENT,
+                    stages_completed=("router",),
+                    created_at=datetime.now(UTC).isoformat(),
+                    updated_at=datetime.now(UTC).isoformat(),
+                    workspace_path=workspace_path,
+                ),
+                resume_from=PipelineStage.CONTENT,
+                stages_remaining=(PipelineStage.CONTENT,),
+                stages_already_done=1,
+            )
+
+        plans = (
+            _plan("missing", str(tmp_path / "missing")),
+            _plan("blank", ""),
+            _plan("present", str(present)),
+        )
+        crash_recovery = AsyncMock()
+        crash_recovery.scan_and_recover.return_value = plans
+        pipeline_runner = AsyncMock()
+
+        orch = SimpleNamespace(crash_recovery=crash_recovery, pipeline_runner=pipeline_runner)
+
+        await _resume_interrupted_runs(orch)
+
+        pipeline_runner.resume.assert_called_once_with(plans[2].run_state, PipelineStage.CONTENT, present)
+
+
+class TestWaitForNewItem:
+    async def test_returns_promptly_when_event_set(self) -> None:
+        orch = SimpleNamespace(new_item_event=asyncio.Event())
+        orch.new_item_event.set()
+
+        assert await asyncio.wait_for(_wait_for_new_item(orch, timeout=30.0), timeout=1.0)
+
+        assert not orch.new_item_event.is_set()
+
+    async def test_wakes_when_event_set_during_wait(self) -> None:
+        orch = SimpleNamespace(new_item_event=asyncio.Event())
+        asyncio.get_running_loop().call_later(0.01, orch.new_item_event.set)
+
+        assert await asyncio.wait_for(_wait_for_new_item(orch, timeout=30.0), timeout=1.0)
+
+        assert not orch.new_item_event.is_set()
+
+    async def test_returns_after_timeout_without_signal(self) -> None:
+        orch = SimpleNamespace(new_item_event=asyncio.Event())
+
+        assert not await _wait_for_new_item(orch, timeout=0.01)
+
+        assert not orch.new_item_event.is_set()
+
+
+class TestIdleWaitSeconds:
+    def test_starts_at_base(self) -> None:
+        assert _idle_wait_seconds(0) == 2.0
+
+    def test_grows_with_idle_ticks(self) -> None:
+        assert _idle_wait_seconds(1) == 3.0
+        assert _idle_wait_seconds(2) == 4.5
+
+    def test_capped(self) -> None:
+        assert _idle_wait_seconds(20) == 60.0
+
+    def test_long_idle_does_not_overflow(self) -> None:
+        assert _idle_wait_seconds(10_000) == 60.0
+
+
+class TestTelegramPollLoop:
+    async def test_returns_immediately_without_poller(self) -> None:
+        orch = SimpleNamespace(telegram_poller=None)
+        await asyncio.wait_for(_telegram_poll_loop(orch), timeout=1.0)
+
+    async def test_keeps_polling_after_failure(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("pipeline.app.main._TELEGRAM_POLL_INTERVAL_SECONDS", 0.0)
+        poller = AsyncMock()
+        poller.poll_once.side_effect = [RuntimeError("network"), 0, 0]
+        orch = SimpleNamespace(telegram_poller=poller)
+
+        task = asyncio.create_task(_telegram_poll_loop(orch))
+        while poller.poll_once.await_count < 3:
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert poller.poll_once.await_count >= 3
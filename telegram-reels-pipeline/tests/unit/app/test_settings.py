@@ -7,7 +7,7 @@ from pathlib import Path
 import pytest
 from pydantic import ValidationError
 
-from pipeline.app.settings import PipelineSettings
+from pipeline.app.settings import PipelineSettings, get_settings, reset_settings
 
 
 class TestPipelineSettings:
@@ -39,6 +39,14 @@ class TestPipelineSettings:
         assert settings.telegram_token == ""
         assert settings.telegram_chat_id == ""
 
+    def test_max_concurrent_agents_default(self) -> None:
+        settings = PipelineSettings()
+        assert settings.max_concurrent_agents == 4
+
+    def test_max_concurrent_agents_below_min_raises(self) -> None:
+        with pytest.raises(ValidationError):
+            PipelineSettings(max_concurrent_agents=0)
+
     def test_framing_style_default(self) -> None:
         settings = PipelineSettings()
         assert settings.default_framing_style == "default"
@@ -77,3 +85,27 @@ class TestPipelineSettings:
     def test_publishing_variants_above_max_raises(self) -> None:
         with pytest.raises(ValidationError):
             PipelineSettings(publishing_description_variants=11)
+
+
+class TestGetSettings:
+    def test_returns_same_instance(self) -> None:
+        reset_settings()
+        try:
+            assert get_settings() is get_settings()
+        finally:
+            reset_settings()
+
+    def test_reset_reloads_from_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        reset_settings()
+        try:
+            monkeypatch.setenv("MIN_QA_SCORE", "55")
+            first = get_settings()
+            monkeypatch.setenv("MIN_QA_SCORE", "65")
+            assert get_settings().min_qa_score == 55
+
+            reset_settings()
+            second = get_settings()
+            assert second is not first
+            assert second.min_qa_score == 65
+        finally:
+            reset_settings()
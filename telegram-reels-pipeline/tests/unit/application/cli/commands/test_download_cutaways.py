@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -10,6 +11,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from pipeline.application.cli.commands.download_cutaways import (
+    DEFAULT_DOWNLOAD_ATTEMPTS,
     DownloadCutawaysCommand,
     _download_cutaway_clips,
     parse_cutaway_spec,
@@ -207,6 +209,7 @@ class TestDownloadCutawayClips:
                 tmp_path,
                 downloader,
                 prober,
+                backoff_s=0.0,
             )
         )
 
@@ -250,6 +253,7 @@ class TestDownloadCutawayClips:
                 tmp_path,
                 downloader,
                 prober,
+                backoff_s=0.0,
             )
         )
 
@@ -319,6 +323,7 @@ class TestDownloadCutawayClips:
                 tmp_path,
                 downloader,
                 prober,
+                backoff_s=0.0,
             )
         )
 
@@ -333,6 +338,25 @@ class TestDownloadCutawayClips:
         assert manifest == []
         assert json.loads((tmp_path / "external-clips.json").read_text()) == []
 
+    def test_cross_device_move_falls_back_to_copy(self, tmp_path: Path) -> None:
+        """When rename fails (e.g. EXDEV), the clip is copied and the source removed."""
+        clip = tmp_path / "raw.mp4"
+        clip.write_bytes(b"video-bytes")
+
+        with patch("shutil.os.rename", side_effect=OSError(18, "Invalid cross-device link")):
+            manifest = asyncio.run(
+                _download_cutaway_clips(
+                    ["https://example.com/video@30"],
+                    tmp_path,
+                    StubClipDownloader([clip]),
+                    StubDurationProber([5.0]),
+                )
+            )
+
+        assert len(manifest) == 1
+        assert (tmp_path / "external_clips" / "cutaway-0.mp4").read_bytes() == b"video-bytes"
+        assert not clip.exists()
+
     def test_downloader_receives_correct_url(self, tmp_path: Path) -> None:
         """Verify the downloader receives the parsed URL, not the full spec."""
         clips_dir = tmp_path / "external_clips"
@@ -356,6 +380,206 @@ class TestDownloadCutawayClips:
         assert downloader.download_calls[0][0] == "https://example.com/video"
 
 
+class TestDownloadCutawayClipsConcurrency:
+    """Downloads overlap up to the concurrency cap; results keep spec order."""
+
+    async def test_downloads_overlap_up_to_limit(self, tmp_path: Path) -> None:
+        in_flight = 0
+        peak = 0
+
+        class SlowDownloader:
+            async def download(self, url: str, dest_dir: Path) -> Path | None:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                clip = dest_dir / f"raw-{url.rsplit('/', 1)[-1]}"
+                clip.write_bytes(b"video")
+                return clip
+
+        specs = [f"https://example.com/{i}.mp4@{i}" for i in range(5)]
+        manifest = await _download_cutaway_clips(
+            specs, tmp_path, SlowDownloader(), StubDurationProber([1.0] * 5), max_concurrent=3
+        )
+
+        assert peak == 3
+        assert [e["clip_path"] for e in manifest] == [f"external_clips/cutaway-{i}.mp4" for i in range(5)]
+
+    async def test_download_exception_skips_only_that_clip(self, tmp_path: Path) -> None:
+        clip = tmp_path / "ok.mp4"
+        clip.write_bytes(b"video")
+
+        class FlakyDownloader:
+            async def download(self, url: str, dest_dir: Path) -> Path | None:
+                if "bad" in url:
+                    raise OSError("connection reset")
+                return clip
+
+        manifest = await _download_cutaway_clips(
+            ["https://example.com/bad.mp4@1", "https://example.com/good.mp4@2"],
+            tmp_path,
+            FlakyDownloader(),
+            StubDurationProber([4.0]),
+            backoff_s=0.0,
+        )
+
+        assert [e["url"] for e in manifest] == ["https://example.com/good.mp4"]
+        assert manifest[0]["clip_path"] == "external_clips/cutaway-1.mp4"
+
+    async def test_shared_url_downloaded_once_and_copied(self, tmp_path: Path) -> None:
+        class HashingDownloader:
+            """Names clips after the URL hash, like the yt-dlp adapter."""
+
+            def __init__(self) -> None:
+                self.urls: list[str] = []
+
+            async def download(self, url: str, dest_dir: Path) -> Path | None:
+                self.urls.append(url)
+                await asyncio.sleep(0)
+                clip = dest_dir / f"clip-{hashlib.sha256(url.encode()).hexdigest()[:8]}.mp4"
+                clip.write_bytes(url.encode())
+                return clip
+
+        downloader = HashingDownloader()
+        manifest = await _download_cutaway_clips(
+            ["https://example.com/a.mp4@5", "https://example.com/b.mp4@10", "https://example.com/a.mp4@20"],
+            tmp_path,
+            downloader,
+            StubDurationProber([3.0, 4.0, 3.0]),
+        )
+
+        assert sorted(downloader.urls) == ["https://example.com/a.mp4", "https://example.com/b.mp4"]
+        assert [e["clip_path"] for e in manifest] == [f"external_clips/cutaway-{i}.mp4" for i in range(3)]
+        clips_dir = tmp_path / "external_clips"
+        assert (clips_dir / "cutaway-0.mp4").read_bytes() == b"https://example.com/a.mp4"
+        assert (clips_dir / "cutaway-2.mp4").read_bytes() == b"https://example.com/a.mp4"
+        assert (clips_dir / "cutaway-1.mp4").read_bytes() == b"https://example.com/b.mp4"
+
+    async def test_probes_overlap(self, tmp_path: Path) -> None:
+        in_flight = 0
+        peak = 0
+
+        class SlowProber:
+            async def probe(self, clip_path: Path) -> float | None:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return None if clip_path.name == "cutaway-1.mp4" else 3.0
+
+        clips = []
+        for i in range(3):
+            clip = tmp_path / f"raw-{i}.mp4"
+            clip.write_bytes(b"video")
+            clips.append(clip)
+
+        manifest = await _download_cutaway_clips(
+            [f"https://example.com/{i}.mp4@{i}" for i in range(3)],
+            tmp_path,
+            StubClipDownloader(clips),
+            SlowProber(),
+        )
+
+        assert peak == 3
+        assert [e["clip_path"] for e in manifest] == ["external_clips/cutaway-0.mp4", "external_clips/cutaway-2.mp4"]
+
+    def test_rejects_non_positive_concurrency(self) -> None:
+        with pytest.raises(ValueError, match="at least 1"):
+            DownloadCutawaysCommand(
+                clip_downloader=StubClipDownloader([]),
+                duration_prober=StubDurationProber([]),
+                max_concurrent_downloads=0,
+            )
+
+
+class TestDownloadCutawayClipsRetry:
+    """Failed download attempts are retried with backoff."""
+
+    async def test_retries_after_none_and_exception(self, tmp_path: Path) -> None:
+        clip = tmp_path / "raw.mp4"
+        clip.write_bytes(b"video")
+        outcomes: list[object] = [None, OSError("reset"), clip]
+
+        class TransientDownloader:
+            calls = 0
+
+            async def download(self, url: str, dest_dir: Path) -> Path | None:
+                self.calls += 1
+                outcome = outcomes.pop(0)
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome  # type: ignore[return-value]
+
+        downloader = TransientDownloader()
+        manifest = await _download_cutaway_clips(
+            ["https://example.com/v.mp4@5"],
+            tmp_path,
+            downloader,
+            StubDurationProber([2.0]),
+            attempts=3,
+            backoff_s=0.0,
+        )
+
+        assert downloader.calls == 3
+        assert len(manifest) == 1
+
+    async def test_gives_up_after_attempts(self, tmp_path: Path) -> None:
+        downloader = StubClipDownloader([None, None, None, None])
+
+        manifest = await _download_cutaway_clips(
+            ["https://example.com/v.mp4@5"],
+            tmp_path,
+            downloader,
+            StubDurationProber([]),
+            attempts=3,
+            backoff_s=0.0,
+        )
+
+        assert manifest == []
+        assert len(downloader.download_calls) == 3
+
+    async def test_retries_by_default(self, tmp_path: Path) -> None:
+        downloader = StubClipDownloader([])
+
+        await _download_cutaway_clips(
+            ["https://example.com/v.mp4@5"],
+            tmp_path,
+            downloader,
+            StubDurationProber([]),
+            backoff_s=0.0,
+        )
+
+        assert len(downloader.download_calls) == DEFAULT_DOWNLOAD_ATTEMPTS
+
+    async def test_backoff_doubles_between_attempts(self, tmp_path: Path) -> None:
+        sleeps: list[float] = []
+
+        async def _record_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        with patch("pipeline.application.cli.commands.download_cutaways.asyncio.sleep", _record_sleep):
+            await _download_cutaway_clips(
+                ["https://example.com/v.mp4@5"],
+                tmp_path,
+                StubClipDownloader([]),
+                StubDurationProber([]),
+                attempts=3,
+                backoff_s=1.0,
+            )
+
+        assert sleeps == [1.0, 2.0]
+
+    def test_rejects_non_positive_attempts(self) -> None:
+        with pytest.raises(ValueError, match="at least 1"):
+            DownloadCutawaysCommand(
+                clip_downloader=StubClipDownloader([]),
+                duration_prober=StubDurationProber([]),
+                download_attempts=0,
+            )
+
+
 # ---------------------------------------------------------------------------
 # Atomic write tests
 # ---------------------------------------------------------------------------
@@ -383,7 +607,7 @@ class TestDownloadCutawayClipsAtomicWrite:
                 return_value=("https://example.com/vid", 10.0),
             ),
             patch(
-                "pipeline.application.cli.commands.download_cutaways.os.replace",
+                "pipeline.application.cli.atomic_io.os.replace",
                 side_effect=OSError("disk full"),
             ),
             pytest.raises(OSError, match="disk full"),
@@ -6,6 +6,7 @@ import asyncio
 import json
 import os
 import time
+from collections.abc import Iterator
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -48,6 +49,18 @@ class _StubInputReader:
         return answer
 
 
+class _StubBatchInputReader(_StubInputReader):
+    """Stub reader that also answers all prompts in one ``read_many`` call."""
+
+    def __init__(self, answers: list[str | None]) -> None:
+        super().__init__(answers)
+        self.batches: list[tuple[list[str], int]] = []
+
+    async def read_many(self, prompts: list[str], timeout: int) -> list[str | None]:
+        self.batches.append((prompts, timeout))
+        return self._answers[: len(prompts)]
+
+
 def _make_reflection_result(
     escalation_needed: bool = False,
     artifacts: tuple[Path, ...] = (),
@@ -102,6 +115,12 @@ def _make_stage_runner_mock(
 
 
 class TestIsInteractive:
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self) -> Iterator[None]:
+        is_interactive.cache_clear()
+        yield
+        is_interactive.cache_clear()
+
     def test_returns_true_when_tty(self) -> None:
         import sys as _sys
 
@@ -123,6 +142,15 @@ class TestIsInteractive:
         with patch.object(_sys, "stdin", mock_stdin):
             assert is_interactive() is False
 
+    def test_result_is_cached(self) -> None:
+        import sys as _sys
+
+        with patch.object(_sys, "stdin") as mock_stdin:
+            mock_stdin.isatty.return_value = True
+            assert is_interactive() is True
+            assert is_interactive() is True
+        assert mock_stdin.isatty.call_count == 1
+
 
 # ---------------------------------------------------------------------------
 # find_router_output
@@ -182,6 +210,25 @@ class TestFindRouterOutput:
         result = find_router_output((), workspace, min_mtime=time.time())
         assert result is None
 
+    def test_stale_workspace_artifact_stat_only_once(self, tmp_path: Path) -> None:
+        ws_file = _write_router_output(tmp_path)
+        old_time = time.time() - 3600
+        os.utime(ws_file, (old_time, old_time))
+        other = tmp_path / "notes.md"
+
+        real_stat = os.stat
+        stat_calls: list[Path] = []
+
+        def _counting_stat(path: Path) -> os.stat_result:
+            stat_calls.append(path)
+            return real_stat(path)
+
+        with patch("pipeline.application.cli.commands.run_elicitation.os.stat", _counting_stat):
+            result = find_router_output((other, ws_file), tmp_path, min_mtime=time.time())
+
+        assert result is None
+        assert stat_calls == [ws_file]
+
 
 # ---------------------------------------------------------------------------
 # parse_router_output
@@ -213,6 +260,16 @@ class TestParseRouterOutput:
         f.write_bytes(b"\xff\xfe" + b"\x00" * 10)
         assert parse_router_output((), tmp_path) is None
 
+    def test_handles_invalid_utf8_inside_json(self, tmp_path: Path) -> None:
+        f = tmp_path / "router-output.json"
+        f.write_bytes(b'{"url": "\xff"}')
+        assert parse_router_output((), tmp_path) is None
+
+    def test_parses_utf8_bom(self, tmp_path: Path) -> None:
+        f = tmp_path / "router-output.json"
+        f.write_bytes(b"\xef\xbb\xbf" + json.dumps({"url": "https://yt.com"}).encode())
+        assert parse_router_output((), tmp_path) == {"url": "https://yt.com"}
+
 
 # ---------------------------------------------------------------------------
 # validate_questions
@@ -273,6 +330,18 @@ class TestCollectElicitationAnswers:
         result = asyncio.run(collect_elicitation_answers(["Q1?"], reader))
         assert result == {}
 
+    def test_batch_reader_answers_all_questions_in_one_call(self) -> None:
+        reader = _StubBatchInputReader(["answer1", "", "answer3"])
+        result = asyncio.run(collect_elicitation_answers(["Q1?", "Q2?", "Q3?"], reader, timeout=10))
+        assert result == {"Q1?": "answer1", "Q3?": "answer3"}
+        assert reader.batches == [(["Q1?", "Q2?", "Q3?"], 30)]
+        assert reader._call_count == 0
+
+    def test_batch_reader_stops_at_cancelled_answer(self) -> None:
+        reader = _StubBatchInputReader(["answer1", None, "answer3"])
+        result = asyncio.run(collect_elicitation_answers(["Q1?", "Q2?", "Q3?"], reader))
+        assert result == {"Q1?": "answer1"}
+
 
 # ---------------------------------------------------------------------------
 # save_elicitation_context
@@ -406,6 +475,10 @@ class TestRunElicitationCommand:
 
         assert cmd_result.success is True
         assert runner.run_stage.await_count == 2
+        first_request = runner.run_stage.await_args_list[0].args[0]
+        second_request = runner.run_stage.await_args_list[1].args[0]
+        assert "elicitation_answers" not in first_request.elicitation_context
+        assert json.loads(second_request.elicitation_context["elicitation_answers"]) == {"What URL?": "https://yt.com"}
         # Answers persisted via finally block
         assert (tmp_path / "elicitation-context.json").exists()
         saved = json.loads((tmp_path / "elicitation-context.json").read_text())
@@ -2,17 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
+from pathlib import Path
 from types import MappingProxyType
 from unittest.mock import MagicMock
 
 import pytest
 
-from pipeline.application.cli.commands.run_pipeline import RunPipelineCommand
+from pipeline.application.cli.commands.run_pipeline import (
+    CUTAWAY_CONSUMER_STAGE,
+    RunPipelineCommand,
+    _print_footer,
+)
 from pipeline.application.cli.context import PipelineContext
 from pipeline.application.cli.history import CommandHistory
 from pipeline.application.cli.invoker import PipelineInvoker
 from pipeline.application.cli.protocols import CommandResult
+from pipeline.domain.enums import PipelineStage
 
 # --- Helpers ---
 
@@ -131,6 +138,144 @@ class TestRunPipelineCommandDownload:
         assert "download error" in result.message
 
 
+@dataclass
+class _RecordingStageCommand:
+    """Stage stub that records which stage ran and releases a gate on the first call."""
+
+    order: list[object]
+    started: asyncio.Event
+
+    @property
+    def name(self) -> str:
+        return "stage"
+
+    async def execute(self, context: PipelineContext) -> CommandResult:
+        self.started.set()
+        self.order.append(context.state.stage_spec[0])
+        return _ok()
+
+
+@dataclass
+class _GatedDownloadCommand:
+    """Download stub that only finishes once a stage has started."""
+
+    order: list[object]
+    started: asyncio.Event
+
+    @property
+    def name(self) -> str:
+        return "download"
+
+    async def execute(self, context: PipelineContext) -> CommandResult:
+        await self.started.wait()
+        self.order.append("download")
+        return _ok()
+
+
+class TestRunPipelineCommandDownloadOverlap:
+    @pytest.mark.asyncio
+    async def test_download_overlaps_early_stages_and_joins_before_consumer(self) -> None:
+        order: list[object] = []
+        started = asyncio.Event()
+        stage_cmd = _RecordingStageCommand(order, started)
+        cmd = RunPipelineCommand(
+            invoker=PipelineInvoker(history=CommandHistory()),
+            validate_cmd=_StubCommand(_name="validate"),
+            setup_cmd=_StubCommand(_name="setup"),
+            download_cmd=_GatedDownloadCommand(order, started),
+            elicitation_cmd=stage_cmd,
+            stage_cmd=stage_cmd,
+        )
+
+        result = await asyncio.wait_for(cmd.execute(_make_context()), timeout=5)
+
+        assert result.success is True
+        assert order[0] is PipelineStage.ROUTER
+        assert order.index("download") < order.index(CUTAWAY_CONSUMER_STAGE)
+
+    @pytest.mark.asyncio
+    async def test_download_failure_reported_when_consumer_stage_not_run(self) -> None:
+        cmd = _make_pipeline(download=_fail("download error"))
+        ctx = _make_context()
+        ctx.state.stages = 2
+        result = await cmd.execute(ctx)
+        assert result.success is False
+        assert "download error" in result.message
+
+    @pytest.mark.asyncio
+    async def test_pending_download_cancelled_when_stage_raises(self) -> None:
+        class _HangingDownload:
+            name = "download"
+
+            async def execute(self, context: PipelineContext) -> CommandResult:
+                await asyncio.Event().wait()
+                return _ok()
+
+        cmd = RunPipelineCommand(
+            invoker=PipelineInvoker(history=CommandHistory()),
+            validate_cmd=_StubCommand(_name="validate"),
+            setup_cmd=_StubCommand(_name="setup"),
+            download_cmd=_HangingDownload(),
+            elicitation_cmd=_StubCommand(_name="elicitation", _error=RuntimeError("boom")),
+            stage_cmd=_StubCommand(_name="stage"),
+        )
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await cmd.execute(_make_context())
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+class TestRunPipelineCommandBackgroundHooks:
+    @pytest.mark.asyncio
+    async def test_waits_for_background_hooks_before_footer(self) -> None:
+        finished: list[str] = []
+
+        async def _hook() -> None:
+            await asyncio.sleep(0)
+            finished.append("hook")
+
+        ctx = _make_context()
+        ctx.state.stages = 0
+        ctx.state.background_hook_tasks.add(asyncio.create_task(_hook()))
+        result = await _make_pipeline().execute(ctx)
+
+        assert result.success is True
+        assert finished == ["hook"]
+
+    @pytest.mark.asyncio
+    async def test_cancels_background_hooks_after_grace_period(self) -> None:
+        ctx = _make_context()
+        ctx.state.stages = 0
+        task = asyncio.create_task(asyncio.Event().wait())
+        ctx.state.background_hook_tasks.add(task)
+        cmd = RunPipelineCommand(
+            invoker=PipelineInvoker(history=CommandHistory()),
+            validate_cmd=_StubCommand(_name="validate"),
+            setup_cmd=_StubCommand(_name="setup"),
+            download_cmd=_StubCommand(_name="download"),
+            elicitation_cmd=_StubCommand(_name="elicitation"),
+            stage_cmd=_StubCommand(_name="stage"),
+            hook_grace_seconds=0.01,
+        )
+
+        result = await cmd.execute(ctx)
+
+        assert result.success is True
+        assert task.cancelled()
+
+    def test_rejects_negative_grace(self) -> None:
+        with pytest.raises(ValueError, match="hook_grace_seconds must be non-negative"):
+            RunPipelineCommand(
+                invoker=PipelineInvoker(history=CommandHistory()),
+                validate_cmd=_StubCommand(_name="validate"),
+                setup_cmd=_StubCommand(_name="setup"),
+                download_cmd=_StubCommand(_name="download"),
+                elicitation_cmd=_StubCommand(_name="elicitation"),
+                stage_cmd=_StubCommand(_name="stage"),
+                hook_grace_seconds=-1.0,
+            )
+
+
 class TestRunPipelineCommandHappyPath:
     @pytest.mark.asyncio
     async def test_full_pipeline_success(self, tmp_path: object) -> None:
@@ -141,3 +286,41 @@ class TestRunPipelineCommandHappyPath:
         result = await cmd.execute(ctx)
         assert result.success is True
         assert "completed" in result.message.lower()
+
+
+class TestPrintFooter:
+    def test_lists_nested_files_sorted_with_sizes(self, tmp_path: Path) -> None:
+        (tmp_path / "a").mkdir()
+        (tmp_path / "a-b").mkdir()
+        (tmp_path / "a" / "x.json").write_text("12")
+        (tmp_path / "a-b" / "y.mp4").write_bytes(b"12345")
+        (tmp_path / "top.md").write_text("")
+        lines: list[str] = []
+
+        _print_footer(_make_context(workspace=tmp_path), 1.0, output=lines.append)
+
+        assert lines[-1].splitlines() == [
+            "  Workspace contents:",
+            "    a/x.json (2 bytes)",
+            "    a-b/y.mp4 (5 bytes)",
+            "    top.md (0 bytes)",
+        ]
+
+    def test_truncates_listing_to_first_entries_by_path(self, tmp_path: Path) -> None:
+        for name in ("d.txt", "b.txt", "a.txt", "c.txt"):
+            (tmp_path / name).write_text("x")
+        lines: list[str] = []
+
+        _print_footer(_make_context(workspace=tmp_path), 1.0, output=lines.append, max_entries=2)
+
+        assert lines[-1].splitlines() == [
+            "  Workspace contents:",
+            "    a.txt (1 bytes)",
+            "    b.txt (1 bytes)",
+            "    ... and 2 more file(s)",
+        ]
+
+    def test_skips_listing_without_workspace(self) -> None:
+        lines: list[str] = []
+        _print_footer(_make_context(), 1.0, output=lines.append)
+        assert not any("Workspace contents:" in line for line in lines)
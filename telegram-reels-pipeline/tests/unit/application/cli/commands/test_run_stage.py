@@ -9,9 +9,15 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from pipeline.application.cli.commands.run_stage import RunStageCommand
+from pipeline.application.cli.commands.run_stage import RunStageCommand, print_stage_result
 from pipeline.application.cli.context import PipelineState
-from pipeline.application.cli.stage_registry import stage_name
+from pipeline.application.cli.stage_registry import (
+    ORDERED_STAGE_SIGNATURES,
+    STAGE_SIGNATURES,
+    TOTAL_CLI_STAGES,
+    stage_name,
+    stage_paths,
+)
 from pipeline.domain.enums import PipelineStage, QADecision
 from pipeline.domain.models import QACritique, ReflectionResult
 from pipeline.domain.types import GateName
@@ -63,9 +69,11 @@ class _StubHook:
         self._target_stage = target_stage
         self._target_phase = target_phase
         self.execute_count = 0
+        self.should_run_count = 0
         self.last_context: object = None
 
     def should_run(self, stage: PipelineStage, phase: Literal["pre", "post"]) -> bool:
+        self.should_run_count += 1
         if self._target_stage is not None and stage != self._target_stage:
             return False
         return not (self._target_phase is not None and phase != self._target_phase)
@@ -92,6 +100,24 @@ def _make_context(
     return ctx
 
 
+# ---------------------------------------------------------------------------
+# print_stage_result
+# ---------------------------------------------------------------------------
+
+
+class TestPrintStageResult:
+    def test_emits_summary_in_single_output_call(self, tmp_path: Path) -> None:
+        output = MagicMock()
+        artifacts = (tmp_path / "a.json", tmp_path / "b.md")
+        print_stage_result(PipelineStage.RESEARCH, _make_reflection_result(), artifacts, 1.25, output=output)
+
+        output.assert_called_once()
+        lines = output.call_args.args[0].split("\n")
+        assert lines[0] == "  [RESEARCH] Done in 1.2s"
+        assert "    Artifacts: 2" in lines
+        assert lines[-2:] == ["      - a.json", "      - b.md"]
+
+
 # ---------------------------------------------------------------------------
 # stage_name
 # ---------------------------------------------------------------------------
@@ -111,6 +137,24 @@ class TestStageName:
         assert stage_name(0) == "stage-0"
 
 
+class TestStagePaths:
+    def test_resolves_under_project_root(self, tmp_path: Path) -> None:
+        step_file, agent_def = stage_paths(tmp_path, "stage-02-research.md", "research")
+        assert step_file == tmp_path / "workflows" / "stages" / "stage-02-research.md"
+        assert agent_def == tmp_path / "agents" / "research" / "agent.md"
+
+    def test_repeat_lookups_reuse_resolved_paths(self, tmp_path: Path) -> None:
+        first = stage_paths(tmp_path, "stage-01-router.md", "router")
+        assert stage_paths(tmp_path, "stage-01-router.md", "router") is first
+
+
+class TestOrderedStageSignatures:
+    def test_matches_signature_mapping(self) -> None:
+        assert len(ORDERED_STAGE_SIGNATURES) == TOTAL_CLI_STAGES
+        for stage_num, signatures in enumerate(ORDERED_STAGE_SIGNATURES, 1):
+            assert signatures == STAGE_SIGNATURES[stage_num]
+
+
 # ---------------------------------------------------------------------------
 # RunStageCommand — happy path
 # ---------------------------------------------------------------------------
@@ -134,6 +178,36 @@ class TestRunStageCommandHappyPath:
         assert cmd_result.data["score"] == 85
         assert runner.run_stage.await_count == 1
 
+    def test_reuses_frozen_elicitation_view(self, tmp_path: Path) -> None:
+        """Non-Content stages pass the run's frozen view through without copying."""
+        runner = _make_mock_runner(_make_reflection_result())
+        ctx = _make_context(tmp_path)
+        ctx.state.instructions = "keep it short"
+        ctx.state.elicitation_view = ctx.state.build_elicitation_view()
+
+        asyncio.run(RunStageCommand(stage_runner=runner).execute(ctx))
+
+        request = runner.run_stage.await_args.args[0]
+        assert request.elicitation_context is ctx.state.elicitation_view
+
+    def test_content_stage_adds_publishing_settings(self, tmp_path: Path) -> None:
+        runner = _make_mock_runner(_make_reflection_result())
+        ctx = _make_context(tmp_path, stage=PipelineStage.CONTENT, stage_num=4, gate_name="content")
+        ctx.settings.publishing_language = "pt-BR"
+        ctx.settings.publishing_description_variants = 3
+        ctx.state.instructions = "keep it short"
+        ctx.state.elicitation_view = ctx.state.build_elicitation_view()
+
+        asyncio.run(RunStageCommand(stage_runner=runner).execute(ctx))
+
+        request = runner.run_stage.await_args.args[0]
+        assert dict(request.elicitation_context) == {
+            "instructions": "keep it short",
+            "publishing_language": "pt-BR",
+            "publishing_description_variants": "3",
+        }
+        assert "publishing_language" not in ctx.state.elicitation_view
+
 
 # ---------------------------------------------------------------------------
 # RunStageCommand — hooks
@@ -154,6 +228,18 @@ class TestRunStageCommandHooks:
 
         assert hook.execute_count == 1
 
+    def test_should_run_asked_once_per_stage_and_phase(self, tmp_path: Path) -> None:
+        """Matching hooks are cached, so repeat runs of a stage skip should_run."""
+        runner = _make_mock_runner(_make_reflection_result())
+        hook = _StubHook(target_stage=PipelineStage.RESEARCH, target_phase="pre")
+        cmd = RunStageCommand(stage_runner=runner, hooks=(hook,))
+
+        for _ in range(3):
+            asyncio.run(cmd.execute(_make_context(tmp_path, stage=PipelineStage.RESEARCH)))
+
+        assert hook.execute_count == 3
+        assert hook.should_run_count == 2  # one "pre" and one "post" lookup
+
     def test_post_hook_fires_for_correct_stage(self, tmp_path: Path) -> None:
         """Post-hook fires when should_run returns True for the stage."""
         result = _make_reflection_result()
@@ -199,6 +285,30 @@ class TestRunStageCommandHooks:
         assert hook_match_post.execute_count == 1
         assert hook_miss.execute_count == 0
 
+    def test_hooks_for_same_phase_run_sequentially_in_order(self, tmp_path: Path) -> None:
+        """A later hook starts only after the earlier matching hook has finished."""
+        events: list[str] = []
+
+        class _OrderedHook:
+            def __init__(self, label: str) -> None:
+                self._label = label
+
+            def should_run(self, stage: PipelineStage, phase: Literal["pre", "post"]) -> bool:
+                return stage == PipelineStage.ASSEMBLY and phase == "pre"
+
+            async def execute(self, context: object) -> None:
+                events.append(f"{self._label}-start")
+                await asyncio.sleep(0)
+                events.append(f"{self._label}-end")
+
+        runner = _make_mock_runner(_make_reflection_result())
+        cmd = RunStageCommand(stage_runner=runner, hooks=(_OrderedHook("await"), _OrderedHook("manifest")))
+        ctx = _make_context(tmp_path, stage=PipelineStage.ASSEMBLY)
+
+        asyncio.run(cmd.execute(ctx))
+
+        assert events == ["await-start", "await-end", "manifest-start", "manifest-end"]
+
     def test_post_hooks_fire_on_failure(self, tmp_path: Path) -> None:
         """Post-hooks still fire when the stage raises an exception."""
         runner = _make_mock_runner_raises(RuntimeError("stage crashed"))
@@ -225,6 +335,57 @@ class TestRunStageCommandHooks:
         assert cmd_result.success is True
 
 
+class _BlockingHook(_StubHook):
+    """Post-hook that stays running until ``release`` is set."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        super().__init__(target_stage=PipelineStage.RESEARCH, target_phase="post")
+        self.release = asyncio.Event()
+        self._error = error
+
+    async def execute(self, context: object) -> None:
+        await self.release.wait()
+        await super().execute(context)
+        if self._error is not None:
+            raise self._error
+
+
+class TestRunStageCommandBackgroundHooks:
+    def test_stage_returns_without_waiting_for_background_hook(self, tmp_path: Path) -> None:
+        runner = _make_mock_runner(_make_reflection_result())
+        hook = _BlockingHook()
+        cmd = RunStageCommand(stage_runner=runner, background_hooks=(hook,))
+        ctx = _make_context(tmp_path)
+
+        async def _run() -> None:
+            cmd_result = await cmd.execute(ctx)
+            assert cmd_result.success is True
+            assert hook.execute_count == 0
+            (task,) = ctx.state.background_hook_tasks
+            hook.release.set()
+            await task
+            assert hook.execute_count == 1
+            assert not ctx.state.background_hook_tasks
+
+        asyncio.run(_run())
+
+    def test_background_hook_failure_is_logged(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        runner = _make_mock_runner(_make_reflection_result())
+        hook = _BlockingHook(error=RuntimeError("webhook down"))
+        cmd = RunStageCommand(stage_runner=runner, background_hooks=(hook,))
+        ctx = _make_context(tmp_path)
+
+        async def _run() -> None:
+            await cmd.execute(ctx)
+            (task,) = ctx.state.background_hook_tasks
+            hook.release.set()
+            await task
+
+        asyncio.run(_run())
+
+        assert "Background hook _BlockingHook failed" in caplog.text
+
+
 # ---------------------------------------------------------------------------
 # RunStageCommand — escalation
 # ---------------------------------------------------------------------------
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -50,6 +50,23 @@ class TestPrintResumePreflight:
         out = capsys.readouterr().out
         assert "Stage 1 (router): missing" in out
 
+    def test_report_emitted_as_single_block(self, tmp_path: Path) -> None:
+        (tmp_path / "encoding-plan.json").write_text("{}")
+        lines: list[str] = []
+        print_resume_preflight(tmp_path, start_stage=7, output=lines.append)
+        assert len(lines) == 1
+        report = lines[0].splitlines()
+        assert report[0] == "  Workspace artifact check:"
+        assert report[6] == "       Stage 6 (ffmpeg-engineer): ok [encoding-plan.json]"
+        assert report[7] == "    >> Stage 7 (assembly): missing"
+        assert lines[0].endswith("\n")
+
+    def test_uses_file_name_snapshot(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        """A snapshot from ValidateArgs is trusted instead of re-scanning the workspace."""
+        print_resume_preflight(tmp_path, start_stage=2, file_names=frozenset({"router-output.json"}))
+        out = capsys.readouterr().out
+        assert "Stage 1 (router): ok [router-output.json]" in out
+
 
 # ---------------------------------------------------------------------------
 # SetupWorkspaceCommand — new workspace creation
@@ -107,6 +124,39 @@ class TestSetupWorkspaceCommandResume:
         assert result.success is True
         assert len(ctx.artifacts) == 2
 
+    def test_resume_artifacts_sorted_files_only(self, tmp_path: Path) -> None:
+        workspace = tmp_path / "ws"
+        workspace.mkdir()
+        (workspace / "b.json").write_text("{}")
+        (workspace / "a.json").write_text("{}")
+        (workspace / "assets").mkdir()
+        ctx = _make_context(resume_workspace=str(workspace))
+        ctx.state.start_stage = 2
+        asyncio.run(SetupWorkspaceCommand(workspace_base=tmp_path).execute(ctx))
+        assert ctx.artifacts == (workspace / "a.json", workspace / "b.json")
+
+    def test_resume_reuses_validate_snapshot(self, tmp_path: Path) -> None:
+        workspace = tmp_path / "ws"
+        workspace.mkdir()
+        ctx = _make_context(resume_workspace=str(workspace))
+        ctx.state.start_stage = 2
+        ctx.state.resume_file_names = frozenset({"router-output.json"})
+        asyncio.run(SetupWorkspaceCommand(workspace_base=tmp_path).execute(ctx))
+        assert ctx.artifacts == (workspace / "router-output.json",)
+
+    def test_resume_scans_workspace_off_the_event_loop(self, tmp_path: Path) -> None:
+        workspace = tmp_path / "ws"
+        workspace.mkdir()
+        (workspace / "router-output.json").write_text("{}")
+        ctx = _make_context(resume_workspace=str(workspace))
+        ctx.state.start_stage = 2
+        with patch(
+            "pipeline.application.cli.commands.setup_workspace.asyncio.to_thread", wraps=asyncio.to_thread
+        ) as to_thread:
+            asyncio.run(SetupWorkspaceCommand(workspace_base=tmp_path).execute(ctx))
+        to_thread.assert_called_once()
+        assert ctx.artifacts == (workspace / "router-output.json",)
+
     def test_resume_start_stage_1_no_artifacts_loaded(self, tmp_path: Path) -> None:
         workspace = tmp_path / "ws"
         workspace.mkdir()
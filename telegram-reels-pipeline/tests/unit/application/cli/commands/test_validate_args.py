@@ -7,7 +7,10 @@ import asyncio
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pytest
+
 from pipeline.application.cli.commands.validate_args import (
+    STYLE_MAP,
     ValidateArgsCommand,
     compute_moments_requested,
     detect_resume_stage,
@@ -154,6 +157,10 @@ class TestDetectResumeStage:
         (tmp_path / "transcript_clean.txt").write_text("text")
         assert detect_resume_stage(tmp_path) == 2
 
+    def test_uses_file_name_snapshot_without_scanning(self, tmp_path: Path) -> None:
+        missing = tmp_path / "not-created"
+        assert detect_resume_stage(missing, frozenset({"router-output.json"})) == 2
+
 
 # ---------------------------------------------------------------------------
 # ValidateArgsCommand — valid defaults
@@ -202,6 +209,14 @@ class TestValidateArgsCommandResume:
         result = asyncio.run(cmd.execute(ctx))
         assert result.success is True
 
+    def test_resume_stores_workspace_file_snapshot(self, tmp_path: Path) -> None:
+        (tmp_path / "router-output.json").write_text("{}")
+        ctx = _make_context()
+        ctx.state.args = _make_args(resume=tmp_path)
+        asyncio.run(ValidateArgsCommand().execute(ctx))
+        assert ctx.state.resume_file_names == frozenset({"router-output.json"})
+        assert ctx.state.start_stage == 2
+
     def test_resume_file_not_dir_fails(self, tmp_path: Path) -> None:
         f = tmp_path / "somefile.txt"
         f.write_text("not a dir")
@@ -470,6 +485,10 @@ class TestValidateArgsCommandStyle:
         assert result.success is True
         assert ctx.state.framing_style is None
 
+    def test_style_map_is_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            STYLE_MAP["split"] = "pip"  # type: ignore[index]
+
     def test_style_stored_in_context(self) -> None:
         ctx = _make_context()
         ctx.state.args = _make_args(style="auto")
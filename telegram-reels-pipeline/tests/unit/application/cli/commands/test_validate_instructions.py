@@ -100,6 +100,19 @@ class TestValidateInstructionsNonEmpty:
         # Assert
         assert ctx.state.instructions == "overlay a logo at 5s"
 
+    def test_instructions_frozen_into_elicitation_view(self) -> None:
+        # Arrange
+        ctx = _make_context()
+        ctx.state.elicitation = {"topic": "ai"}
+        ctx.state.args = _make_args(instructions="overlay a logo at 5s")
+        cmd = ValidateArgsCommand()
+
+        # Act
+        asyncio.run(cmd.execute(ctx))
+
+        # Assert
+        assert ctx.state.elicitation_view == {"topic": "ai", "instructions": "overlay a logo at 5s"}
+
     def test_instructions_stripped_before_storage(self) -> None:
         # Arrange
         ctx = _make_context()
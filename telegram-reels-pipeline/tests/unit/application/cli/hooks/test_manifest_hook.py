@@ -107,10 +107,10 @@ class TestManifestBuildHookExecute:
         fake_builder.write_manifest = AsyncMock(return_value=tmp_path / "cutaway-manifest.json")
 
         with patch(
-            "pipeline.application.manifest_builder.ManifestBuilder",
+            "pipeline.application.cli.hooks.manifest_hook.ManifestBuilder",
             return_value=fake_builder,
         ), patch(
-            "pipeline.application.broll_placer.BrollPlacer",
+            "pipeline.application.cli.hooks.manifest_hook.BrollPlacer",
         ):
             await hook.execute(ctx)
 
@@ -142,6 +142,16 @@ class TestManifestBuildHookExecute:
         # Should not raise
         await hook.execute(ctx)
 
+    @pytest.mark.asyncio
+    async def test_execute_with_invalid_utf8(self, tmp_path: Path) -> None:
+        """execute treats an undecodable plan like invalid JSON."""
+        (tmp_path / "encoding-plan.json").write_bytes(b'{"commands": "\xff"}')
+        hook = ManifestBuildHook()
+        ctx = _make_context(workspace=tmp_path)
+
+        # Should not raise
+        await hook.execute(ctx)
+
     @pytest.mark.asyncio
     async def test_execute_handles_builder_exception(self, tmp_path: Path) -> None:
         """execute catches ManifestBuilder exceptions without crashing."""
@@ -150,10 +160,10 @@ class TestManifestBuildHookExecute:
         ctx = _make_context(workspace=tmp_path)
 
         with patch(
-            "pipeline.application.manifest_builder.ManifestBuilder",
+            "pipeline.application.cli.hooks.manifest_hook.ManifestBuilder",
             side_effect=RuntimeError("builder init failed"),
         ), patch(
-            "pipeline.application.broll_placer.BrollPlacer",
+            "pipeline.application.cli.hooks.manifest_hook.BrollPlacer",
         ):
             # Should not raise
             await hook.execute(ctx)
@@ -172,10 +182,10 @@ class TestManifestBuildHookExecute:
         fake_builder.write_manifest = AsyncMock(return_value=tmp_path / "cutaway-manifest.json")
 
         with patch(
-            "pipeline.application.manifest_builder.ManifestBuilder",
+            "pipeline.application.cli.hooks.manifest_hook.ManifestBuilder",
             return_value=fake_builder,
         ), patch(
-            "pipeline.application.broll_placer.BrollPlacer",
+            "pipeline.application.cli.hooks.manifest_hook.BrollPlacer",
         ):
             await hook.execute(ctx)
 
@@ -204,10 +214,10 @@ class TestManifestBuildHookExecute:
         fake_builder.write_manifest = AsyncMock(return_value=tmp_path / "cutaway-manifest.json")
 
         with patch(
-            "pipeline.application.manifest_builder.ManifestBuilder",
+            "pipeline.application.cli.hooks.manifest_hook.ManifestBuilder",
             return_value=fake_builder,
         ), patch(
-            "pipeline.application.broll_placer.BrollPlacer",
+            "pipeline.application.cli.hooks.manifest_hook.BrollPlacer",
         ):
             await hook.execute(ctx)
 
@@ -226,6 +236,11 @@ class TestReadUserInstructedClips:
         """No router-output.json → empty tuple."""
         assert _read_user_instructed_clips(tmp_path, 60.0) == ()
 
+    def test_invalid_utf8_router_output_returns_empty(self, tmp_path: Path) -> None:
+        """Undecodable router-output.json → empty tuple."""
+        (tmp_path / "router-output.json").write_bytes(b'{"documentary_clips": "\xff"}')
+        assert _read_user_instructed_clips(tmp_path, 60.0) == ()
+
     def test_no_documentary_clips_field(self, tmp_path: Path) -> None:
         """router-output.json without documentary_clips → empty tuple."""
         (tmp_path / "router-output.json").write_text(json.dumps({"url": "test"}))
@@ -273,6 +288,28 @@ class TestReadUserInstructedClips:
         result = _read_user_instructed_clips(tmp_path, 100.0)
         assert result[0].insertion_point_s == pytest.approx(90.0)
 
+    def test_placement_hint_is_case_and_whitespace_insensitive(self, tmp_path: Path) -> None:
+        """Hints are stripped and case-folded before lookup."""
+        (tmp_path / "clip.mp4").write_bytes(b"fake")
+        (tmp_path / "router-output.json").write_text(
+            json.dumps({"documentary_clips": [{"path_or_query": "clip.mp4", "placement_hint": "  OUTRO "}]})
+        )
+
+        result = _read_user_instructed_clips(tmp_path, 100.0)
+        assert result[0].insertion_point_s == pytest.approx(90.0)
+        assert result[0].narrative_anchor == "outro"
+
+    def test_non_string_placement_hint_treated_as_missing(self, tmp_path: Path) -> None:
+        """A non-string hint falls back to the midpoint and the default anchor."""
+        (tmp_path / "clip.mp4").write_bytes(b"fake")
+        (tmp_path / "router-output.json").write_text(
+            json.dumps({"documentary_clips": [{"path_or_query": "clip.mp4", "placement_hint": None}]})
+        )
+
+        result = _read_user_instructed_clips(tmp_path, 60.0)
+        assert result[0].insertion_point_s == pytest.approx(30.0)
+        assert result[0].narrative_anchor == "user-instructed"
+
     def test_unknown_placement_defaults_to_midpoint(self, tmp_path: Path) -> None:
         """Unknown placement hint defaults to 50%."""
         clip_file = tmp_path / "clip.mp4"
@@ -98,11 +98,11 @@ class TestVeo3AwaitHookExecute:
 
         fake_summary = {"completed": 2, "failed": 0, "total": 2}
         with patch(
-            "pipeline.application.veo3_await_gate.run_veo3_await_gate",
+            "pipeline.application.cli.hooks.veo3_await_hook.run_veo3_await_gate",
             new_callable=AsyncMock,
             return_value=fake_summary,
         ), patch(
-            "pipeline.application.veo3_orchestrator.Veo3Orchestrator",
+            "pipeline.application.cli.hooks.veo3_await_hook.Veo3Orchestrator",
         ):
             await hook.execute(ctx)
 
@@ -115,11 +115,11 @@ class TestVeo3AwaitHookExecute:
 
         skip_summary = {"skipped": True, "reason": "no_veo3_folder"}
         with patch(
-            "pipeline.application.veo3_await_gate.run_veo3_await_gate",
+            "pipeline.application.cli.hooks.veo3_await_hook.run_veo3_await_gate",
             new_callable=AsyncMock,
             return_value=skip_summary,
         ), patch(
-            "pipeline.application.veo3_orchestrator.Veo3Orchestrator",
+            "pipeline.application.cli.hooks.veo3_await_hook.Veo3Orchestrator",
         ):
             await hook.execute(ctx)
 
@@ -131,11 +131,11 @@ class TestVeo3AwaitHookExecute:
         ctx = _make_context(workspace=tmp_path)
 
         with patch(
-            "pipeline.application.veo3_await_gate.run_veo3_await_gate",
+            "pipeline.application.cli.hooks.veo3_await_hook.run_veo3_await_gate",
             new_callable=AsyncMock,
             side_effect=TimeoutError("gate timed out"),
         ), patch(
-            "pipeline.application.veo3_orchestrator.Veo3Orchestrator",
+            "pipeline.application.cli.hooks.veo3_await_hook.Veo3Orchestrator",
         ):
             # Should not raise
             await hook.execute(ctx)
@@ -159,11 +159,11 @@ class TestVeo3AwaitHookExecute:
 
         fake_summary = {"completed": 0, "failed": 1, "total": 1}
         with patch(
-            "pipeline.application.veo3_await_gate.run_veo3_await_gate",
+            "pipeline.application.cli.hooks.veo3_await_hook.run_veo3_await_gate",
             new_callable=AsyncMock,
             return_value=fake_summary,
         ), patch(
-            "pipeline.application.veo3_orchestrator.Veo3Orchestrator",
+            "pipeline.application.cli.hooks.veo3_await_hook.Veo3Orchestrator",
         ):
             await hook.execute(ctx)
 
@@ -179,11 +179,11 @@ class TestVeo3AwaitHookExecute:
 
         fake_summary = {"completed": 2, "failed": 1, "total": 3}
         with patch(
-            "pipeline.application.veo3_await_gate.run_veo3_await_gate",
+            "pipeline.application.cli.hooks.veo3_await_hook.run_veo3_await_gate",
             new_callable=AsyncMock,
             return_value=fake_summary,
         ), patch(
-            "pipeline.application.veo3_orchestrator.Veo3Orchestrator",
+            "pipeline.application.cli.hooks.veo3_await_hook.Veo3Orchestrator",
         ):
             await hook.execute(ctx)
 
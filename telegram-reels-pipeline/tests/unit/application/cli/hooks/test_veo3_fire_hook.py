@@ -87,7 +87,7 @@ class TestVeo3FireHookExecute:
         fake_orch.start_generation = AsyncMock(return_value=None)
 
         with patch(
-            "pipeline.application.veo3_orchestrator.Veo3Orchestrator",
+            "pipeline.application.cli.hooks.veo3_fire_hook.Veo3Orchestrator",
             return_value=fake_orch,
         ):
             await hook.execute(ctx)
@@ -115,7 +115,7 @@ class TestVeo3FireHookExecute:
         ctx = _make_context(workspace=tmp_path)
 
         with patch(
-            "pipeline.application.veo3_orchestrator.Veo3Orchestrator",
+            "pipeline.application.cli.hooks.veo3_fire_hook.Veo3Orchestrator",
             side_effect=RuntimeError("orchestrator init failed"),
         ):
             # Should not raise
@@ -0,0 +1,79 @@
+"""Tests for atomic_write_json — single-pass atomic JSON artifact writes."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pipeline.application.cli.atomic_io import append_json_lines, atomic_write_json
+
+
+class TestAtomicWriteJson:
+    def test_writes_indented_json(self, tmp_path: Path) -> None:
+        target = tmp_path / "out.json"
+        atomic_write_json(target, {"a": [1, 2]})
+        assert target.read_text(encoding="utf-8") == json.dumps({"a": [1, 2]}, indent=2)
+
+    def test_replaces_existing_file(self, tmp_path: Path) -> None:
+        target = tmp_path / "out.json"
+        target.write_text("stale")
+        atomic_write_json(target, [])
+        assert json.loads(target.read_text()) == []
+
+    def test_fsyncs_file_before_replace_and_directory_after(self, tmp_path: Path) -> None:
+        calls: list[str] = []
+        with (
+            patch("pipeline.application.cli.atomic_io.os.fsync", side_effect=lambda fd: calls.append("fsync")),
+            patch(
+                "pipeline.application.cli.atomic_io.os.replace",
+                side_effect=lambda src, dst: calls.append("replace"),
+            ),
+        ):
+            atomic_write_json(tmp_path / "out.json", {})
+        assert calls == ["fsync", "replace", "fsync"]
+
+    def test_non_durable_skips_fsync(self, tmp_path: Path) -> None:
+        target = tmp_path / "out.json"
+        with patch("pipeline.application.cli.atomic_io.os.fsync") as fsync:
+            atomic_write_json(target, {"k": "v"}, durable=False)
+        fsync.assert_not_called()
+        assert json.loads(target.read_text()) == {"k": "v"}
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_write_failure_cleans_temp(self, tmp_path: Path) -> None:
+        with (
+            patch("pipeline.application.cli.atomic_io.os.write", side_effect=OSError("disk full")),
+            pytest.raises(OSError, match="disk full"),
+        ):
+            atomic_write_json(tmp_path / "out.json", {"k": "v"})
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestAppendJsonLines:
+    def test_appends_one_line_per_object(self, tmp_path: Path) -> None:
+        target = tmp_path / "log.jsonl"
+        append_json_lines(target, [{"a": 1}])
+        append_json_lines(target, [{"b": 2}, {"c": 3}])
+        assert [json.loads(line) for line in target.read_text().splitlines()] == [{"a": 1}, {"b": 2}, {"c": 3}]
+
+    def test_single_write_per_call(self, tmp_path: Path) -> None:
+        with patch("pipeline.application.cli.atomic_io.os.write", wraps=os.write) as write:
+            append_json_lines(tmp_path / "log.jsonl", [{"a": 1}, {"b": 2}])
+        assert write.call_count == 1
+
+    def test_fsyncs_directory_only_on_create(self, tmp_path: Path) -> None:
+        target = tmp_path / "log.jsonl"
+        with patch("pipeline.application.cli.atomic_io.os.fsync") as fsync:
+            append_json_lines(target, [{}])
+            assert fsync.call_count == 2
+            append_json_lines(target, [{}])
+            assert fsync.call_count == 3
+
+    def test_non_durable_skips_fsync(self, tmp_path: Path) -> None:
+        with patch("pipeline.application.cli.atomic_io.os.fsync") as fsync:
+            append_json_lines(tmp_path / "log.jsonl", [{}], durable=False)
+        fsync.assert_not_called()
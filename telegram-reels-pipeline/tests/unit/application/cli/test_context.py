@@ -177,3 +177,11 @@ class TestPipelineContextMutability:
         ctx = _make_context()
         ctx.state.instructions = "value"
         assert ctx.state.instructions == "value"
+
+    def test_undeclared_attributes_rejected(self) -> None:
+        """Both dataclasses are slotted, so typos in field names fail loudly."""
+        ctx = _make_context()
+        with pytest.raises(AttributeError):
+            ctx.workspce = Path()  # type: ignore[attr-defined]
+        with pytest.raises(AttributeError):
+            ctx.state.start_stag = 2  # type: ignore[attr-defined]
@@ -25,6 +25,11 @@ def _make_record(
     )
 
 
+def _read_history(workspace: Path) -> list[dict[str, object]]:
+    lines = (workspace / "command-history.jsonl").read_text().splitlines()
+    return [json.loads(line) for line in lines]
+
+
 # --- Tests ---
 
 
@@ -52,19 +57,19 @@ class TestCommandHistoryAppend:
 
 
 class TestCommandHistoryPersist:
-    """Verify atomic write persistence."""
+    """Verify append-only JSON lines persistence."""
 
-    def test_persist_writes_json(self, tmp_path: Path) -> None:
-        """Persist creates a valid JSON file."""
+    def test_persist_writes_json_lines(self, tmp_path: Path) -> None:
+        """Persist writes one JSON object per record."""
         history = CommandHistory()
         history.append(_make_record(name="cmd-1"))
         history.append(_make_record(name="cmd-2", status="failed", error="boom"))
 
         history.persist(tmp_path)
 
-        target = tmp_path / "command-history.json"
+        target = tmp_path / "command-history.jsonl"
         assert target.exists()
-        data = json.loads(target.read_text())
+        data = _read_history(tmp_path)
         assert len(data) == 2
         assert data[0]["name"] == "cmd-1"
         assert data[0]["status"] == "success"
@@ -73,17 +78,19 @@ class TestCommandHistoryPersist:
         assert data[1]["status"] == "failed"
         assert data[1]["error"] == "boom"
 
-    def test_persist_overwrites_previous(self, tmp_path: Path) -> None:
-        """Each persist overwrites the previous file content."""
+    def test_persist_appends_only_new_records(self, tmp_path: Path) -> None:
+        """Later persists append new records without rewriting earlier lines."""
         history = CommandHistory()
         history.append(_make_record(name="v1"))
         history.persist(tmp_path)
+        target = tmp_path / "command-history.jsonl"
+        first_line = target.read_text()
 
         history.append(_make_record(name="v2"))
         history.persist(tmp_path)
 
-        data = json.loads((tmp_path / "command-history.json").read_text())
-        assert len(data) == 2
+        assert target.read_text().startswith(first_line)
+        assert [r["name"] for r in _read_history(tmp_path)] == ["v1", "v2"]
 
     def test_persist_no_temp_files_left(self, tmp_path: Path) -> None:
         """No .tmp files left behind after persist."""
@@ -107,13 +114,54 @@ class TestCommandHistoryPersist:
         missing = tmp_path / "nonexistent"
         history.persist(missing)  # Should log warning, not crash
 
+    def test_persist_skips_when_workspace_is_a_file(self, tmp_path: Path) -> None:
+        """Persist into a path that is not a directory does not raise."""
+        history = CommandHistory()
+        history.append(_make_record())
+        not_a_dir = tmp_path / "file"
+        not_a_dir.write_text("")
+        history.persist(not_a_dir)  # Should log warning, not crash
+        assert list(tmp_path.iterdir()) == [not_a_dir]
+
     def test_persist_empty_history(self, tmp_path: Path) -> None:
-        """Persist with no records writes empty JSON array."""
+        """Persist with no records creates an empty log."""
+        history = CommandHistory()
+        history.persist(tmp_path)
+
+        assert (tmp_path / "command-history.jsonl").read_text() == ""
+
+    def test_persist_skips_write_when_unchanged(self, tmp_path: Path) -> None:
+        """A second persist with no new records leaves the file untouched."""
+        history = CommandHistory()
+        history.append(_make_record(name="cmd-1"))
+        history.persist(tmp_path)
+        target = tmp_path / "command-history.jsonl"
+        before = target.read_text()
+
+        history.persist(tmp_path)
+        assert target.read_text() == before
+
+    def test_persist_keeps_lines_from_earlier_runs(self, tmp_path: Path) -> None:
+        """A resumed workspace keeps the previous run's history."""
+        earlier = CommandHistory()
+        earlier.append(_make_record(name="run-1"))
+        earlier.persist(tmp_path)
+
+        resumed = CommandHistory()
+        resumed.append(_make_record(name="run-2"))
+        resumed.persist(tmp_path)
+
+        assert [r["name"] for r in _read_history(tmp_path)] == ["run-1", "run-2"]
+
+    def test_persist_after_skipped_workspace_still_writes(self, tmp_path: Path) -> None:
+        """Records held back while no workspace was set are written once one is."""
         history = CommandHistory()
+        history.append(_make_record(name="validate-args"))
+        history.persist(None)
+        history.append(_make_record(name="setup-workspace"))
         history.persist(tmp_path)
 
-        data = json.loads((tmp_path / "command-history.json").read_text())
-        assert data == []
+        assert [r["name"] for r in _read_history(tmp_path)] == ["validate-args", "setup-workspace"]
 
 
 class TestCommandHistoryQuery:
@@ -126,6 +174,18 @@ class TestCommandHistoryQuery:
         assert isinstance(result, tuple)
         assert result == ()
 
+    def test_all_reuses_tuple_until_append(self) -> None:
+        """all() returns the same tuple until a new record is appended."""
+        history = CommandHistory()
+        history.append(_make_record(name="a"))
+        first = history.all()
+        assert history.all() is first
+        assert history.last(5) is first
+
+        history.append(_make_record(name="b"))
+        assert [r.name for r in history.all()] == ["a", "b"]
+        assert first == (history.all()[0],)
+
     def test_by_status_filters(self) -> None:
         """by_status() returns only matching records."""
         history = CommandHistory()
@@ -136,6 +196,7 @@ class TestCommandHistoryQuery:
         successes = history.by_status("success")
         assert len(successes) == 2
         assert all(r.status == "success" for r in successes)
+        assert [r.name for r in successes] == ["ok-1", "ok-2"]
 
         failures = history.by_status("failed")
         assert len(failures) == 1
@@ -96,7 +96,7 @@ class TestPipelineInvokerHappyPath:
 
         await invoker.execute(_StubCommand(), ctx)
 
-        history_file = tmp_path / "command-history.json"
+        history_file = tmp_path / "command-history.jsonl"
         assert history_file.exists()
 
 
@@ -141,7 +141,7 @@ class TestPipelineInvokerExceptionHandling:
         with pytest.raises(OSError):
             await invoker.execute(cmd, ctx)
 
-        history_file = tmp_path / "command-history.json"
+        history_file = tmp_path / "command-history.jsonl"
         assert history_file.exists()
 
     @pytest.mark.asyncio
@@ -0,0 +1,32 @@
+"""Tests for workspace_file_names — single-pass workspace file snapshots."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from pipeline.application.cli.workspace_files import probe_workspace, workspace_file_names
+
+
+class TestWorkspaceFileNames:
+    def test_lists_top_level_files_only(self, tmp_path: Path) -> None:
+        (tmp_path / "router-output.json").write_text("{}")
+        (tmp_path / "assets").mkdir()
+        (tmp_path / "assets" / "nested.json").write_text("{}")
+        assert workspace_file_names(tmp_path) == frozenset({"router-output.json"})
+
+    def test_missing_workspace_is_empty(self, tmp_path: Path) -> None:
+        assert workspace_file_names(tmp_path / "missing") == frozenset()
+
+
+class TestProbeWorkspace:
+    def test_directory_returns_file_names(self, tmp_path: Path) -> None:
+        (tmp_path / "content.json").write_text("{}")
+        assert probe_workspace(tmp_path) == frozenset({"content.json"})
+
+    def test_missing_path_returns_none(self, tmp_path: Path) -> None:
+        assert probe_workspace(tmp_path / "missing") is None
+
+    def test_regular_file_returns_none(self, tmp_path: Path) -> None:
+        f = tmp_path / "file.txt"
+        f.write_text("x")
+        assert probe_workspace(f) is None
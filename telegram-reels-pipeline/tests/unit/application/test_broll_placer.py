@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
-from pipeline.application.broll_placer import BrollPlacer
+import pytest
+
+from pipeline.application.broll_placer import BrollPlacer, _artifact_paths, _load_broll_inputs
 
 
 def _write_jobs(workspace: Path, jobs: list[dict[str, object]]) -> None:
@@ -55,6 +58,15 @@ class TestBrollPlacerNoVeo3:
         result = placer.resolve_placements(tmp_path, _make_segments(), 60.0)
         assert result == ()
 
+    def test_no_veo3_folder_skips_artifact_reads(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        _write_assets(tmp_path, [{"variant": "intro", "narrative_anchor": "hook"}])
+
+        def _fail(*_args: object, **_kwargs: object) -> None:
+            raise AssertionError("artifacts inspected without a veo3 directory")
+
+        monkeypatch.setattr("pipeline.application.broll_placer._load_broll_inputs", _fail)
+        assert BrollPlacer().resolve_placements(tmp_path, _make_segments(), 60.0) == ()
+
 
 class TestBrollPlacerNoCompleted:
     """When veo3/jobs.json exists but no completed clips, returns empty."""
@@ -177,6 +189,34 @@ class TestBrollPlacerTransition:
         # insertion = 20.0 - 3.0 = 17.0
         assert result[0].insertion_point_s == 17.0
 
+    @pytest.mark.parametrize(
+        "boundaries",
+        [[5.0], [50.0], [10.0, 20.0, 40.0], [29.0, 31.0], [30.0, 30.0, 45.0], [1.0, 2.0, 3.0], [55.0, 58.0]],
+    )
+    def test_bisect_matches_linear_scan(self, boundaries: list[float]) -> None:
+        expected = max(0.0, min(boundaries, key=lambda b: abs(b - 30.0)) - 3.0)
+        assert BrollPlacer._resolve_transition_point(boundaries, 60.0, 6.0) == expected
+
+
+class TestBrollPlacerEstimateClipDuration:
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            (8, 8.0),
+            (7.5, 7.5),
+            ("4.5", 4.5),
+            (None, 6.0),
+            (0, 6.0),
+            (-3.0, 6.0),
+            ("-1", 6.0),
+            ("abc", 6.0),
+            (True, 6.0),
+            ([5], 6.0),
+        ],
+    )
+    def test_estimate(self, raw: object, expected: float) -> None:
+        assert BrollPlacer._estimate_clip_duration({"duration_s": raw}) == expected
+
 
 class TestBrollPlacerMultipleClips:
     """Multiple clips are sorted by insertion_point_s."""
@@ -228,3 +268,151 @@ class TestBrollPlacerMatchAnchor:
         segments = [{"transcript_text": "cat dog bird"}]
         _, score = BrollPlacer._match_anchor("quantum physics thermodynamics", segments)
         assert score == 0.0
+
+
+class TestBrollPlacerMatchAnchorTokens:
+    """Pre-tokenized matching agrees with the per-call tokenizing path."""
+
+    def test_matches_untokenized_scoring(self) -> None:
+        segments = _make_segments()
+        seg_tokens = BrollPlacer._tokenize_segments(segments)
+        for anchor in ("neural networks layers", "kubernetes scaling", "training data", "unrelated words"):
+            assert BrollPlacer._match_anchor_tokens(anchor, seg_tokens) == BrollPlacer._match_anchor(anchor, segments)
+
+    def test_empty_segment_text_skipped(self) -> None:
+        seg_tokens = BrollPlacer._tokenize_segments([{"transcript_text": ""}, {"transcript_text": "alpha beta"}])
+        assert BrollPlacer._match_anchor_tokens("alpha", seg_tokens) == (1, 0.5)
+
+    def test_size_bound_pruning_keeps_brute_force_result(self) -> None:
+        segments = [
+            {"transcript_text": "alpha beta gamma delta"},
+            {"transcript_text": "alpha"},
+            {"transcript_text": "alpha beta"},
+            {"transcript_text": "alpha beta gamma delta epsilon zeta eta theta"},
+        ]
+        seg_tokens = BrollPlacer._tokenize_segments(segments)
+        for anchor in ("alpha beta", "alpha", "alpha beta gamma delta", "theta eta zeta"):
+            words = set(anchor.split())
+            scores = [len(words & seg) / len(words | seg) for seg in seg_tokens]
+            best = max(range(len(scores)), key=lambda i: scores[i])
+            assert BrollPlacer._match_anchor_tokens(anchor, seg_tokens) == (best, scores[best])
+
+
+class TestBrollPlacerTokenIndex:
+    """Inverted-index matching agrees with the full scan."""
+
+    def _many_segments(self) -> list[dict[str, object]]:
+        words = ("alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta")
+        return [
+            {
+                "start_s": i * 5.0,
+                "end_s": (i + 1) * 5.0,
+                "transcript_text": f"{words[i % 8]} {words[(i * 3) % 8]} seg{i}",
+            }
+            for i in range(24)
+        ]
+
+    def test_index_matches_full_scan(self) -> None:
+        seg_tokens = BrollPlacer._tokenize_segments(self._many_segments())
+        index = BrollPlacer._build_token_index(seg_tokens)
+        for anchor in ("alpha delta", "seg7 theta", "gamma", "nothing shared", ""):
+            assert BrollPlacer._match_anchor_tokens(anchor, seg_tokens, index) == (
+                BrollPlacer._match_anchor_tokens(anchor, seg_tokens)
+            )
+
+    def test_resolve_placements_with_many_segments(self, tmp_path: Path) -> None:
+        clip = tmp_path / "broll.mp4"
+        clip.write_bytes(b"video")
+        _write_jobs(tmp_path, [_make_completed_job("broll", str(clip))])
+        _write_assets(tmp_path, [{"variant": "broll", "narrative_anchor": "seg10 gamma"}])
+
+        result = BrollPlacer().resolve_placements(tmp_path, self._many_segments(), 120.0)
+
+        assert len(result) == 1
+        assert result[0].insertion_point_s == 49.5
+
+
+class TestBrollPlacerInvalidArtifacts:
+    """Undecodable artifacts are treated like missing ones."""
+
+    def test_non_utf8_jobs_file_returns_empty(self, tmp_path: Path) -> None:
+        veo3_dir = tmp_path / "veo3"
+        veo3_dir.mkdir()
+        (veo3_dir / "jobs.json").write_bytes(b'{"jobs": "\xff\xfe\xfa"}')
+        placer = BrollPlacer()
+        assert placer.resolve_placements(tmp_path, _make_segments(), 60.0) == ()
+
+
+class TestBrollPlacerArtifactCache:
+    """Parsed workspace artifacts are reused until the file changes."""
+
+    def test_unchanged_artifacts_not_reread(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        clip = tmp_path / "intro.mp4"
+        clip.write_bytes(b"video")
+        _write_jobs(tmp_path, [_make_completed_job("intro", str(clip))])
+        _write_assets(tmp_path, [{"variant": "intro", "narrative_anchor": "hook opening"}])
+        placer = BrollPlacer()
+        first = placer.resolve_placements(tmp_path, _make_segments(), 60.0)
+
+        def _fail(*_args: object, **_kwargs: object) -> bytes:
+            raise AssertionError("artifact re-read despite unchanged file")
+
+        monkeypatch.setattr(Path, "read_text", _fail)
+        monkeypatch.setattr(Path, "read_bytes", _fail)
+        assert placer.resolve_placements(tmp_path, _make_segments(), 60.0) == first
+
+    def test_modified_artifact_reread(self, tmp_path: Path) -> None:
+        clip = tmp_path / "intro.mp4"
+        clip.write_bytes(b"video")
+        _write_jobs(tmp_path, [_make_completed_job("intro", str(clip))])
+        placer = BrollPlacer()
+        assert len(placer.resolve_placements(tmp_path, _make_segments(), 60.0)) == 1
+
+        jobs_path = tmp_path / "veo3" / "jobs.json"
+        _write_jobs(tmp_path, [])
+        stat = jobs_path.stat()
+        os.utime(jobs_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert placer.resolve_placements(tmp_path, _make_segments(), 60.0) == ()
+
+    def test_modified_assets_refresh_anchor(self, tmp_path: Path) -> None:
+        clip = tmp_path / "intro.mp4"
+        clip.write_bytes(b"video")
+        _write_jobs(tmp_path, [_make_completed_job("intro", str(clip))])
+        _write_assets(tmp_path, [{"variant": "intro", "narrative_anchor": "old anchor"}])
+        placer = BrollPlacer()
+        assert placer.resolve_placements(tmp_path, _make_segments(), 60.0)[0].narrative_anchor == "old anchor"
+
+        assets_path = tmp_path / "publishing-assets.json"
+        _write_assets(tmp_path, [{"variant": "intro", "narrative_anchor": "new anchor text"}])
+        stat = assets_path.stat()
+        os.utime(assets_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert placer.resolve_placements(tmp_path, _make_segments(), 60.0)[0].narrative_anchor == "new anchor text"
+
+    def test_only_completed_jobs_are_cached(self, tmp_path: Path) -> None:
+        clip = tmp_path / "intro.mp4"
+        clip.write_bytes(b"video")
+        _write_jobs(
+            tmp_path,
+            [
+                _make_completed_job("intro", str(clip)),
+                {"idempotent_key": "k-pending", "variant": "outro", "prompt": "p", "status": "pending"},
+                {"idempotent_key": "k-failed", "variant": "broll", "prompt": "p", "status": "failed"},
+            ],
+        )
+
+        clips, _, _ = _load_broll_inputs(tmp_path)
+
+        assert [variant for variant, *_ in clips] == ["intro"]
+
+
+class TestBrollPlacerArtifactPaths:
+    def test_paths_composed_once_per_workspace(self, tmp_path: Path) -> None:
+        first = _artifact_paths(tmp_path)
+        assert first == (
+            tmp_path / "veo3" / "jobs.json",
+            tmp_path / "publishing-assets.json",
+            tmp_path / "encoding-plan.json",
+        )
+        assert _artifact_paths(Path(str(tmp_path))) is first
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 from unittest.mock import AsyncMock, patch
@@ -189,11 +190,13 @@ class TestResolveAll:
 
         output = _make_search_output()
         proc = _make_proc_mock(stdout=output)
-        with patch("asyncio.create_subprocess_exec", return_value=proc):
-            await resolver.resolve_all(suggestions, tmp_path)
+        with patch("asyncio.create_subprocess_exec", return_value=proc) as mock_exec:
+            result = await resolver.resolve_all(suggestions, tmp_path)
 
-        # Only MAX_SEARCHES should be processed
-        assert len(downloader.download_calls) == _MAX_SEARCHES
+        # Only MAX_SEARCHES should be processed; every search hits the same URL, downloaded once
+        assert mock_exec.call_count == _MAX_SEARCHES
+        assert len(result) == _MAX_SEARCHES
+        assert len(downloader.download_calls) == 1
 
     async def test_rate_limiting_delay_between_searches(self, tmp_path: Path) -> None:
         downloader = FakeDownloader()
@@ -239,6 +242,57 @@ class TestResolveAll:
 
         assert len(sleep_calls) == 0
 
+    async def test_slow_search_does_not_delay_next_launch(self, tmp_path: Path) -> None:
+        downloader = FakeDownloader()
+        resolver = ExternalClipResolver(downloader)  # type: ignore[arg-type]
+        release_first = asyncio.Event()
+        started: list[str] = []
+
+        async def search(query: str) -> dict[str, object] | None:
+            started.append(query)
+            if query == "slow":
+                await release_first.wait()
+            else:
+                release_first.set()
+            return {"url": f"https://www.youtube.com/watch?v={query}", "duration": 20}
+
+        async def fake_sleep(seconds: float) -> None:
+            return None
+
+        suggestions = [_make_suggestion(query="slow"), _make_suggestion(query="fast")]
+        with (
+            patch.object(ExternalClipResolver, "_search_youtube", side_effect=search),
+            patch("pipeline.application.external_clip_resolver.asyncio.sleep", side_effect=fake_sleep),
+        ):
+            result = await asyncio.wait_for(resolver.resolve_all(suggestions, tmp_path), timeout=5)
+
+        # The second search started while the first was still in flight; order is preserved
+        assert started == ["slow", "fast"]
+        assert [r["search_query"] for r in result] == ["slow", "fast"]
+
+    async def test_searches_hitting_same_url_share_one_download(self, tmp_path: Path) -> None:
+        downloader = FakeDownloader()
+        resolver = ExternalClipResolver(downloader)  # type: ignore[arg-type]
+        url = "https://www.youtube.com/watch?v=same"
+
+        async def search(query: str) -> dict[str, object] | None:
+            await asyncio.sleep(0)
+            return {"url": url, "duration": 20}
+
+        async def fake_sleep(seconds: float) -> None:
+            return None
+
+        suggestions = [_make_suggestion(query="first"), _make_suggestion(query="second")]
+        with (
+            patch.object(ExternalClipResolver, "_search_youtube", side_effect=search),
+            patch("pipeline.application.external_clip_resolver.asyncio.sleep", side_effect=fake_sleep),
+        ):
+            result = await resolver.resolve_all(suggestions, tmp_path)
+
+        assert downloader.download_calls == [(url, tmp_path)]
+        assert [r["search_query"] for r in result] == ["first", "second"]
+        assert result[0]["local_path"] == result[1]["local_path"]
+
     async def test_skips_empty_search_query(self, tmp_path: Path) -> None:
         downloader = FakeDownloader()
         resolver = ExternalClipResolver(downloader)  # type: ignore[arg-type]
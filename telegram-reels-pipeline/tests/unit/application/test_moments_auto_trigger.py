@@ -56,3 +56,12 @@ class TestExplicitOverride:
 
     def test_explicit_two(self) -> None:
         assert compute_moments_requested(200, 2) == 2
+
+
+class TestLookupTable:
+    """The precomputed table must agree with the formula for every accepted duration."""
+
+    def test_table_matches_formula(self) -> None:
+        for duration in range(30, 301):
+            expected = 1 if duration <= 120 else min(5, max(2, int(duration / 60 + 0.5)))
+            assert compute_moments_requested(duration, None) == expected
@@ -176,6 +176,12 @@ class TestBuildRequest:
         )
         assert len(request.elicitation_context) == 0
 
+    def test_empty_elicitation_shares_one_view(self) -> None:
+        runner, _, _, _ = _make_runner(workflows_dir=Path("/wf"))
+        first = runner._build_request(PipelineStage.RESEARCH, Path("/workspace"), (), _make_item())
+        second = runner._build_request(PipelineStage.TRANSCRIPT, Path("/workspace"), (), _make_item())
+        assert first.elicitation_context is second.elicitation_context
+
     def test_prior_artifacts_passed_through(self) -> None:
         runner, _, _, _ = _make_runner(workflows_dir=Path("/wf"))
         artifacts = (Path("/tmp/a.md"), Path("/tmp/b.md"))
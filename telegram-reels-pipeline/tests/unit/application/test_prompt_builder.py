@@ -1,5 +1,6 @@
 """Tests for PromptBuilder — prompt construction from AgentRequest."""
 
+import os
 from pathlib import Path
 from types import MappingProxyType
 
@@ -111,3 +112,29 @@ class TestBuildAgentPrompt:
         assert "## Execution Environment" in prompt
         assert "tool access" in prompt
         assert "Write tool" in prompt
+
+
+class TestDefinitionTextCache:
+    def test_reuses_cached_text_while_mtime_unchanged(
+        self, step_file: Path, agent_def: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        request = AgentRequest(stage=PipelineStage.ROUTER, step_file=step_file, agent_definition=agent_def)
+        build_agent_prompt(request)
+
+        def _fail(*_args: object, **_kwargs: object) -> str:
+            raise AssertionError("definition file re-read despite unchanged mtime")
+
+        monkeypatch.setattr(Path, "read_text", _fail)
+        prompt = build_agent_prompt(request)
+        assert "Route the YouTube URL" in prompt
+
+    def test_rereads_when_file_modified(self, step_file: Path, agent_def: Path) -> None:
+        request = AgentRequest(stage=PipelineStage.ROUTER, step_file=step_file, agent_definition=agent_def)
+        build_agent_prompt(request)
+
+        step_file.write_text("Updated stage requirements.")
+        stat = step_file.stat()
+        os.utime(step_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        prompt = build_agent_prompt(request)
+        assert "Updated stage requirements." in prompt
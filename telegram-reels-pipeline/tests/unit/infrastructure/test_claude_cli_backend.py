@@ -296,6 +296,36 @@ class TestCliBackendDispatch:
             await backend.dispatch("qa_evaluator", "prompt")
 
 
+class TestCliBackendConcurrencyLimit:
+    def test_rejects_non_positive_limit(self, work_dir: Path) -> None:
+        with pytest.raises(ValueError, match="max_concurrent_subprocesses"):
+            CliBackend(work_dir=work_dir, max_concurrent_subprocesses=0)
+
+    @patch("pipeline.infrastructure.adapters.claude_cli_backend.asyncio.create_subprocess_exec")
+    async def test_limits_concurrent_subprocesses(self, mock_exec: AsyncMock, work_dir: Path) -> None:
+        work_dir.mkdir(parents=True)
+        backend = CliBackend(work_dir=work_dir, max_concurrent_subprocesses=2)
+        running = 0
+        peak = 0
+
+        async def _communicate(**_kwargs: object) -> tuple[bytes, bytes]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return (b"{}", b"")
+
+        proc = _make_mock_proc()
+        proc.communicate = AsyncMock(side_effect=_communicate)
+        mock_exec.return_value = proc
+
+        await asyncio.gather(*(backend.dispatch("qa_evaluator", "prompt") for _ in range(5)))
+
+        assert mock_exec.call_count == 5
+        assert peak == 2
+
+
 class TestCliBackendProtocol:
     def test_satisfies_agent_execution_port(self, backend: CliBackend) -> None:
         assert isinstance(backend, AgentExecutionPort)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 from pathlib import Path
 from types import SimpleNamespace
@@ -51,6 +52,30 @@ class TestTelegramPollerValidUrl:
         assert any("Queued" in c for c in calls)
 
 
+class TestTelegramPollerNewItemEvent:
+    async def test_sets_event_on_enqueue(self, tmp_path: Path) -> None:
+        event = asyncio.Event()
+        mock_bot = MagicMock()
+        mock_bot.get_updates = AsyncMock(return_value=[_make_update(1, 42, "https://youtu.be/dQw4w9WgXcQ")])
+        mock_bot.notify_user = AsyncMock()
+        queue = QueueConsumer(base_dir=tmp_path / "queue")
+        poller = TelegramPoller(bot=mock_bot, queue=queue, authorized_chat_id="42", new_item_event=event)
+
+        await poller.poll_once()
+        assert event.is_set()
+
+    async def test_event_untouched_when_nothing_enqueued(self, tmp_path: Path) -> None:
+        event = asyncio.Event()
+        mock_bot = MagicMock()
+        mock_bot.get_updates = AsyncMock(return_value=[_make_update(1, 42, "not a url")])
+        mock_bot.notify_user = AsyncMock()
+        queue = QueueConsumer(base_dir=tmp_path / "queue")
+        poller = TelegramPoller(bot=mock_bot, queue=queue, authorized_chat_id="42", new_item_event=event)
+
+        await poller.poll_once()
+        assert not event.is_set()
+
+
 class TestTelegramPollerInvalidUrl:
     async def test_rejects_non_youtube_url(self, tmp_path: Path) -> None:
         poller, mock_bot = _make_poller(tmp_path)